@@ -1,19 +1,47 @@
 from .binary_search import binary_search, left_right_binary_search, linear_search
 from .compression.huffman import huffman_compress, huffman_decompress
-from .graph.bellman_ford import bellman_ford_shortest_paths
-from .graph.bfs import breadth_first_search
+from .graph.a_star import a_star_search, euclidean_heuristic
+from .graph.bellman_ford import (
+    bellman_ford_shortest_paths,
+    find_negative_cycle,
+    spfa_shortest_paths,
+)
+from .graph.bfs import (
+    bfs_level_array,
+    bfs_levels,
+    breadth_first_order,
+    breadth_first_search,
+)
 from .graph.connected import connected_components
-from .graph.dfs import depth_first_search, dfs_traversal
-from .graph.dijkstras import dijkstra_search, dijkstra_shortest_paths
+from .graph.dfs import depth_first_order, depth_first_search, dfs_traversal
+from .graph.dijkstras import (
+    batched_dijkstra_shortest_paths,
+    bidirectional_dijkstra_search,
+    dijkstra_search,
+    dijkstra_shortest_path_arrays,
+    dijkstra_shortest_path_tree,
+    dijkstra_shortest_paths,
+    multi_source_shortest_paths,
+)
+from .graph.dinic import dinic_max_flow, dinic_max_flow_network
 from .graph.edmonds_karp import edmonds_karp_max_flow
-from .graph.floyd_warshall import floyd_warshall_shortest_paths
+from .graph.floyd_warshall import floyd_warshall_matrix, floyd_warshall_shortest_paths
 from .graph.ford_fulkerson import bipartite_matching, ford_max_flow
 from .graph.hamiltonian_cycle import hamiltonian_cycle
-from .graph.johnsons import johnsons_shortest_paths
+from .graph.hopcroft_karp import hopcroft_karp_matching
+from .graph.johnsons import johnsons_shortest_path_rows, johnsons_shortest_paths
 from .graph.kargers import kargers_min_cut
 from .graph.kruskals import kruskals_mst
+from .graph.path_table import PathTable
 from .graph.prims import prims_mst
-from .graph.toposort import topological_sort
+from .graph.strongly_connected import condensation, strongly_connected_components
+from .graph.toposort import (
+    Schedule,
+    run_topological,
+    run_topological_async,
+    topological_levels,
+    topological_sort,
+)
 from .optimal_bst import build_optimal_bst
 from .quick_select import quick_select
 from .sort.bubble_sort import bubble_sort
@@ -28,26 +56,45 @@ from .strings.lcs import longest_common_subsequence
 from .strings.sais import build_suffix_array
 
 __all__ = (
+    "PathTable",
+    "Schedule",
+    "a_star_search",
+    "batched_dijkstra_shortest_paths",
     "bellman_ford_shortest_paths",
+    "bfs_level_array",
+    "bfs_levels",
+    "bidirectional_dijkstra_search",
     "binary_search",
     "bipartite_matching",
+    "breadth_first_order",
     "breadth_first_search",
     "bubble_sort",
     "bucket_sort",
     "build_optimal_bst",
     "build_suffix_array",
+    "condensation",
     "connected_components",
+    "depth_first_order",
     "depth_first_search",
     "dfs_traversal",
     "dijkstra_search",
+    "dijkstra_shortest_path_arrays",
+    "dijkstra_shortest_path_tree",
     "dijkstra_shortest_paths",
+    "dinic_max_flow",
+    "dinic_max_flow_network",
     "edmonds_karp_max_flow",
+    "euclidean_heuristic",
+    "find_negative_cycle",
+    "floyd_warshall_matrix",
     "floyd_warshall_shortest_paths",
     "ford_max_flow",
     "hamiltonian_cycle",
+    "hopcroft_karp_matching",
     "huffman_compress",
     "huffman_decompress",
     "insertion_sort",
+    "johnsons_shortest_path_rows",
     "johnsons_shortest_paths",
     "kargers_min_cut",
     "kmp_string_match",
@@ -56,10 +103,16 @@ __all__ = (
     "linear_search",
     "longest_common_subsequence",
     "merge_sort",
+    "multi_source_shortest_paths",
     "prims_mst",
     "quick_select",
     "quick_sort",
     "radix_sort",
+    "run_topological",
+    "run_topological_async",
     "selection_sort",
+    "spfa_shortest_paths",
+    "strongly_connected_components",
+    "topological_levels",
     "topological_sort",
 )
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import heapq
+import math
+from typing import TYPE_CHECKING
+
+from cs.structures import Graph
+from cs.util import Comparable
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping, Sequence
+
+
+def a_star_search[V: Comparable](
+    graph: Graph[V], start: V, end: V, heuristic: Callable[[V, V], float]
+) -> float:
+    """
+    Dijkstra's search towards a single target, where each node v is prioritized by its
+    distance from start plus heuristic(v, end), an estimate of its remaining distance
+    to end. Nodes leading away from end are pushed back in the queue, so far fewer
+    nodes are expanded than by dijkstra_search. With a heuristic that always returns 0,
+    this is exactly Dijkstra's algorithm.
+
+    The result is only guaranteed to be the shortest distance if the heuristic never
+    overestimates the remaining distance, such as the straight-line distance between
+    node coordinates (see euclidean_heuristic).
+
+    Nodes only enter the heap once they are reached, and outdated heap entries are
+    skipped when popped. A node is expanded again if a shorter path to it is found
+    later, which can only happen if the heuristic is admissible but not consistent.
+
+    Returns Graph.INFINITY if end is unreachable.
+
+    Runtime: O((|E| + |V|) log |V|) with a consistent heuristic
+    """
+    graph.verify_nodes_exist(start, end)
+    distances: dict[V, float] = {start: 0}
+    heap: list[tuple[float, float, V]] = [(heuristic(start, end), 0, start)]
+    while heap:
+        _, cost, u = heapq.heappop(heap)
+        if u == end:
+            return cost
+        if cost > distances[u]:
+            continue
+        for v, e in graph[u].items():
+            if e.weight < 0:
+                raise RuntimeError("A* does not work for negative weights.")
+            path_cost = cost + e.weight
+            if path_cost < distances.get(v, Graph.INFINITY):
+                distances[v] = path_cost
+                heapq.heappush(heap, (path_cost + heuristic(v, end), path_cost, v))
+    return Graph.INFINITY
+
+
+def euclidean_heuristic[V: Comparable](
+    positions: Mapping[V, Sequence[float]],
+) -> Callable[[V, V], float]:
+    """
+    Returns a heuristic for a_star_search that measures the straight-line distance
+    between the coordinates of two nodes. It is admissible as long as no edge weighs
+    less than the distance between its endpoints.
+    """
+    return lambda v, end: math.dist(positions[v], positions[end])
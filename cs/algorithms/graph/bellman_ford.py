@@ -1,6 +1,14 @@
+from __future__ import annotations
+
+from collections import deque
+from typing import TYPE_CHECKING
+
 from cs.structures import Graph
 from cs.util import Comparable
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
 
 def bellman_ford_shortest_paths[V: Comparable](
     graph: Graph[V], start: V, *, check_negative_cycles: bool = True
@@ -18,18 +26,23 @@ def bellman_ford_shortest_paths[V: Comparable](
     get all shortest path pairs rather than just one. However, on sparse graphs where
     |E| = Theta(|V|)) the runtime is O(|V|^2), which is much faster.
 
+    Distances are relaxed in place, so a pass can use distances improved earlier in
+    the same pass, and the passes stop as soon as one of them changes nothing.
+
     Runtime: O(|V||E|), or worst case, O(|V|^3).
     """
     distances = dict.fromkeys(graph, Graph.INFINITY)
     distances[start] = 0
 
     for _ in range(1, len(graph)):
-        temp = distances
+        changed = False
         for u in graph:
             for v, e in graph[u].items():
-                temp[v] = min(temp[v], distances[u] + e.weight)
-
-        distances, temp = temp, distances
+                if distances[u] + e.weight < distances[v]:
+                    distances[v] = distances[u] + e.weight
+                    changed = True
+        if not changed:
+            break
 
     if check_negative_cycles:
         for edge in graph.edges:
@@ -37,3 +50,89 @@ def bellman_ford_shortest_paths[V: Comparable](
                 raise AssertionError("Negative weight cycle exists in the graph.")
 
     return distances
+
+
+def spfa_shortest_paths[V: Comparable](graph: Graph[V], start: V) -> dict[V, float]:
+    """
+    The queue-based Bellman-Ford algorithm, also known as the Shortest Path Faster
+    Algorithm (SPFA).
+
+    Instead of relaxing every edge in every pass, only the edges out of nodes whose
+    distance changed are relaxed, using a FIFO queue of those nodes. The search ends
+    as soon as the queue is empty, which on most graphs happens long before |V| - 1
+    passes.
+
+    A negative cycle is detected once some shortest path would need |V| or more edges,
+    and raises an AssertionError like bellman_ford_shortest_paths.
+    See find_negative_cycle to get the cycle itself.
+
+    Runtime: O(|V||E|), but usually close to O(|E|) in practice.
+    """
+    distances, _, cycle = _spfa(graph, (start,))
+    if cycle is not None:
+        raise AssertionError("Negative weight cycle exists in the graph.")
+    return distances
+
+
+def find_negative_cycle[V: Comparable](
+    graph: Graph[V], start: V | None = None
+) -> list[V] | None:
+    """
+    Returns the nodes of a negative weight cycle in the order its edges are followed,
+    or None if there is no such cycle. If start is given, only cycles reachable from
+    start are considered. Otherwise, SPFA starts from every node at once, as if from a
+    new source with an edge of weight 0 to each node.
+
+    Runtime: O(|V||E|)
+    """
+    _, _, cycle = _spfa(graph, graph if start is None else (start,))
+    return cycle
+
+
+def _spfa[V: Comparable](
+    graph: Graph[V], sources: Iterable[V]
+) -> tuple[dict[V, float], dict[V, V], list[V] | None]:
+    """
+    Runs SPFA from every source at once, returning the distances, the shortest path
+    tree, and a negative cycle, if one was found.
+    """
+    distances = dict.fromkeys(graph, Graph.INFINITY)
+    # The number of edges on the path to each node, which is at most |V| - 1 unless
+    # the path loops around a negative cycle.
+    lengths = {}
+    parents: dict[V, V] = {}
+    queue = deque(sources)
+    for s in queue:
+        distances[s] = 0
+        lengths[s] = 0
+    queued = set(queue)
+    while queue:
+        u = queue.popleft()
+        queued.remove(u)
+        for v, e in graph[u].items():
+            path_cost = distances[u] + e.weight
+            if path_cost < distances[v]:
+                distances[v] = path_cost
+                parents[v] = u
+                lengths[v] = lengths[u] + 1
+                if lengths[v] >= len(graph) and (cycle := _parent_cycle(parents, v)):
+                    return distances, parents, cycle
+                if v not in queued:
+                    queue.append(v)
+                    queued.add(v)
+    return distances, parents, None
+
+
+def _parent_cycle[V: Comparable](parents: dict[V, V], v: V) -> list[V] | None:
+    """Follows the predecessors of v, returning the cycle they end in, if any."""
+    path_index: dict[V, int] = {}
+    path: list[V] = []
+    while v in parents and v not in path_index:
+        path_index[v] = len(path)
+        path.append(v)
+        v = parents[v]
+    if v not in path_index:
+        return None
+    cycle = path[path_index[v] :]
+    cycle.reverse()
+    return cycle
@@ -1,29 +1,181 @@
 from __future__ import annotations
 
+from array import array
 from collections import deque
 from typing import TYPE_CHECKING
 
 from cs.util import Comparable
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
     from cs.structures import Graph
 
 
 def breadth_first_search[V: Comparable](graph: Graph[V], start: V, end: V) -> list[V]:
     """
     Identical to DFS except with a queue and pop(0).
-    Does not benefit from an additional visited check because it uses a queue.
+
+    Each vertex is marked with the vertex it was first discovered from, which is its
+    parent in the BFS tree, so the queue only holds vertices and the path is only
+    built once end is found, by following parents back to start.
 
     Runtime: O(V + E)
     """
-    queue: deque[tuple[V, list[V]]] = deque([(start, [start])])
-    visited: set[V] = set()
+    parents: dict[V, V | None] = {start: None}
+    queue = deque([start])
     while queue:
-        vertex, path = queue.popleft()
+        vertex = queue.popleft()
         if vertex == end:
-            return path
-        visited.add(vertex)
+            path = [end]
+            while (parent := parents[path[-1]]) is not None:
+                path.append(parent)
+            return path[::-1]
         for neighbor, edge in graph[vertex].items():
-            if neighbor not in visited and edge.weight > 0:
-                queue.append((neighbor, [*path, neighbor]))
+            if neighbor not in parents and edge.weight > 0:
+                parents[neighbor] = vertex
+                queue.append(neighbor)
     return []
+
+
+def breadth_first_order[V: Comparable](graph: Graph[V], start: V) -> Iterator[V]:
+    """
+    Yields the vertices reachable from start in the order BFS visits them, so a
+    caller can stop the search early by no longer iterating.
+
+    Runtime: O(V + E)
+    """
+    visited = {start}
+    queue = deque([start])
+    while queue:
+        vertex = queue.popleft()
+        yield vertex
+        for neighbor in graph[vertex]:
+            if neighbor not in visited:
+                visited.add(neighbor)
+                queue.append(neighbor)
+
+
+def bfs_levels[V: Comparable](
+    graph: Graph[V], start: V, *, alpha: float = 15, beta: float = 18
+) -> dict[V, int]:
+    """
+    Returns the BFS level (the number of edges on a shortest path) of every vertex
+    reachable from start, computed by bfs_level_array on integer-indexed copies of
+    the graph's edges and reversed edges.
+
+    Runtime: O(V + E)
+    """
+    graph.verify_nodes_exist(start)
+    nodes = list(graph)
+    index = {v: i for i, v in enumerate(nodes)}
+    edges = [(index[u], index[v]) for u in graph for v in graph[u]]
+    offsets, targets = adjacency_arrays(len(nodes), edges)
+    if graph.is_directed:
+        reverse_offsets, reverse_targets = adjacency_arrays(
+            len(nodes), ((v, u) for u, v in edges)
+        )
+    else:
+        reverse_offsets, reverse_targets = offsets, targets
+    levels = bfs_level_array(
+        offsets,
+        targets,
+        reverse_offsets,
+        reverse_targets,
+        index[start],
+        alpha=alpha,
+        beta=beta,
+    )
+    return {v: level for v, level in zip(nodes, levels, strict=True) if level >= 0}
+
+
+def bfs_level_array(
+    offsets: array[int],
+    targets: array[int],
+    reverse_offsets: array[int],
+    reverse_targets: array[int],
+    source: int,
+    *,
+    alpha: float = 15,
+    beta: float = 18,
+) -> array[int]:
+    """
+    Direction-optimizing BFS over vertices 0..n-1, where the edges out of vertex u
+    are targets[offsets[u]:offsets[u + 1]], and the edges into it are stored the same
+    way in the reverse arrays. Returns the level of every vertex, or -1 if it is
+    unreachable from source.
+
+    The search is level-synchronous. A top-down step scans every edge out of the
+    frontier, which is wasteful once the frontier is large, since most of those edges
+    lead to vertices that are already visited. A bottom-up step instead scans the
+    unvisited vertices and stops at the first edge from the frontier, so each one
+    checks only a few edges. On low-diameter graphs most edges are in the few middle
+    levels, so switching to bottom-up there skips most of the work.
+
+    The search switches to bottom-up once the frontier has more than 1 / alpha of the
+    edges out of unvisited vertices, and back to top-down once the frontier has fewer
+    than 1 / beta of the vertices. alpha=0 always searches top-down.
+
+    Runtime: O(V + E)
+    """
+    n = len(offsets) - 1
+    levels = array("i", [-1]) * n
+    levels[source] = 0
+    frontier = [source]
+    unvisited = [v for v in range(n) if v != source]
+    unexplored_edges = len(targets) - (offsets[source + 1] - offsets[source])
+    bottom_up = False
+    depth = 0
+    while frontier:
+        if bottom_up:
+            bottom_up = len(frontier) * beta >= n
+        else:
+            frontier_edges = sum(offsets[u + 1] - offsets[u] for u in frontier)
+            bottom_up = frontier_edges * alpha > unexplored_edges
+        next_frontier = []
+        if bottom_up:
+            still_unvisited = []
+            # unvisited is only kept up to date by bottom-up steps, so it can still
+            # hold vertices that earlier top-down steps visited.
+            for v in unvisited:
+                if levels[v] >= 0:
+                    continue
+                for u in reverse_targets[reverse_offsets[v] : reverse_offsets[v + 1]]:
+                    if levels[u] == depth:
+                        levels[v] = depth + 1
+                        next_frontier.append(v)
+                        break
+                else:
+                    still_unvisited.append(v)
+            unvisited = still_unvisited
+        else:
+            for u in frontier:
+                for v in targets[offsets[u] : offsets[u + 1]]:
+                    if levels[v] < 0:
+                        levels[v] = depth + 1
+                        next_frontier.append(v)
+        unexplored_edges -= sum(offsets[v + 1] - offsets[v] for v in next_frontier)
+        frontier = next_frontier
+        depth += 1
+    return levels
+
+
+def adjacency_arrays(
+    n: int, edges: Iterable[tuple[int, int]]
+) -> tuple[array[int], array[int]]:
+    """
+    Returns the (offsets, targets) arrays for the edges between vertices 0..n-1, with
+    the edges out of u stored in targets[offsets[u]:offsets[u + 1]].
+    """
+    edges = list(edges)
+    offsets = array("i", [0]) * (n + 1)
+    for u, _ in edges:
+        offsets[u + 1] += 1
+    for u in range(n):
+        offsets[u + 1] += offsets[u]
+    positions = offsets[:-1]
+    targets = array("i", [0]) * len(edges)
+    for u, v in edges:
+        targets[positions[u]] = v
+        positions[u] += 1
+    return offsets, targets
@@ -1,13 +1,26 @@
 from cs.structures import Graph
+from cs.structures.disjoint_set import DisjointSet, UnionMode
 from cs.util import Comparable
 
 
-def connected_components[V: Comparable](graph: Graph[V]) -> list[set[V]]:
+def connected_components[V: Comparable](
+    graph: Graph[V], *, union_find: bool = False
+) -> list[set[V]]:
     """
     This function returns the list of connected components of the given Graph.
 
-    Runtime: O(V + E)
+    By default, each component is found with a depth-first traversal. If union_find
+    is True, the components are built with a union-find over a single scan of the
+    edges instead, which never follows a path through the graph and ignores the
+    direction of edges, so a directed graph is split into its weakly connected
+    components. Either way, the components are listed in the order of their first
+    node in the graph.
+
+    Runtime: O(V + E), or O(V + E a(V)) with union_find
     """
+    if union_find:
+        return _union_find_components(graph)
+
     from cs.algorithms import dfs_traversal
 
     visited: set[V] = set()
@@ -15,3 +28,21 @@ def connected_components[V: Comparable](graph: Graph[V]) -> list[set[V]]:
         dfs_traversal(graph, v, visited) for v in graph if v not in visited
     ]
     return components_list
+
+
+def _union_find_components[V: Comparable](graph: Graph[V]) -> list[set[V]]:
+    """
+    Unions the endpoints of every edge in a DisjointSet, which groups its sets in the
+    order of their first element.
+    """
+    components = DisjointSet[V](mode=UnionMode.SIZE)
+    components.make_sets(graph)
+    # An undirected edge is stored in both directions, but only needs one union.
+    done: set[V] | None = None if graph.is_directed else set()
+    for u in graph:
+        for v in graph[u]:
+            if done is None or v not in done:
+                components.union(u, v)
+        if done is not None:
+            done.add(u)
+    return components.itersets()
@@ -5,6 +5,8 @@ from typing import TYPE_CHECKING
 from cs.util import Comparable
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from cs.structures import Graph
 
 
@@ -12,19 +14,29 @@ def depth_first_search[V: Comparable](graph: Graph[V], start: V, end: V) -> list
     """
     Iterative version of DFS.
 
+    The stack holds (vertex, parent) pairs rather than whole paths. When a vertex is
+    visited, the parent it was pushed from is recorded, and the path is only built
+    once end is found, by following parents back to start.
+
     Runtime: O(V + E)
     """
-    stack: list[tuple[V, list[V]]] = [(start, [start])]
-    visited: set[V] = set()
+    stack: list[tuple[V, V | None]] = [(start, None)]
+    parents: dict[V, V | None] = {}
     while stack:
-        vertex, path = stack.pop()
+        vertex, parent = stack.pop()
         if vertex == end:
-            return path
-        if vertex not in visited:
-            visited.add(vertex)
-            for neighbor in graph[vertex]:
-                if neighbor not in visited:
-                    stack.append((neighbor, [*path, neighbor]))  # noqa: PERF401
+            path = [end]
+            while parent is not None:
+                path.append(parent)
+                parent = parents[parent]
+            return path[::-1]
+        if vertex not in parents:
+            parents[vertex] = parent
+            stack.extend(
+                (neighbor, vertex)
+                for neighbor in graph[vertex]
+                if neighbor not in parents
+            )
     return []
 
 
@@ -50,6 +62,28 @@ def depth_first_search_recursive[V: Comparable](
     return _dfs(start, set(), [start])
 
 
+def depth_first_order[V: Comparable](graph: Graph[V], start: V) -> Iterator[V]:
+    """
+    Yields the vertices reachable from start in the order a recursive DFS would visit
+    them, using an explicit stack of neighbor iterators instead of recursion, so deep
+    graphs cannot overflow the call stack.
+
+    Runtime: O(V + E)
+    """
+    visited = {start}
+    yield start
+    stack = [iter(graph[start])]
+    while stack:
+        for neighbor in stack[-1]:
+            if neighbor not in visited:
+                visited.add(neighbor)
+                yield neighbor
+                stack.append(iter(graph[neighbor]))
+                break
+        else:
+            stack.pop()
+
+
 def dfs_traversal[V: Comparable](
     graph: Graph[V], start: V, visited: set[V] | None
 ) -> set[V]:
@@ -57,13 +91,19 @@ def dfs_traversal[V: Comparable](
     Explores graph starting with start using a depth-first-search traversal.
     Modifies a visited set in place, and returns a set of connected vertices.
 
+    Uses an explicit stack, so the depth of the graph is not limited by recursion.
+
     Runtime: O(V + E)
     """
     if visited is None:
         visited = set()
     visited.add(start)
     connected_nodes = {start}
-    for neighbor in graph[start]:
-        if neighbor not in visited:
-            connected_nodes |= dfs_traversal(graph, neighbor, visited)
+    stack = [start]
+    while stack:
+        for neighbor in graph[stack.pop()]:
+            if neighbor not in visited:
+                visited.add(neighbor)
+                connected_nodes.add(neighbor)
+                stack.append(neighbor)
     return connected_nodes
@@ -1,10 +1,28 @@
 from __future__ import annotations
 
 import heapq
+import itertools
+import os
+import tempfile
+from array import array
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from pathlib import Path
+from typing import TYPE_CHECKING
 
-from cs.structures import FibonacciHeap, Graph
+from cs.structures import CSRGraph, FibonacciHeap, Graph, RadixHeap
 from cs.util import Comparable
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+
+    from cs.structures import Edge
+
+type _Row = tuple[int, array[float], array[int]]
+
+# Larger integer weights use a FibonacciHeap, so that path costs stored as floats stay
+# exact, which they are up to 2^53.
+RADIX_HEAP_MAX_WEIGHT = 1 << 32
+
 
 def dijkstra_search[V: Comparable](graph: Graph[V], start: V, end: V) -> float | None:
     """
@@ -13,29 +31,25 @@ def dijkstra_search[V: Comparable](graph: Graph[V], start: V, end: V) -> float |
     Returns the cost of the shortest path between vertices start and end.
     Cost is first in the tuple because heaps are sorted by the first element.
 
+    The search stops as soon as end is settled, and only the nodes it reaches are ever
+    added to the heap (see dijkstra_shortest_path_tree).
+
     Runtime: O(|E| + |V| log |V|)
     """
-    heap = FibonacciHeap[V]()
-    heap.enqueue(start, 0)
-    for v in graph:
-        if v != start:
-            heap.enqueue(v, Graph.INFINITY)
-    distances = {}
-    while heap:
-        # The algorithm guarantees that we now have the shortest distance to u.
-        u, cost = heap.dequeue()
-        if u == end:
-            return cost
-        distances[u] = cost
-        for v, e in graph[u].items():
-            if v not in distances:
-                path_cost = cost + e.weight
-                if path_cost < heap[v].priority:
-                    heap.decrease_key(v, path_cost)
-    return None
+    distances, _ = dijkstra_shortest_path_tree(graph, start, targets=(end,))
+    if end not in distances:
+        return Graph.INFINITY if end in graph else None
+    return distances[end]
 
 
-def dijkstra_shortest_paths[V: Comparable](graph: Graph[V], start: V) -> dict[V, float]:
+def dijkstra_shortest_paths[V: Comparable](
+    graph: Graph[V],
+    start: V,
+    *,
+    max_distance: float = Graph.INFINITY,
+    targets: Iterable[V] | None = None,
+    integer_weights: bool | None = None,
+) -> dict[V, float]:
     """
     Dijkstra's algorithm for the single-source shortest paths problem.
 
@@ -47,26 +61,322 @@ def dijkstra_shortest_paths[V: Comparable](graph: Graph[V], start: V) -> dict[V,
     from every node yields a shorter path than before) and |V| calls to dequeue-min
     (each node is removed from the heap at most once).
 
+    If max_distance or targets is given, the search stops early and only the settled
+    nodes are reported: nodes further than max_distance from s are left out, and the
+    search ends as soon as every node in targets has been settled.
+
+    integer_weights chooses the heap, as described in dijkstra_shortest_path_tree.
+
     Runtime: O(|E| + |V| log |V|)
     """
-    heap = FibonacciHeap[V]()
+    distances, _ = dijkstra_shortest_path_tree(
+        graph,
+        start,
+        max_distance=max_distance,
+        targets=targets,
+        integer_weights=integer_weights,
+    )
+    if max_distance == Graph.INFINITY and targets is None:
+        for v in graph:
+            if v not in distances:
+                distances[v] = Graph.INFINITY
+    return distances
+
+
+def dijkstra_shortest_path_tree[V: Comparable](
+    graph: Graph[V],
+    start: V,
+    *,
+    max_distance: float = Graph.INFINITY,
+    targets: Iterable[V] | None = None,
+    integer_weights: bool | None = None,
+) -> tuple[dict[V, float], dict[V, V]]:
+    """
+    Same as dijkstra_shortest_paths, but also returns the shortest path tree as a dict
+    mapping each settled node (other than start) to its predecessor on a shortest
+    path. Following the predecessors from v back to start gives the path.
+
+    Nodes are only added to the heap when they are first reached, and decrease-key is
+    used for every shorter path found after that, so a search that settles a small
+    part of the graph never allocates heap entries for the rest of it. Unlike
+    dijkstra_shortest_paths, nodes that are never settled are always left out.
+
+    By default, the search starts on a RadixHeap, whose operations are plain dict
+    updates, and moves its entries to a FibonacciHeap the first time it relaxes an
+    edge whose weight is not a whole number or is larger than RADIX_HEAP_MAX_WEIGHT.
+    Weights stored as floats with integral values, as in a CSRGraph, count as whole
+    numbers. Only the edges the search relaxes are checked, so the heap is chosen
+    without scanning the graph. Pass integer_weights=True to skip the check when every
+    weight is known to be a small whole number, or False to always use a FibonacciHeap.
+
+    Runtime: O(|E| + |V| log |V|), where |V| and |E| only count what the search reaches
+    """
+    heap: RadixHeap[V] | FibonacciHeap[V] = (
+        FibonacciHeap[V]() if integer_weights is False else RadixHeap[V]()
+    )
+    check_weights = integer_weights is None
     heap.enqueue(start, 0)
-    for v in graph:
-        if v != start:
-            heap.enqueue(v, Graph.INFINITY)
+    remaining = None if targets is None else set(targets)
     distances = {}
+    parents: dict[V, V] = {}
     while heap:
         # The algorithm guarantees that we now have the shortest distance to u.
         u, cost = heap.dequeue()
+        if cost > max_distance:
+            break
         distances[u] = cost
+        if remaining is not None:
+            remaining.discard(u)
+            if not remaining:
+                break
         for v, e in graph[u].items():
             if v not in distances:
                 if e.weight < 0:
                     raise RuntimeError("Dijkstra's does not work for negative weights.")
+                if check_weights and (
+                    e.weight > RADIX_HEAP_MAX_WEIGHT or not float(e.weight).is_integer()
+                ):
+                    heap = _to_fibonacci_heap(heap)
+                    check_weights = False
                 path_cost = cost + e.weight
-                if path_cost < heap[v].priority:
+                if v not in heap:
+                    heap.enqueue(v, path_cost)
+                    parents[v] = u
+                elif path_cost < heap[v].priority:
                     heap.decrease_key(v, path_cost)
-    return distances
+                    parents[v] = u
+    if heap:
+        # The search stopped early, so drop the parents of unsettled nodes.
+        parents = {v: u for v, u in parents.items() if v in distances}
+    return distances, parents
+
+
+def _to_fibonacci_heap[V: Comparable](
+    heap: RadixHeap[V] | FibonacciHeap[V],
+) -> FibonacciHeap[V]:
+    """Moves the entries of a RadixHeap to a new FibonacciHeap."""
+    if isinstance(heap, FibonacciHeap):
+        return heap
+    fibonacci_heap = FibonacciHeap[V]()
+    for v in heap:
+        fibonacci_heap.enqueue(v, heap[v].priority)
+    return fibonacci_heap
+
+
+def multi_source_shortest_paths[V: Comparable](
+    graph: Graph[V], sources: Iterable[V]
+) -> tuple[dict[V, float], dict[V, V]]:
+    """
+    Runs a single Dijkstra's search from every source at once, as if a super-source
+    were joined to each of them by an edge of weight 0. Returns the distance from each
+    node to its nearest source, along with a dict labeling each reachable node with
+    that nearest source. Unreachable nodes are reported at distance +infinity and are
+    left unlabeled.
+
+    This answers "which source is closest to each node" with one search instead of
+    one search per source.
+
+    Runtime: O((|E| + |V|) log |V|)
+    """
+    distances = dict.fromkeys(graph, Graph.INFINITY)
+    nearest = {}
+    heap: list[tuple[float, V]] = []
+    for s in sources:
+        graph.verify_nodes_exist(s)
+        distances[s] = 0
+        nearest[s] = s
+        heap.append((0, s))
+    heapq.heapify(heap)
+    while heap:
+        cost, u = heapq.heappop(heap)
+        if cost > distances[u]:
+            continue
+        for v, e in graph[u].items():
+            if e.weight < 0:
+                raise RuntimeError("Dijkstra's does not work for negative weights.")
+            path_cost = cost + e.weight
+            if path_cost < distances[v]:
+                distances[v] = path_cost
+                nearest[v] = nearest[u]
+                heapq.heappush(heap, (path_cost, v))
+    return distances, nearest
+
+
+def batched_dijkstra_shortest_paths[V: Comparable](
+    graph: Graph[V],
+    sources: Iterable[V],
+    *,
+    max_workers: int | None = 1,
+    chunk_size: int = 64,
+) -> Iterator[tuple[V, dict[V, float]]]:
+    """
+    Yields the result of dijkstra_shortest_paths from each of the sources as a
+    (source, distances) pair.
+
+    The graph is relabeled to the integers 0..|V|-1 once, and every search then runs
+    on flat arrays that are allocated once per batch and reset between searches (see
+    dijkstra_shortest_path_arrays), instead of building a new heap and dicts for each
+    source. With max_workers other than 1, the batches are spread across a pool of
+    processes, and rows are yielded in the order they finish.
+
+    Runtime: O(|S| (|E| + |V|) log |V|), for |S| sources
+    """
+    nodes = list(graph)
+    index = {v: i for i, v in enumerate(nodes)}
+    int_graph = Graph.from_graph(graph, node_fn=index.__getitem__)
+    for i, costs, _ in dijkstra_shortest_path_arrays(
+        int_graph,
+        [index[s] for s in sources],
+        max_workers=max_workers,
+        chunk_size=chunk_size,
+    ):
+        yield nodes[i], dict(zip(nodes, costs, strict=True))
+
+
+def dijkstra_shortest_path_arrays(
+    graph: Graph[int],
+    sources: Iterable[int],
+    *,
+    paths: bool = False,
+    max_workers: int | None = 1,
+    chunk_size: int = 64,
+) -> Iterator[tuple[int, array[float], array[int]]]:
+    """
+    Runs Dijkstra's from each source of a graph whose nodes are 0..|V|-1, yielding
+    (source, costs, predecessors) rows, where costs[v] is the distance to v and
+    predecessors[v] is the node before v on a shortest path, or -1 if there is none.
+    predecessors is empty unless paths is True.
+
+    The sources are split into chunks of chunk_size. Each chunk reuses one set of
+    cost and predecessor arrays, and only the entries a search reached are reset
+    before the next one. If max_workers is not 1, the graph is saved once as a
+    CSRGraph snapshot that every worker process memory-maps, and at most two chunks
+    per worker are in flight at a time. max_workers=None uses every CPU.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive.")
+    sources = iter(sources)
+    chunks = iter(lambda: tuple(itertools.islice(sources, chunk_size)), ())
+    if max_workers == 1:
+        for chunk in chunks:
+            yield from _dijkstra_rows(graph, chunk, paths)
+        return
+
+    num_workers = max_workers or os.process_cpu_count() or 1
+    with (
+        tempfile.TemporaryDirectory() as tmp_dir,
+        ProcessPoolExecutor(num_workers) as pool,
+    ):
+        snapshot = Path(tmp_dir) / "graph.csr"
+        CSRGraph(graph).save_snapshot(snapshot)
+        shared_graph = CSRGraph.open_snapshot(snapshot)
+
+        def submit(count: int) -> set[Future[list[_Row]]]:
+            return {
+                pool.submit(_dijkstra_rows, shared_graph, chunk, paths)
+                for chunk in itertools.islice(chunks, count)
+            }
+
+        pending = submit(2 * num_workers)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            pending |= submit(len(done))
+            for future in done:
+                yield from future.result()
+
+
+def _dijkstra_rows(
+    graph: Graph[int], sources: Sequence[int], paths: bool
+) -> list[_Row]:
+    """Runs Dijkstra's from each source, reusing the same arrays for every search."""
+    n = len(graph)
+    costs = array("d", [Graph.INFINITY]) * n
+    parents = array("i", [-1]) * n
+    rows = []
+    for s in sources:
+        reached = [s]
+        costs[s] = 0
+        heap: list[tuple[float, int]] = [(0, s)]
+        while heap:
+            cost, u = heapq.heappop(heap)
+            if cost > costs[u]:
+                continue
+            for v, e in graph[u].items():
+                if e.weight < 0:
+                    raise RuntimeError("Dijkstra's does not work for negative weights.")
+                path_cost = cost + e.weight
+                if path_cost < costs[v]:
+                    if costs[v] == Graph.INFINITY:
+                        reached.append(v)
+                    costs[v] = path_cost
+                    parents[v] = u
+                    heapq.heappush(heap, (path_cost, v))
+        rows.append(
+            (s, array("d", costs), array("i", parents) if paths else array("i"))
+        )
+        for v in reached:
+            costs[v] = Graph.INFINITY
+            parents[v] = -1
+    return rows
+
+
+def bidirectional_dijkstra_search[V: Comparable](
+    graph: Graph[V], start: V, end: V
+) -> float:
+    """
+    Runs Dijkstra's forwards from start and backwards from end at the same time,
+    always advancing whichever frontier is closer, and stops once the two frontiers
+    are together further apart than the shortest path found so far. Each side only
+    explores a ball of about half the radius, which on road and grid graphs reaches far
+    fewer nodes than a one-sided search.
+
+    Nodes only enter a heap once they are reached, and outdated heap entries are
+    skipped when popped. The backwards search uses graph.predecessors() if the graph
+    has a predecessor index. Otherwise, the reversed edges are collected once before
+    the search, which takes O(|V| + |E|), so directed graphs that are searched often
+    should be built with index_predecessors=True.
+
+    Returns Graph.INFINITY if end is unreachable.
+
+    Runtime: O((|E| + |V|) log |V|)
+    """
+    graph.verify_nodes_exist(start, end)
+    reverse: dict[V, list[tuple[V, Edge[V]]]] | None = None
+    if not graph.has_predecessor_index:
+        reverse = {v: [] for v in graph}
+        for u in graph:
+            for v, e in graph[u].items():
+                reverse[v].append((u, e))
+    distances: tuple[dict[V, float], dict[V, float]] = ({start: 0}, {end: 0})
+    heaps: tuple[list[tuple[float, V]], list[tuple[float, V]]] = (
+        [(0, start)],
+        [(0, end)],
+    )
+    shortest = 0 if start == end else Graph.INFINITY
+    while heaps[0] and heaps[1]:
+        if heaps[0][0][0] + heaps[1][0][0] >= shortest:
+            break
+        side = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+        dist, other_dist = distances[side], distances[1 - side]
+        cost, u = heapq.heappop(heaps[side])
+        if cost > dist[u]:
+            continue
+        if side == 0:
+            edges: Iterable[tuple[V, Edge[V]]] = graph[u].items()
+        elif reverse is not None:
+            edges = reverse[u]
+        else:
+            edges = ((v, graph[v][u]) for v in graph.predecessors(u))
+        for v, e in edges:
+            if e.weight < 0:
+                raise RuntimeError("Dijkstra's does not work for negative weights.")
+            path_cost = cost + e.weight
+            if path_cost < dist.get(v, Graph.INFINITY):
+                dist[v] = path_cost
+                heapq.heappush(heaps[side], (path_cost, v))
+            if v in other_dist:
+                shortest = min(shortest, path_cost + other_dist[v])
+    return shortest
 
 
 def dijkstra_search_heapq[V: Comparable](
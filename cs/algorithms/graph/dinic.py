@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+from array import array
+from collections import deque
+
+from cs.structures import Edge, Graph
+from cs.util import Comparable
+
+
+def dinic_max_flow[V: Comparable](graph: Graph[V], source: V, sink: V) -> float:
+    """Returns the value of a maximum source-sink flow. See dinic_max_flow_network."""
+    graph.verify_nodes_exist(source, sink)
+    return _ResidualNetwork(graph).max_flow(source, sink)
+
+
+def dinic_max_flow_network[V: Comparable](
+    graph: Graph[V], source: V, sink: V
+) -> Graph[V]:
+    """
+    Given a graph whose edge weights are capacities and a pair of nodes s and t,
+    produces a maximum s-t flow using Dinic's algorithm. The result is a copy of the
+    graph where every edge has a "capacity" and a "flow", like ford_max_flow_network.
+
+    Each phase runs a BFS from s over the residual graph to label every node with its
+    distance from s, and then pushes a blocking flow along paths that only step from
+    one level to the next, found with an iterative DFS. Each node remembers which of
+    its edges it tried last, and nodes that cannot reach t are removed from the level
+    graph, so a phase never retries a dead end. The distance from s to t grows with
+    every phase, so there are at most |V| phases.
+
+    The residual graph is stored in flat arrays: the residual edges out of node i are
+    targets[offsets[i]:offsets[i + 1]], and every edge stores the index of its paired
+    reverse edge, so pushing flow across an edge is two array updates.
+
+    Runtime: O(|V|^2 |E|), or O(|E| sqrt(|V|)) on unit-capacity bipartite graphs
+    """
+    graph.verify_nodes_exist(source, sink)
+    network = _ResidualNetwork(graph)
+    network.max_flow(source, sink)
+    flows = network.flows()
+    return Graph.from_graph(
+        graph,
+        edge_fn=lambda e: Edge(
+            **e, capacity=e.weight, flow=flows.get((e.start, e.end), 0)
+        ),
+    )
+
+
+class _ResidualNetwork[V: Comparable]:
+    """
+    The residual graph of a flow network, where the edges out of each node are stored
+    contiguously in arrays, along with the index of each edge's reverse edge.
+    """
+
+    def __init__(self, graph: Graph[V]) -> None:
+        self.nodes = list(graph)
+        self.index = {v: i for i, v in enumerate(self.nodes)}
+        arcs = [
+            (self.index[u], self.index[v], e.weight)
+            for u in graph
+            for v, e in graph[u].items()
+            if u != v
+        ]
+        offsets = [0] * (len(self.nodes) + 1)
+        for u, v, _ in arcs:
+            offsets[u + 1] += 1
+            offsets[v + 1] += 1
+        for i in range(len(self.nodes)):
+            offsets[i + 1] += offsets[i]
+        self.offsets = array("i", offsets)
+        self.targets = array("i", [0]) * (2 * len(arcs))
+        self.reverse = array("i", [0]) * (2 * len(arcs))
+        # Residual capacities stay a list so that integer capacities stay exact.
+        self.residual: list[float] = [0] * (2 * len(arcs))
+        # The index of the forward residual edge of each graph edge.
+        self.forward = array("i", [0]) * len(arcs)
+        positions = offsets[:-1]
+        for k, (u, v, capacity) in enumerate(arcs):
+            i, j = positions[u], positions[v]
+            positions[u] += 1
+            positions[v] += 1
+            self.targets[i], self.targets[j] = v, u
+            self.reverse[i], self.reverse[j] = j, i
+            self.residual[i] = capacity
+            self.forward[k] = i
+        self.capacities = [capacity for _, _, capacity in arcs]
+        self.arcs = [(u, v) for u, v, _ in arcs]
+
+    def max_flow(self, source: V, sink: V) -> float:
+        s, t = self.index[source], self.index[sink]
+        total: float = 0
+        if s == t:
+            return total
+        while (levels := self._levels(s, t)) is not None:
+            total += self._blocking_flow(s, t, levels)
+        return total
+
+    def flows(self) -> dict[tuple[V, V], float]:
+        """Returns the flow across each edge of the original graph."""
+        flows: dict[tuple[V, V], float] = {}
+        for (u, v), capacity, i in zip(
+            self.arcs, self.capacities, self.forward, strict=True
+        ):
+            key = (self.nodes[u], self.nodes[v])
+            flows[key] = flows.get(key, 0) + capacity - self.residual[i]
+        return flows
+
+    def _levels(self, s: int, t: int) -> array[int] | None:
+        """Labels each node with its BFS distance from s, or None if t is unreached."""
+        levels = array("i", [-1]) * len(self.nodes)
+        levels[s] = 0
+        queue = deque([s])
+        while queue:
+            u = queue.popleft()
+            for i in range(self.offsets[u], self.offsets[u + 1]):
+                v = self.targets[i]
+                if levels[v] < 0 and self.residual[i] > 0:
+                    levels[v] = levels[u] + 1
+                    queue.append(v)
+        return levels if levels[t] >= 0 else None
+
+    def _blocking_flow(self, s: int, t: int, levels: array[int]) -> float:
+        """Pushes flow along level graph paths from s to t until none are left."""
+        targets, reverse, residual = self.targets, self.reverse, self.residual
+        # The next edge to try out of each node.
+        current = array("i", self.offsets[:-1])
+        path: list[int] = []
+        total: float = 0
+        u = s
+        while True:
+            if u == t:
+                amount = min(residual[i] for i in path)
+                for i in path:
+                    residual[i] -= amount
+                    residual[reverse[i]] += amount
+                total += amount
+                # Retreat to the tail of the first saturated edge on the path.
+                del path[next(k for k, i in enumerate(path) if residual[i] == 0) :]
+                u = targets[path[-1]] if path else s
+                continue
+            end = self.offsets[u + 1]
+            i = current[u]
+            while i < end and (residual[i] <= 0 or levels[targets[i]] != levels[u] + 1):
+                i += 1
+            current[u] = i
+            if i < end:
+                path.append(i)
+                u = targets[i]
+            elif u == s:
+                return total
+            else:
+                # u cannot reach t, so remove it from the level graph.
+                levels[u] = -1
+                u = targets[reverse[path.pop()]]
+                current[u] += 1
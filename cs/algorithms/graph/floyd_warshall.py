@@ -1,10 +1,44 @@
-from cs.structures import Graph
+from __future__ import annotations
+
+from array import array
+from typing import TYPE_CHECKING, Any, Literal, overload
+
+from cs.algorithms.graph.path_table import PathTable
+from cs.structures import COOMatrix, CSRMatrix, Graph
 from cs.util import Comparable
 
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+
+
+@overload
+def floyd_warshall_shortest_paths[V: Comparable](
+    graph: Graph[V],
+    *,
+    vectorized: bool = True,
+    block_size: int = 64,
+    paths: Literal[False] = False,
+) -> dict[V, dict[V, float]]: ...
+
+
+@overload
+def floyd_warshall_shortest_paths[V: Comparable](
+    graph: Graph[V],
+    *,
+    vectorized: bool = True,
+    block_size: int = 64,
+    paths: Literal[True],
+) -> PathTable[V]: ...
+
 
 def floyd_warshall_shortest_paths[V: Comparable](
     graph: Graph[V],
-) -> dict[V, dict[V, float]]:
+    *,
+    vectorized: bool = True,
+    block_size: int = 64,
+    paths: bool = False,
+) -> dict[V, dict[V, float]] | PathTable[V]:
     """
     Calculates the shortest distance between all vertex pairs using dynamic programming.
     distance[u][v] will contain the shortest distance from vertex u to v.
@@ -19,16 +53,39 @@ def floyd_warshall_shortest_paths[V: Comparable](
     Unlike Dijkstra's Algorithm, the Floyd-Warshall Algorithm has no problems handling
     graphs with negative edge costs.
 
+    By default, step 3 runs as NumPy array operations (see floyd_warshall_matrix).
+    Set vectorized=False to run the triple loop over dicts instead.
+
+    If paths is True, the predecessor of each vertex on each shortest path is tracked
+    alongside the distances and returned in a PathTable, so that any route can be
+    rebuilt with PathTable.path(). The predecessor of j on the path from i is updated
+    to the predecessor of j on the path from k whenever i -> k -> j is shorter.
+
     Runtime: O(|V|^3) Memory: O(|V|^2)
     """
+    if vectorized:
+        nodes = sorted(graph)
+        matrix = graph.to_array(zero_is_no_edge=False)
+        predecessors = _initial_predecessors(matrix) if paths else None
+        _relax_all_pairs(matrix, block_size, predecessors)
+        index = {v: i for i, v in enumerate(nodes)}
+        rows = matrix.tolist()
+        distances = {u: {v: rows[index[u]][index[v]] for v in graph} for u in graph}
+        if predecessors is None:
+            return distances
+        return PathTable(nodes, distances, array("i", predecessors.tobytes()))
+
     dist: dict[V, dict[V, float]] = {}
+    pred: dict[V, dict[V, V]] = {}
     for u in graph:
         dist[u] = {}
+        pred[u] = {}
         for v in graph:
             if u == v:
                 dist[u][v] = 0
             elif graph.has_edge(u, v):
                 dist[u][v] = graph[u][v].weight
+                pred[u][v] = u
             else:
                 dist[u][v] = Graph.INFINITY
 
@@ -36,5 +93,123 @@ def floyd_warshall_shortest_paths[V: Comparable](
     for k in graph:
         for i in graph:
             for j in graph:
-                dist[i][j] = min(dist[i][j], dist[i][k] + dist[k][j])
-    return dist
+                if dist[i][k] + dist[k][j] < dist[i][j]:
+                    dist[i][j] = dist[i][k] + dist[k][j]
+                    pred[i][j] = pred[k][j]
+    if not paths:
+        return dist
+    nodes = list(graph)
+    index = {v: i for i, v in enumerate(nodes)}
+    return PathTable(
+        nodes,
+        dist,
+        array(
+            "i",
+            (index[pred[u][v]] if v in pred[u] else -1 for u in nodes for v in nodes),
+        ),
+    )
+
+
+@overload
+def floyd_warshall_matrix[V: Comparable](
+    graph: Graph[V], *, block_size: int = 64
+) -> tuple[NDArray[np.float64], list[V]]: ...
+
+
+@overload
+def floyd_warshall_matrix(
+    graph: NDArray[Any] | CSRMatrix | COOMatrix, *, block_size: int = 64
+) -> tuple[NDArray[np.float64], list[int]]: ...
+
+
+def floyd_warshall_matrix(
+    graph: Graph[Any] | NDArray[Any] | CSRMatrix | COOMatrix, *, block_size: int = 64
+) -> tuple[NDArray[np.float64], list[Any]]:
+    """
+    Runs Floyd-Warshall on a contiguous float64 distance matrix, where each step k
+    relaxes every pair at once with a single broadcasted operation:
+        dist = minimum(dist, dist[:, k, None] + dist[None, k, :])
+
+    The graph can be a Graph, a dense distance matrix using INFINITY for missing
+    edges, or a sparse matrix. Returns the distances along with the node of each row
+    and column, which for a Graph is the sorted order of its nodes.
+
+    The steps are processed block_size at a time. The rows of the current block are
+    relaxed first, and the rest of the matrix is then relaxed in slabs of block_size
+    rows that stay in cache for the whole block, rather than streaming the entire
+    matrix through memory once per step.
+
+    Runtime: O(|V|^3) Memory: O(|V|^2)
+    """
+    if isinstance(graph, Graph):
+        nodes = sorted(graph)
+        dist = graph.to_array(zero_is_no_edge=False)
+    else:
+        dist = _distance_matrix(graph)
+        nodes = list(range(len(dist)))
+    _relax_all_pairs(dist, block_size, None)
+    return dist, nodes
+
+
+def _relax_all_pairs(
+    dist: NDArray[np.float64],
+    block_size: int,
+    predecessors: NDArray[np.int32] | None,
+) -> None:
+    """Runs every step of Floyd-Warshall on dist in place, as blocked slabs."""
+    import numpy as np
+
+    if block_size < 1:
+        raise ValueError("block_size must be positive.")
+    np.fill_diagonal(dist, 0)
+    n = len(dist)
+    buffer = np.empty((min(block_size, n), n))
+    mask = np.empty(buffer.shape, dtype=bool)
+    for block in range(0, n, block_size):
+        steps = range(block, min(block + block_size, n))
+        slabs = [block, *(row for row in range(0, n, block_size) if row != block)]
+        for row in slabs:
+            slab = dist[row : row + block_size]
+            temp = buffer[: len(slab)]
+            for k in steps:
+                np.add(slab[:, k, None], dist[k], out=temp)
+                if predecessors is None:
+                    np.minimum(slab, temp, out=slab)
+                else:
+                    shorter = mask[: len(slab)]
+                    np.less(temp, slab, out=shorter)
+                    np.copyto(slab, temp, where=shorter)
+                    np.copyto(
+                        predecessors[row : row + block_size],
+                        predecessors[k],
+                        where=shorter,
+                    )
+
+
+def _initial_predecessors(dist: NDArray[np.float64]) -> NDArray[np.int32]:
+    """Each edge (i, j) starts with i as the predecessor of j, and -1 otherwise."""
+    import numpy as np
+
+    n = len(dist)
+    predecessors = np.full((n, n), -1, dtype=np.int32)
+    has_edge = dist != Graph.INFINITY
+    np.fill_diagonal(has_edge, val=False)
+    rows = np.broadcast_to(np.arange(n, dtype=np.int32)[:, None], (n, n))
+    np.copyto(predecessors, rows, where=has_edge)
+    return predecessors
+
+
+def _distance_matrix(
+    matrix: NDArray[Any] | CSRMatrix | COOMatrix,
+) -> NDArray[np.float64]:
+    """Copies the matrix into a dense array, keeping the lightest parallel edge."""
+    import numpy as np
+
+    if isinstance(matrix, CSRMatrix):
+        row = np.repeat(np.arange(matrix.shape[0]), np.diff(matrix.indptr))
+        matrix = COOMatrix(matrix.data, row, matrix.indices, matrix.shape)
+    if isinstance(matrix, COOMatrix):
+        dist = np.full(matrix.shape, Graph.INFINITY)
+        np.minimum.at(dist, (matrix.row, matrix.col), matrix.data)
+        return dist
+    return np.array(matrix, dtype=np.float64)
@@ -3,42 +3,61 @@ from __future__ import annotations
 from collections.abc import Iterable, Mapping
 from typing import Any, cast
 
+from cs.algorithms.graph.dinic import dinic_max_flow, dinic_max_flow_network
 from cs.structures import Edge, Graph
 from cs.util import Comparable
 
 
 def bipartite_matching[V: Comparable](
-    graph: Graph[V], left: Iterable[V] | Mapping[V, int], right: Iterable[V]
+    graph: Graph[V],
+    left: Iterable[V] | Mapping[V, int],
+    right: Iterable[V],
+    *,
+    dinic: bool = True,
 ) -> tuple[Graph[V], list[Edge[V]]]:
+    """
+    Finds a maximum matching by running max flow from a new "Source" node to a new
+    "Sink" node, on a copy of the graph so that the input is left unchanged. Returns
+    the max flow network along with the matched edges.
+
+    If left is a Mapping, each left node can be matched up to that many times. To only
+    get the matching, use hopcroft_karp_matching, which is much faster.
+
+    If every edge goes from one side to the other, graph.is_bipartite(witness=True)
+    returns the two sides, which can be used as left and right.
+    """
+    capacities = dict(left) if isinstance(left, Mapping) else dict.fromkeys(left, 1)
+    right_nodes = set(right)
+    flow_graph = Graph.from_graph(graph, is_directed=graph.is_directed)
     source = cast(Any, "Source")
     sink = cast(Any, "Sink")
-    graph.add_node(source)
-    graph.add_node(sink)
-    if isinstance(left, Mapping):
-        for node, count in left.items():
-            graph.add_edge(source, node, weight=count)
-    else:
-        for node in left:
-            graph.add_edge(source, node, weight=1)
-    for node in right:
-        graph.add_edge(node, sink)
-
-    max_flow_graph = ford_max_flow_network(graph, source, sink)
+    flow_graph.add_node(source)
+    flow_graph.add_node(sink)
+    for node, count in capacities.items():
+        flow_graph.add_edge(source, node, weight=count)
+    for node in right_nodes:
+        flow_graph.add_edge(node, sink)
+
+    max_flow_graph = ford_max_flow_network(flow_graph, source, sink, dinic=dinic)
     matching_edges = [
         edge
         for edge in max_flow_graph.edges
-        if edge["flow"] >= 1 and edge.start in left and edge.end in right
+        if edge["flow"] >= 1 and edge.start in capacities and edge.end in right_nodes
     ]
     return max_flow_graph, matching_edges
 
 
-def ford_max_flow[V: Comparable](graph: Graph[V], source: V, sink: V) -> float:
-    result = ford_max_flow_network(graph, source, sink)
+def ford_max_flow[V: Comparable](
+    graph: Graph[V], source: V, sink: V, *, dinic: bool = True
+) -> float:
+    if dinic:
+        return dinic_max_flow(graph, source, sink)
+    result = ford_max_flow_network(graph, source, sink, dinic=False)
     return cast(float, sum(edge["flow"] for edge in result[source].values()))
 
 
 def ford_max_flow_network[V: Comparable](
-    graph: Graph[V], source: V, sink: V
+    graph: Graph[V], source: V, sink: V, *, dinic: bool = True
 ) -> Graph[V]:
     """
     Given a graph and a pair of nodes s and t, produces a maximum s-t flow in that
@@ -55,8 +74,14 @@ def ford_max_flow_network[V: Comparable](
     value of the max-flow. Since each search to find an augmenting path from s to t
     takes O(m + n), the overall runtime is O((m + n)F).
 
+    By default, the flow is found with Dinic's algorithm on flat residual arrays
+    instead (see dinic_max_flow_network). Set dinic=False to push flow along one
+    augmenting path at a time.
+
     Runtime: O((m + n)F)
     """
+    if dinic:
+        return dinic_max_flow_network(graph, source, sink)
     flow_network = Graph.from_graph(
         graph, edge_fn=lambda e: Edge(**e, capacity=e.weight, flow=0)
     )
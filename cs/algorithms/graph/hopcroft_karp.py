@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+from array import array
+from collections.abc import Mapping
+from typing import TYPE_CHECKING
+
+from cs.util import Comparable
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from cs.structures import Graph
+
+
+def hopcroft_karp_matching[V: Comparable](
+    graph: Graph[V], left: Iterable[V] | Mapping[V, int], right: Iterable[V]
+) -> dict[V, V]:
+    """
+    Finds a maximum matching between the left and right nodes of a bipartite graph
+    using the Hopcroft-Karp algorithm, and returns it as a dict mapping each matched
+    right node to the left node it is matched with. Only edges from a left node to a
+    right node are used, and the graph is never modified.
+
+    If left is a Mapping, each left node can be matched with up to that many right
+    nodes, which is the same as splitting it into that many copies with the same
+    edges. Each right node is always matched at most once.
+
+    Each phase runs a BFS from every unmatched left node to find the length of the
+    shortest augmenting paths, and then an iterative DFS augments along a maximal set
+    of disjoint paths of that length. The length grows every phase, and only
+    O(sqrt(|V|)) phases are needed.
+
+    Runtime: O(|E| sqrt(|V|))
+    """
+    capacities = dict(left) if isinstance(left, Mapping) else dict.fromkeys(left, 1)
+    right_nodes = list(right)
+    right_index = {v: i for i, v in enumerate(right_nodes)}
+    left_nodes = list(capacities)
+    matching = _Matching(
+        [
+            array("i", (right_index[v] for v in graph[u] if v in right_index))
+            for u in left_nodes
+        ],
+        [capacities[u] for u in left_nodes],
+        len(right_nodes),
+    )
+    matching.maximize()
+    return {
+        right_nodes[r]: left_nodes[matching.owner[slot]]
+        for r, slot in enumerate(matching.match_right)
+        if slot >= 0
+    }
+
+
+class _Matching:
+    """
+    A matching between slots and right nodes, stored in flat arrays. Each unit of
+    capacity of a left node is a separate slot, and the slots of a left node share its
+    list of neighbors.
+    """
+
+    def __init__(
+        self, neighbors: list[array[int]], capacities: list[int], num_right: int
+    ) -> None:
+        self.neighbors = neighbors
+        self.owner = array(
+            "i", (i for i, capacity in enumerate(capacities) for _ in range(capacity))
+        )
+        self.match_slot = array("i", [-1]) * len(self.owner)
+        self.match_right = array("i", [-1]) * num_right
+        self.levels = array("i")
+        # The level of the slots that end the shortest augmenting paths of a phase.
+        self.limit = -1
+        # The next neighbor to try for each slot in the current phase.
+        self.current = array("i")
+
+    def maximize(self) -> None:
+        while self._label_levels():
+            self.current = array("i", [0]) * len(self.owner)
+            for root in range(len(self.owner)):
+                if self.match_slot[root] < 0:
+                    self._augment(root)
+
+    def _label_levels(self) -> bool:
+        """
+        Labels each slot with its BFS distance from an unmatched slot, alternating
+        between unmatched and matched edges. The BFS stops after the first level with
+        an edge to an unmatched right node, so only the shortest augmenting paths are
+        labelled. Returns whether an augmenting path exists.
+        """
+        levels = array("i", [-1]) * len(self.owner)
+        queue = [slot for slot in range(len(self.owner)) if self.match_slot[slot] < 0]
+        for slot in queue:
+            levels[slot] = 0
+        limit = -1
+        for slot in queue:
+            level = levels[slot]
+            if limit >= 0 and level > limit:
+                break
+            for r in self.neighbors[self.owner[slot]]:
+                next_slot = self.match_right[r]
+                if next_slot < 0:
+                    limit = level
+                elif limit < 0 and levels[next_slot] < 0:
+                    levels[next_slot] = level + 1
+                    queue.append(next_slot)
+        self.levels = levels
+        self.limit = limit
+        return limit >= 0
+
+    def _augment(self, root: int) -> None:
+        """
+        Searches the level graph from root for a shortest augmenting path and flips
+        it. Only slots at the last level can end a path at an unmatched right node.
+        """
+        levels, current, match_right = self.levels, self.current, self.match_right
+        limit = self.limit
+        slots = [root]
+        rights: list[int] = []
+        while slots:
+            slot = slots[-1]
+            level = levels[slot]
+            edges = self.neighbors[self.owner[slot]]
+            while current[slot] < len(edges):
+                r = edges[current[slot]]
+                current[slot] += 1
+                next_slot = match_right[r]
+                if next_slot < 0:
+                    if level != limit:
+                        continue
+                    rights.append(r)
+                    for s, matched in zip(slots, rights, strict=True):
+                        self.match_slot[s] = matched
+                        match_right[matched] = s
+                    return
+                if level < limit and levels[next_slot] == level + 1:
+                    rights.append(r)
+                    slots.append(next_slot)
+                    break
+            else:
+                # No augmenting path continues through this slot in this phase.
+                levels[slot] = -1
+                slots.pop()
+                if rights:
+                    rights.pop()
@@ -1,9 +1,44 @@
-from cs.algorithms import bellman_ford_shortest_paths, dijkstra_shortest_paths
+from __future__ import annotations
+
+from array import array
+from typing import TYPE_CHECKING, Literal, overload
+
+from cs.algorithms import dijkstra_shortest_path_arrays, spfa_shortest_paths
+from cs.algorithms.graph.path_table import PathTable
 from cs.structures import Edge, Graph, Node
 from cs.util import Comparable
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+@overload
+def johnsons_shortest_paths[V: Comparable](
+    graph: Graph[V],
+    *,
+    paths: Literal[False] = False,
+    max_workers: int | None = 1,
+    chunk_size: int = 64,
+) -> dict[V, dict[V, float]]: ...
+
+
+@overload
+def johnsons_shortest_paths[V: Comparable](
+    graph: Graph[V],
+    *,
+    paths: Literal[True],
+    max_workers: int | None = 1,
+    chunk_size: int = 64,
+) -> PathTable[V]: ...
 
-def johnsons_shortest_paths[V: Comparable](graph: Graph[V]) -> dict[V, dict[V, float]]:
+
+def johnsons_shortest_paths[V: Comparable](
+    graph: Graph[V],
+    *,
+    paths: bool = False,
+    max_workers: int | None = 1,
+    chunk_size: int = 64,
+) -> dict[V, dict[V, float]] | PathTable[V]:
     """
     An implementation of Johnson's all-pairs shortest paths algorithm.  This algorithm
     is remarkable in that it combines two single-source shortest path algrithms -
@@ -14,10 +49,86 @@ def johnsons_shortest_paths[V: Comparable](graph: Graph[V]) -> dict[V, dict[V, f
     The idea behind Johnson's algorithm is to enforce that all the edge costs in the
     graph are nonnegative by computing a new potential function h(v) for each node in
     the graph, and then creating a new edge cost for each edge. With this new graph, we
-    can use Dijkstra's to get the shortest paths.
+    can use Dijkstra's to get the shortest paths. The potentials are computed with the
+    queue-based Bellman-Ford algorithm (SPFA), which usually settles in far fewer than
+    |V| passes.
+
+    If paths is True, the shortest path tree of each Dijkstra's run is kept as one row
+    of the predecessor table of a PathTable. Reweighting does not change which paths
+    are shortest, so these trees are also shortest path trees of the original graph.
+
+    The Dijkstra's runs are independent, so they can be spread across max_workers
+    processes; see johnsons_shortest_path_rows. max_workers=None uses every CPU.
 
     Runtime: O(|V||E| + |V|^2 log |V|)
     """
+    nodes = list(graph)
+    distances = {}
+    predecessors: dict[V, array[int]] = {}
+    for u, row, parents in _johnsons_rows(
+        graph, max_workers=max_workers, chunk_size=chunk_size, paths=paths
+    ):
+        distances[u] = row
+        predecessors[u] = parents
+    # Rows may finish out of order when they are computed in parallel.
+    distances = {u: distances[u] for u in nodes}
+    if not paths:
+        return distances
+    table = array("i")
+    for u in nodes:
+        table.extend(predecessors[u])
+    return PathTable(nodes, distances, table)
+
+
+def johnsons_shortest_path_rows[V: Comparable](
+    graph: Graph[V], *, max_workers: int | None = 1, chunk_size: int = 64
+) -> Iterator[tuple[V, dict[V, float]]]:
+    """
+    Yields each row of johnsons_shortest_paths as a (source, distances) pair as soon as
+    it is computed, so the caller never has to hold all |V|^2 distances at once.
+
+    The Dijkstra's runs are done in chunks of chunk_size sources. If max_workers is
+    not 1, the chunks are spread across a pool of max_workers processes, and
+    max_workers=None uses every CPU. The reweighted graph is then saved once as a
+    CSRGraph snapshot that every worker memory-maps, so it is never pickled or copied
+    per task. At most two chunks per worker are in flight, so rows arrive in the
+    order they finish, and unconsumed results cannot pile up.
+    """
+    for u, row, _ in _johnsons_rows(
+        graph, max_workers=max_workers, chunk_size=chunk_size, paths=False
+    ):
+        yield u, row
+
+
+def _johnsons_rows[V: Comparable](
+    graph: Graph[V], *, max_workers: int | None, chunk_size: int, paths: bool
+) -> Iterator[tuple[V, dict[V, float], array[int]]]:
+    nodes = list(graph)
+    index = {v: i for i, v in enumerate(nodes)}
+    reweighted_graph, bellman_costs = _reweight(graph)
+    potentials = [bellman_costs[v] for v in nodes]
+    # Dijkstra's runs on a copy of the reweighted graph whose nodes are 0..|V|-1, so
+    # that rows can be sent between processes as flat arrays.
+    int_graph = Graph.from_graph(reweighted_graph, node_fn=index.__getitem__)
+
+    def to_row(i: int, costs: array[float]) -> dict[V, float]:
+        return {
+            v: cost + potentials[j] - potentials[i]
+            for j, (v, cost) in enumerate(zip(nodes, costs, strict=True))
+        }
+
+    for i, costs, parents in dijkstra_shortest_path_arrays(
+        int_graph,
+        range(len(nodes)),
+        paths=paths,
+        max_workers=max_workers,
+        chunk_size=chunk_size,
+    ):
+        yield nodes[i], to_row(i, costs), parents
+
+
+def _reweight[V: Comparable](graph: Graph[V]) -> tuple[Graph[V], dict[V, float]]:
+    """Returns the reweighted graph along with the potential of each node."""
     # Create augmented graph G' that will be fed into the Bellman-Ford algorithm by
     # copying the graph and adding an extra node. Adding a new directed source node
     # ensures that there will be no negative cycles in this new graph. We convert the
@@ -32,7 +143,7 @@ def johnsons_shortest_paths[V: Comparable](graph: Graph[V]) -> dict[V, dict[V, f
     # Convert the Bellman-Ford output of Node[tuple[V]] back into the original type.
     bellman_costs = {
         node.data[0]: cost
-        for node, cost in bellman_ford_shortest_paths(aug_graph, source_node).items()
+        for node, cost in spfa_shortest_paths(aug_graph, source_node).items()
         if node.data
     }
 
@@ -44,13 +155,4 @@ def johnsons_shortest_paths[V: Comparable](graph: Graph[V]) -> dict[V, dict[V, f
             e.start, e.end, e.weight + bellman_costs[e.start] - bellman_costs[e.end]
         ),
     )
-
-    # Run Dijkstra's algorithm over every node in the reweighted graph
-    # to get the transformed shortest path costs.
-    return {
-        u: {
-            v: cost + bellman_costs[v] - bellman_costs[u]
-            for v, cost in dijkstra_shortest_paths(reweighted_graph, u).items()
-        }
-        for u in graph
-    }
+    return reweighted_graph, bellman_costs
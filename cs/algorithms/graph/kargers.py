@@ -1,5 +1,3 @@
-import random
-
 from cs.structures import Edge, Graph, Node
 from cs.util import Comparable
 
@@ -19,12 +17,12 @@ def kargers_min_cut[V: Comparable](orig_graph: Graph[V]) -> set[Edge[V]]:
     )
 
     while len(graph) > 2:
-        edge = random.choice(tuple(graph.edges))
+        edge = graph.random_edge()
 
         # Contract edge (u, v) to new node uv
         uv = Node(edge.start.data + edge.end.data)
 
-        uv_neighbors = graph[edge.start] | graph[edge.end]
+        uv_neighbors = {**graph[edge.start], **graph[edge.end]}
         del uv_neighbors[edge.start]
         del uv_neighbors[edge.end]
 
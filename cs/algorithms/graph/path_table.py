@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from cs.util import Comparable
+
+if TYPE_CHECKING:
+    from array import array
+
+
+@dataclass
+class PathTable[V: Comparable]:
+    """
+    The result of an all-pairs shortest paths algorithm: the distance between every
+    pair of nodes, plus a |V| x |V| table of predecessors stored row by row as int32
+    node indices. predecessors[i * |V| + j] is the index of the node before nodes[j]
+    on a shortest path from nodes[i], or -1 if there is no such node.
+
+    Any shortest path can then be rebuilt by path() without running another search.
+
+    Memory: O(|V|^2), with 4 bytes per pair for the predecessors
+    """
+
+    nodes: list[V]
+    distances: dict[V, dict[V, float]]
+    predecessors: array[int]
+    index: dict[V, int] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.index = {v: i for i, v in enumerate(self.nodes)}
+
+    def path(self, start: V, end: V) -> list[V]:
+        """
+        Returns the nodes on a shortest path from start to end, including both ends,
+        or an empty list if end is unreachable from start.
+
+        Runtime: O(path length)
+        """
+        n = len(self.nodes)
+        i, j = self.index[start], self.index[end]
+        if i != j and self.predecessors[i * n + j] < 0:
+            return []
+        path = [j]
+        while j != i:
+            j = self.predecessors[i * n + j]
+            if len(path) > n:
+                raise ValueError("Negative weight cycle exists in the graph.")
+            path.append(j)
+        return [self.nodes[k] for k in reversed(path)]
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from cs.structures import Graph
+from cs.util import Comparable
+
+
+def strongly_connected_components[V: Comparable](graph: Graph[V]) -> list[set[V]]:
+    """
+    Returns the strongly connected components of a directed graph using Tarjan's
+    algorithm. Two nodes are in the same component if each can reach the other.
+
+    A single DFS numbers the nodes in the order it discovers them, and tracks for
+    each node the lowest number it can reach through its DFS subtree and one more
+    edge into a component that is still open. A node whose lowest reachable number is
+    its own is the root of a component, which is every node discovered after it that
+    is not yet in a component. Finished nodes get a number of |V|, so edges into
+    finished components are ignored without an extra set.
+
+    The DFS keeps an explicit stack of (node, neighbor iterator) pairs instead of
+    recursing, so it works on graphs of any depth.
+
+    Components are returned in reverse topological order, like topological_sort: if
+    there is an edge from component A to component B, then B comes before A.
+
+    Runtime: O(V + E)
+    """
+    n = len(graph)
+    number: dict[V, int] = {}
+    low: dict[V, int] = {}
+    # Nodes that are discovered but not yet in a component.
+    open_nodes: list[V] = []
+    components = []
+    for root in graph:
+        if root in number:
+            continue
+        number[root] = low[root] = len(number)
+        open_nodes.append(root)
+        path = [(root, iter(graph[root]))]
+        while path:
+            v, neighbors = path[-1]
+            for w in neighbors:
+                if w not in number:
+                    number[w] = low[w] = len(number)
+                    open_nodes.append(w)
+                    path.append((w, iter(graph[w])))
+                    break
+                low[v] = min(low[v], number[w])
+            else:
+                path.pop()
+                if path and low[v] < low[path[-1][0]]:
+                    low[path[-1][0]] = low[v]
+                if low[v] == number[v]:
+                    component = set()
+                    while True:
+                        w = open_nodes.pop()
+                        number[w] = n
+                        component.add(w)
+                        if w == v:
+                            break
+                    components.append(component)
+    return components
+
+
+def condensation[V: Comparable](graph: Graph[V]) -> tuple[Graph[int], dict[V, int]]:
+    """
+    Returns the condensation of a directed graph, the DAG with one node per strongly
+    connected component and an edge between two components if any edge of the graph
+    connects them, along with the component of each node. Component i is the i-th
+    component of strongly_connected_components, so every edge i -> j has j < i.
+
+    The condensation is always acyclic, so topological_sort and the level scheduling
+    functions can run on it even when the graph has cycles.
+
+    Runtime: O(V + E)
+    """
+    components = strongly_connected_components(graph)
+    component_of = {v: i for i, component in enumerate(components) for v in component}
+    dag = Graph[int]()
+    dag.add_nodes_from(range(len(components)))
+    dag.add_edges_from(
+        (
+            (component_of[u], component_of[v])
+            for u in graph
+            for v in graph[u]
+            if component_of[u] != component_of[v]
+        ),
+        validate=False,
+    )
+    return dag, component_of
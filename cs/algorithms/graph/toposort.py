@@ -1,32 +1,269 @@
-from cs.structures import Graph
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
 from cs.util import Comparable
 
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from cs.structures import Graph
+
 
 def topological_sort[V: Comparable](graph: Graph[V]) -> list[V]:
     """
     Perform topological sort on a directed acyclic graph.
 
     Node never seen = not in visited
-    Node being processed = in visited but not in stack
-    Node done = in stack
+    Node being processed = in visited but not in done
+    Node done = in done, and appended to stack
+
+    The DFS keeps an explicit stack of (node, neighbor iterator) pairs instead of
+    recursing, so long chains of dependencies cannot overflow the call stack.
 
     Runtime: O(V + E)
     """
-
-    def depth_first_search(v: V, visited: set[V], stack: list[V]) -> None:
-        visited.add(v)
-        for neighbor in graph[v]:
-            if neighbor in visited and neighbor not in stack:
-                raise ValueError(f"Cycle detected in node {v}")
-            if neighbor not in visited:
-                depth_first_search(neighbor, visited, stack)
-        stack.append(v)
-
     stack: list[V] = []
     visited: set[V] = set()
-    for v in graph:
+    done: set[V] = set()
+    for root in graph:
         if len(visited) == len(graph):
             break
-        if v not in visited:
-            depth_first_search(v, visited, stack)
+        if root in visited:
+            continue
+        visited.add(root)
+        path = [(root, iter(graph[root]))]
+        while path:
+            v, neighbors = path[-1]
+            for neighbor in neighbors:
+                if neighbor in visited and neighbor not in done:
+                    raise ValueError(f"Cycle detected in node {v}")
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    path.append((neighbor, iter(graph[neighbor])))
+                    break
+            else:
+                path.pop()
+                done.add(v)
+                stack.append(v)
     return stack
+
+
+def topological_levels[V: Comparable](graph: Graph[V]) -> list[list[V]]:
+    """
+    Groups the nodes of a directed acyclic graph into levels, where every node in a
+    level only has edges to nodes in earlier levels. Like topological_sort, an edge
+    u -> v puts v before u, so level 0 holds the nodes without any outgoing edges.
+
+    Each level is an antichain: no node in it depends on another, so the nodes of a
+    level can all run at once. The number of levels is the number of nodes on the
+    longest path.
+
+    Kahn's algorithm counts the remaining outgoing edges of each node, and a node
+    joins the next level once every node it points to is in a level.
+
+    Runtime: O(V + E)
+    """
+    remaining, dependents = _dependency_counts(graph)
+    level = [v for v, count in remaining.items() if count == 0]
+    levels = []
+    num_leveled = 0
+    while level:
+        levels.append(level)
+        num_leveled += len(level)
+        next_level = []
+        for v in level:
+            for u in dependents[v]:
+                remaining[u] -= 1
+                if remaining[u] == 0:
+                    next_level.append(u)
+        level = next_level
+    if num_leveled < len(graph):
+        raise ValueError(f"Cycle detected in node {_cycle_node(graph, remaining)}")
+    return levels
+
+
+@dataclass
+class Schedule[V: Comparable, R]:
+    """
+    The result of running a callable on every node of a DAG: the return value and
+    the running time in seconds of each call, along with the levels of the graph and
+    the critical path, the chain of dependencies with the longest total running time.
+    No schedule can finish sooner than the critical path, however many workers run.
+    """
+
+    results: dict[V, R]
+    durations: dict[V, float]
+    levels: list[list[V]]
+    critical_path: list[V]
+
+    @property
+    def critical_path_length(self) -> float:
+        """The total running time of the critical path."""
+        return sum(self.durations[v] for v in self.critical_path)
+
+    @property
+    def parallelism(self) -> list[int]:
+        """The number of nodes in each level, which is how many can run at once."""
+        return [len(level) for level in self.levels]
+
+
+def run_topological[V: Comparable, R](
+    graph: Graph[V],
+    fn: Callable[[V], R],
+    *,
+    max_workers: int | None = None,
+    processes: bool = False,
+) -> Schedule[V, R]:
+    """
+    Calls fn on every node of a directed acyclic graph, in the order of
+    topological_sort, and returns the results in a Schedule.
+
+    The calls run in a pool of max_workers threads, or processes if processes is True,
+    in which case fn must be picklable. Rather than waiting for a whole level to
+    finish, each node is submitted as soon as the last node it points to finishes.
+    If a call raises, no new calls are started, and the exception is raised once the
+    running calls finish.
+    """
+    levels = topological_levels(graph)
+    remaining, dependents = _dependency_counts(graph)
+    results: dict[V, R] = {}
+    durations: dict[V, float] = {}
+    pool_type = ProcessPoolExecutor if processes else ThreadPoolExecutor
+    with pool_type(max_workers) as pool:
+        pending = {pool.submit(_timed, fn, v): v for v in levels[0]} if levels else {}
+        try:
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    v = pending.pop(future)
+                    results[v], durations[v] = future.result()
+                    for u in dependents[v]:
+                        remaining[u] -= 1
+                        if remaining[u] == 0:
+                            pending[pool.submit(_timed, fn, u)] = u
+        except BaseException:
+            for future in pending:
+                future.cancel()
+            raise
+    return Schedule(
+        results, durations, levels, _critical_path(graph, levels, durations)
+    )
+
+
+async def run_topological_async[V: Comparable, R](
+    graph: Graph[V],
+    fn: Callable[[V], Awaitable[R]],
+    *,
+    max_concurrency: int | None = None,
+) -> Schedule[V, R]:
+    """
+    The asyncio version of run_topological, for I/O-bound work. Each node becomes a
+    task as soon as the last node it points to finishes, and at most max_concurrency
+    calls are awaited at once. If a call raises, the other running tasks are
+    cancelled and the exception is raised.
+    """
+    levels = topological_levels(graph)
+    remaining, dependents = _dependency_counts(graph)
+    results: dict[V, R] = {}
+    durations: dict[V, float] = {}
+    limit = (
+        asyncio.Semaphore(max_concurrency)
+        if max_concurrency is not None
+        else contextlib.nullcontext()
+    )
+
+    async def run(v: V) -> tuple[R, float]:
+        async with limit:
+            start = time.perf_counter()
+            result = await fn(v)
+            return result, time.perf_counter() - start
+
+    pending = {asyncio.create_task(run(v)): v for v in levels[0]} if levels else {}
+    try:
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                v = pending.pop(task)
+                results[v], durations[v] = task.result()
+                for u in dependents[v]:
+                    remaining[u] -= 1
+                    if remaining[u] == 0:
+                        pending[asyncio.create_task(run(u))] = u
+    except BaseException:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        raise
+    return Schedule(
+        results, durations, levels, _critical_path(graph, levels, durations)
+    )
+
+
+def _dependency_counts[V: Comparable](
+    graph: Graph[V],
+) -> tuple[dict[V, int], dict[V, list[V]]]:
+    """
+    Returns the number of outgoing edges of each node, and the nodes with an edge
+    into each node.
+    """
+    remaining = {v: len(graph[v]) for v in graph}
+    dependents: dict[V, list[V]] = {v: [] for v in graph}
+    for u in graph:
+        for v in graph[u]:
+            dependents[v].append(u)
+    return remaining, dependents
+
+
+def _cycle_node[V: Comparable](graph: Graph[V], remaining: dict[V, int]) -> V:
+    """
+    Returns a node on a cycle, given the counts left over by Kahn's algorithm. Every
+    node with a count left has an edge to another such node, so following those edges
+    must eventually repeat a node.
+    """
+    v = next(v for v, count in remaining.items() if count > 0)
+    seen = set()
+    while v not in seen:
+        seen.add(v)
+        v = next(u for u in graph[v] if remaining[u] > 0)
+    return v
+
+
+def _critical_path[V: Comparable](
+    graph: Graph[V], levels: list[list[V]], durations: dict[V, float]
+) -> list[V]:
+    """
+    Returns the path with the longest total duration, by computing the latest finish
+    time of each node if it started as soon as its dependencies finished.
+    """
+    finish: dict[V, float] = {}
+    slowest: dict[V, V | None] = {}
+    for level in levels:
+        for v in level:
+            dependency = max(graph[v], key=finish.__getitem__, default=None)
+            slowest[v] = dependency
+            finish[v] = durations[v] + (0 if dependency is None else finish[dependency])
+    path: list[V] = []
+    end = max(finish, key=finish.__getitem__, default=None)
+    while end is not None:
+        path.append(end)
+        end = slowest[end]
+    path.reverse()
+    return path
+
+
+def _timed[V, R](fn: Callable[[V], R], v: V) -> tuple[R, float]:
+    """Returns fn(v) along with how many seconds it took."""
+    start = time.perf_counter()
+    result = fn(v)
+    return result, time.perf_counter() - start
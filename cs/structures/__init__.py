@@ -1,8 +1,21 @@
 from .ado.ado_finite_metric import ApproxFiniteMetricOracle
 from .ado.ado_graph import ApproxDistanceOracle
 from .bloom_filter import BloomFilter
+from .connectivity_graph import ConnectivityGraph
+from .csr_graph import CSRGraph
 from .disjoint_set import DisjointSet
-from .graph import DirectedGraph, Edge, Graph, Node, UndirectedGraph
+from .dynamic_dag import DynamicDAG
+from .graph import (
+    COOMatrix,
+    CSRMatrix,
+    DirectedGraph,
+    Edge,
+    EdgesView,
+    Graph,
+    Node,
+    UndirectedGraph,
+)
+from .graph_io import GraphFormat, load_graph, save_graph
 from .hash_table.cuckoo import Cuckoo
 from .hash_table.hash_table import HashTable
 from .hash_table.linear_probing import LinearProbing
@@ -11,6 +24,7 @@ from .heap.binary_heap import BinaryHeap
 from .heap.binomial_heap import BinomialHeap
 from .heap.fibonacci_heap import FibonacciHeap
 from .heap.heap import Heap
+from .heap.radix_heap import RadixHeap
 from .linked_list.doubly_linked_list import DoublyLinkedList
 from .linked_list.linked_list import LinkedList
 from .linked_list.skip_list import SkipList
@@ -37,14 +51,21 @@ __all__ = (
     "BinaryTreeNode",
     "BinomialHeap",
     "BloomFilter",
+    "COOMatrix",
+    "CSRGraph",
+    "CSRMatrix",
+    "ConnectivityGraph",
     "Cuckoo",
     "DirectedGraph",
     "DisjointSet",
     "DoublyLinkedList",
+    "DynamicDAG",
     "Edge",
+    "EdgesView",
     "FibonacciHeap",
     "FischerHeunRMQ",
     "Graph",
+    "GraphFormat",
     "HashTable",
     "Heap",
     "HybridRMQ",
@@ -54,6 +75,7 @@ __all__ = (
     "Node",
     "PrecomputedRMQ",
     "Queue",
+    "RadixHeap",
     "RedBlackTree",
     "RedBlackTreeNode",
     "RobinHood",
@@ -65,5 +87,7 @@ __all__ = (
     "TreeNode",
     "Trie",
     "UndirectedGraph",
+    "load_graph",
     "lru_cache",
+    "save_graph",
 )
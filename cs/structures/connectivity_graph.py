@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, override
+
+from cs.structures.disjoint_set import DisjointSet, UnionMode
+from cs.structures.graph import Graph
+from cs.util import Comparable
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+
+class ConnectivityGraph[V: Comparable](Graph[V]):
+    """
+    A Graph that keeps its connected components in a DisjointSet, so that connectivity
+    queries never search the graph. Every add_node makes a new set, and every edge
+    added unions the sets of its endpoints. Edge directions are ignored, so the
+    components of a directed graph are its weakly connected components.
+
+    A DisjointSet cannot split a set, so removing a node or an edge only marks the
+    components as stale, and they are rebuilt from the edges by the next query.
+
+    Runtime: O(a(V)) amortized add_edge, is_connected and component, or O(V + E) for
+    the first query after a removal
+    """
+
+    def __init__(
+        self,
+        graph: dict[V, Any] | None = None,
+        *,
+        is_directed: bool = False,
+        **kwargs: Any,
+    ) -> None:
+        """Accepts the same arguments as Graph, but is undirected by default."""
+        self._components = DisjointSet[V](mode=UnionMode.SIZE)
+        self._stale = False
+        super().__init__(graph, is_directed=is_directed, **kwargs)
+
+    @property
+    def num_components(self) -> int:
+        return len(self._current_components())
+
+    def is_connected(self, u: V, v: V) -> bool:
+        """Returns whether there is a path between u and v, ignoring directions."""
+        self.verify_nodes_exist(u, v)
+        return self._current_components().is_connected(u, v)
+
+    def component(self, v: V) -> V:
+        """
+        Returns the representative node of the component of v, which is the same
+        for every node in the component until the next edge is added or removed.
+        """
+        self.verify_nodes_exist(v)
+        return self._current_components().find_set(v)
+
+    def components(self) -> list[set[V]]:
+        """Returns the nodes of each connected component."""
+        return self._current_components().itersets()
+
+    @override
+    def add_node(self, v: V) -> None:
+        super().add_node(v)
+        self._components.make_set(v)
+
+    @override
+    def add_nodes_from(self, nodes: Iterable[V]) -> None:
+        for v in nodes:
+            if v not in self:
+                self.add_node(v)
+
+    @override
+    def add_edge(self, start: V, end: V, weight: float = 1, **kwargs: Any) -> None:
+        super().add_edge(start, end, weight, **kwargs)
+        if not self._stale:
+            self._components.union(start, end)
+
+    @override
+    def remove_node(self, v: V) -> None:
+        super().remove_node(v)
+        self._stale = True
+
+    @override
+    def remove_edge(self, start: V, end: V) -> None:
+        super().remove_edge(start, end)
+        self._stale = True
+
+    @override
+    def _add_edges(
+        self,
+        edges: Iterable[tuple[V, V, float, Mapping[str, Any]]],
+        *,
+        validate: bool,
+    ) -> None:
+        """Unions the endpoints of each edge as the bulk construction methods add it."""
+
+        def union_endpoints() -> Iterable[tuple[V, V, float, Mapping[str, Any]]]:
+            for edge in edges:
+                yield edge
+                if not self._stale:
+                    self._components.union(edge[0], edge[1])
+
+        super()._add_edges(union_endpoints(), validate=validate)
+
+    def _current_components(self) -> DisjointSet[V]:
+        """Returns the components, rebuilding them first if they are stale."""
+        if self._stale:
+            self._components = DisjointSet[V](mode=UnionMode.SIZE)
+            for v in self:
+                self._components.make_set(v)
+            for u in self:
+                for v in self[u]:
+                    self._components.union(u, v)
+            self._stale = False
+        return self._components
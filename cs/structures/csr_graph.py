@@ -0,0 +1,747 @@
+from __future__ import annotations
+
+import bisect
+import mmap
+import random
+import struct
+import sys
+from array import array
+from collections.abc import ItemsView, Mapping, ValuesView
+from enum import IntEnum, auto, unique
+from itertools import chain
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Literal,
+    Never,
+    SupportsIndex,
+    cast,
+    overload,
+    override,
+)
+
+from cs.structures.graph import Edge, Graph
+from cs.util import Comparable, formatter
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator, KeysView, Sequence
+
+# magic, version, flags, node table, num nodes, num edges, first node, label bytes
+_SNAPSHOT_HEADER = struct.Struct("<8sIII4xQQqQ")
+_SNAPSHOT_MAGIC = b"CSRGRAPH"
+_SNAPSHOT_VERSION = 1
+_DIRECTED = 1
+_BIG_ENDIAN = 2
+
+
+@unique
+class _NodeTable(IntEnum):
+    RANGE = auto()
+    INT = auto()
+    STR = auto()
+
+
+class CSRGraph[V: Comparable](Graph[V]):
+    """
+    A frozen Graph stored in compressed sparse row (CSR) form.
+
+    Nodes are mapped to the integer ids 0..n-1 in insertion order. The outgoing edges
+    of node i are stored contiguously in targets[offsets[i]:offsets[i + 1]], and the
+    matching edge weights are stored in the same slice of weights. Each edge therefore
+    costs 16 bytes of array storage instead of an Edge object plus a dict entry.
+
+    CSRGraph is a read-only Graph, so every algorithm that accepts a Graph can be run
+    on it directly. Neighbor dicts and Edge objects are built on demand when accessed,
+    and edge kwargs are not stored; only the weight of each edge is kept.
+
+    A CSRGraph can also be saved as a binary snapshot and memory-mapped back with
+    open_snapshot(), in which case the arrays are read straight from the page cache
+    and are shared by every process that opens the same file.
+
+    Predecessors are read from a reverse CSR of the transposed graph, which is built
+    the first time predecessors() or in_degree() is called on a directed graph.
+
+    Runtime: O(1) node lookup, O(deg(v)) neighbor and predecessor access.
+    Memory: O(|V| + |E|)
+    """
+
+    def __init__(
+        self,
+        graph: Graph[V] | dict[V, Any] | None = None,
+        *,
+        is_directed: bool = True,
+        weight: float = 1,
+        **kwargs: Any,
+    ) -> None:
+        """Compresses an existing Graph, or any adjacency list Graph accepts."""
+        if graph is not None and not isinstance(graph, Graph):
+            graph = Graph(graph, is_directed=is_directed, weight=weight, **kwargs)
+        self.is_directed = is_directed if graph is None else graph.is_directed
+        self.shared_edges = False
+        self.weights_only = True
+        nodes: list[V] = [] if graph is None else list(graph)
+        index = {v: i for i, v in enumerate(nodes)}
+        offsets, targets, weights = array("q", [0]), array("q"), array("d")
+        if graph is not None:
+            for u in nodes:
+                for v, edge in graph[u].items():
+                    targets.append(index[v])
+                    weights.append(edge.weight)
+                offsets.append(len(targets))
+        # Arrays, or memoryviews over a mapped snapshot.
+        self._nodes: Sequence[V] = nodes
+        self._index: Mapping[V, int] = index
+        self._offsets: Sequence[int] = offsets
+        self._targets: Sequence[int] = targets
+        self._weights: Sequence[float] = weights
+        # Offsets and sources of the in-edges, built on first use by _reverse().
+        self._reverse_csr: tuple[array[int], array[int]] | None = None
+        self._snapshot: Path | None = None
+
+    @override
+    def __str__(self) -> str:
+        return str(formatter.pformat({u: dict(self[u].items()) for u in self._nodes}))
+
+    @override
+    def __repr__(self) -> str:
+        return (
+            f"CSRGraph(num_nodes={len(self._nodes)}, "
+            f"num_edges={len(self._targets)}, is_directed={self.is_directed})"
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    @override
+    def __reduce_ex__(self, protocol: SupportsIndex) -> str | tuple[Any, ...]:
+        """
+        Mapped snapshots are pickled as their path, so worker processes map the same
+        file instead of receiving a copy of the arrays.
+        """
+        if self._snapshot is not None:
+            return CSRGraph.open_snapshot, (self._snapshot,)
+        return super().__reduce_ex__(protocol)
+
+    @override
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CSRGraph):
+            return NotImplemented
+        return (
+            self.is_directed == other.is_directed
+            and list(self._nodes) == list(other._nodes)
+            and self._offsets == other._offsets
+            and self._targets == other._targets
+            and self._weights == other._weights
+        )
+
+    @override
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    @override
+    def __bool__(self) -> bool:
+        return bool(self._nodes)
+
+    @override
+    def __contains__(self, v: V) -> bool:
+        return v in self._index
+
+    @override
+    def __getitem__(self, v: V) -> Mapping[V, Edge[V]]:
+        """
+        Returns a read-only view of the out-edges of v over the CSR arrays, so that
+        iterating over the neighbors allocates nothing, and Edge objects are only built
+        for the items and values that are read. Modifying the edges does not modify
+        the graph.
+        """
+        self.verify_nodes_exist(v)
+        return _CSRRow(
+            v,
+            self._nodes,
+            self._index,
+            self._targets,
+            self._weights,
+            self._edge_range(self._index[v]),
+        )
+
+    @override
+    def __iter__(self) -> Iterator[V]:
+        yield from self._nodes
+
+    @property
+    @override
+    def nodes(self) -> KeysView[V]:
+        return self._index.keys()
+
+    @property
+    @override
+    def num_edges(self) -> int:
+        return len(self._targets)
+
+    @classmethod
+    @override
+    def from_graph(
+        cls,
+        graph: Graph[V],
+        *,
+        is_directed: bool = True,
+        node_fn: Callable[[V], Any] = lambda x: x,
+        edge_fn: Callable[[Edge[V]], Edge[V]] = lambda x: x,
+    ) -> CSRGraph[Any]:
+        """
+        Applies the same transformations as Graph.from_graph, then compresses the
+        result. To compress a Graph without any transformations, use CSRGraph(graph).
+        """
+        return CSRGraph(
+            Graph.from_graph(
+                graph, is_directed=is_directed, node_fn=node_fn, edge_fn=edge_fn
+            )
+        )
+
+    @classmethod
+    @override
+    def from_edgelist(
+        cls,
+        edge_list: Iterable[Edge[V]],
+        *,
+        is_directed: bool = True,
+        nodes: Iterable[V] = (),
+    ) -> CSRGraph[V]:
+        """
+        Builds the graph without creating an intermediate dict-of-dicts. As in
+        Graph.add_edge, a repeated edge replaces the weight of the earlier one.
+        """
+        node_list = list(dict.fromkeys(nodes))
+        index = {v: i for i, v in enumerate(node_list)}
+        sources, targets, weights = array("q"), array("q"), array("d")
+        for edge in edge_list:
+            for v in (edge.start, edge.end):
+                if v not in index:
+                    index[v] = len(node_list)
+                    node_list.append(v)
+            i, j = index[edge.start], index[edge.end]
+            sources.append(i)
+            targets.append(j)
+            weights.append(edge.weight)
+            if not is_directed:
+                sources.append(j)
+                targets.append(i)
+                weights.append(edge.weight)
+        return cls._from_coo(
+            node_list, sources, targets, weights, is_directed=is_directed
+        )
+
+    @classmethod
+    def from_file(
+        cls,
+        path: str | Path,
+        *,
+        is_directed: bool = True,
+        node_fn: Callable[[str], Any] = int,
+    ) -> CSRGraph[Any]:
+        """
+        Reads a whitespace-separated edge list with one "start end [weight]" edge per
+        line. See cs.structures.graph_io for the other supported formats.
+        """
+        from cs.structures.graph_io import read_edgelist
+
+        return cls.from_edgelist(
+            read_edgelist(path, node_fn=node_fn), is_directed=is_directed
+        )
+
+    @classmethod
+    def _from_coo(
+        cls,
+        nodes: list[V],
+        sources: array[int],
+        targets: array[int],
+        weights: array[float],
+        *,
+        is_directed: bool,
+    ) -> CSRGraph[V]:
+        """
+        Converts parallel (source, target, weight) arrays into CSR form using a stable
+        counting sort on the source ids, so each row keeps the order edges were added.
+        """
+        n, m = len(nodes), len(sources)
+        offsets = array("q", bytes(8 * (n + 1)))
+        for u in sources:
+            offsets[u + 1] += 1
+        for i in range(n):
+            offsets[i + 1] += offsets[i]
+
+        order = array("q", bytes(8 * m))
+        position = offsets[:-1]
+        for k, u in enumerate(sources):
+            order[position[u]] = k
+            position[u] += 1
+
+        graph = CSRGraph[V](is_directed=is_directed)
+        graph._nodes = nodes
+        graph._index = {v: i for i, v in enumerate(nodes)}
+        csr_offsets, csr_targets, csr_weights = array("q", [0]), array("q"), array("d")
+        for i in range(n):
+            # Deduplicate repeated edges, keeping the first position and last weight.
+            row = {targets[k]: weights[k] for k in order[offsets[i] : offsets[i + 1]]}
+            csr_targets.extend(row.keys())
+            csr_weights.extend(row.values())
+            csr_offsets.append(len(csr_targets))
+        graph._offsets, graph._targets = csr_offsets, csr_targets
+        graph._weights = csr_weights
+        return graph
+
+    @classmethod
+    def open_snapshot(cls, path: str | Path) -> CSRGraph[Any]:
+        """
+        Memory-maps a snapshot written by save_snapshot(). No edges are read when the
+        file is opened; pages are loaded by the OS as they are accessed. Integer node
+        tables are also mapped, while string node names are decoded up front.
+
+        Runtime: O(1) for integer nodes, O(|V|) for string nodes
+        """
+        with Path(path).open("rb") as f:
+            view = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+        if (
+            len(view) < _SNAPSHOT_HEADER.size
+            or view[: len(_SNAPSHOT_MAGIC)] != _SNAPSHOT_MAGIC
+        ):
+            raise ValueError(f"{path} is not a graph snapshot.")
+        _, version, flags, table, n, m, first, label_bytes = (
+            _SNAPSHOT_HEADER.unpack_from(view)
+        )
+        if version != _SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported snapshot version: {version}")
+        if bool(flags & _BIG_ENDIAN) != (sys.byteorder == "big"):
+            raise ValueError("Snapshot was written with a different byte order.")
+        size = _SNAPSHOT_HEADER.size + 8 * (n + 1 + 2 * m)
+        if table == _NodeTable.INT:
+            size += 8 * n
+        elif table == _NodeTable.STR:
+            size += 8 * (n + 1) + label_bytes
+        if len(view) < size:
+            raise ValueError(f"{path} is truncated.")
+
+        position = _SNAPSHOT_HEADER.size
+
+        def section(length: int) -> memoryview:
+            nonlocal position
+            start, position = position, position + length
+            return view[start:position]
+
+        graph = CSRGraph[Any](is_directed=bool(flags & _DIRECTED))
+        graph._offsets = section(8 * (n + 1)).cast("q")
+        graph._targets = section(8 * m).cast("q")
+        graph._weights = section(8 * m).cast("d")
+        nodes: Sequence[Any]
+        match table:
+            case _NodeTable.RANGE:
+                nodes = range(first, first + n)
+            case _NodeTable.INT:
+                nodes = section(8 * n).cast("q")
+            case _NodeTable.STR:
+                label_offsets = section(8 * (n + 1)).cast("q")
+                labels = section(label_bytes)
+                nodes = [
+                    str(labels[label_offsets[i] : label_offsets[i + 1]], "utf-8")
+                    for i in range(n)
+                ]
+            case _:
+                raise ValueError(f"Unknown node table: {table}")
+        graph._nodes = nodes
+        graph._index = _NodeIndex(nodes)
+        graph._snapshot = Path(path).resolve()
+        return graph
+
+    def save_snapshot(self, path: str | Path) -> None:
+        """
+        Writes the graph in a versioned binary format that open_snapshot() can map:
+        a fixed header followed by the offsets, targets and weights arrays and the node
+        table. Nodes must all be ints or all be strs. Consecutive integer nodes are
+        stored as a range, so the common case of nodes 0..n-1 needs no table at all.
+        """
+        nodes = self._nodes
+        n, m = len(nodes), len(self._targets)
+        first = 0
+        tables: list[bytes] = []
+        label_bytes = 0
+        if all(type(v) is int for v in nodes):
+            int_nodes = cast("Sequence[int]", nodes)
+            first = int_nodes[0] if n else 0
+            if all(v == first + i for i, v in enumerate(int_nodes)):
+                table = _NodeTable.RANGE
+            else:
+                table = _NodeTable.INT
+                tables.append(array("q", int_nodes).tobytes())
+        elif all(type(v) is str for v in nodes):
+            table = _NodeTable.STR
+            labels = [str(v).encode() for v in nodes]
+            label_offsets = array("q", [0])
+            for label in labels:
+                label_offsets.append(label_offsets[-1] + len(label))
+            label_bytes = label_offsets[-1]
+            tables += [label_offsets.tobytes(), b"".join(labels)]
+        else:
+            raise TypeError("Snapshots require all nodes to be ints or all strs.")
+
+        flags = _DIRECTED * self.is_directed | _BIG_ENDIAN * (sys.byteorder == "big")
+        with Path(path).open("wb") as f:
+            f.write(
+                _SNAPSHOT_HEADER.pack(
+                    _SNAPSHOT_MAGIC,
+                    _SNAPSHOT_VERSION,
+                    flags,
+                    table,
+                    n,
+                    m,
+                    first,
+                    label_bytes,
+                )
+            )
+            f.write(array("q", self._offsets).tobytes())
+            f.write(array("q", self._targets).tobytes())
+            f.write(array("d", self._weights).tobytes())
+            f.writelines(tables)
+
+    @override
+    def verify_nodes_exist(self, *v_ids: V) -> None:
+        for v in v_ids:
+            if v not in self._index:
+                raise KeyError(f"Node not found: {v}")
+
+    @override
+    def adj(self, v: V) -> KeysView[V]:
+        self.verify_nodes_exist(v)
+        nodes = self._nodes
+        return dict.fromkeys(
+            nodes[self._targets[k]] for k in self._edge_range(self._index[v])
+        ).keys()
+
+    @override
+    def degree(self, v: V) -> int:
+        self.verify_nodes_exist(v)
+        if self.is_directed:
+            return self.out_degree(v) + self.in_degree(v)
+        return len(self._edge_range(self._index[v]))
+
+    @override
+    def out_degree(self, v: V) -> int:
+        if not self.is_directed:
+            raise NotImplementedError("Graph is undirected; use degree() instead.")
+        self.verify_nodes_exist(v)
+        return len(self._edge_range(self._index[v]))
+
+    @override
+    def in_degree(self, v: V) -> int:
+        """Counts the row of v in the reverse CSR, excluding a self-loop."""
+        if not self.is_directed:
+            raise NotImplementedError("Graph is undirected; use degree() instead.")
+        self.verify_nodes_exist(v)
+        i = self._index[v]
+        offsets, sources = self._reverse()
+        row = sources[offsets[i] : offsets[i + 1]]
+        return len(row) - (i in row)
+
+    @property
+    @override
+    def has_predecessor_index(self) -> bool:
+        """The reverse CSR is built by the first call to predecessors or in_degree."""
+        return True
+
+    @override
+    def predecessors(self, v: V) -> KeysView[V]:
+        """Reads the row of v in the reverse CSR."""
+        self.verify_nodes_exist(v)
+        if not self.is_directed:
+            return self.adj(v)
+        i = self._index[v]
+        offsets, sources = self._reverse()
+        nodes = self._nodes
+        return dict.fromkeys(
+            nodes[sources[k]] for k in range(offsets[i], offsets[i + 1])
+        ).keys()
+
+    @override
+    def has_edge(self, start: V, end: V) -> bool:
+        if start not in self._index or end not in self._index:
+            return False
+        j = self._index[end]
+        return any(self._targets[k] == j for k in self._edge_range(self._index[start]))
+
+    @override
+    def has_integer_weights(self, max_weight: float = Graph.INFINITY) -> bool:
+        """Scans the weight array, so no Edge objects are built."""
+        return all(0 <= w <= max_weight and w.is_integer() for w in self._weights)
+
+    @override
+    def random_edge(self) -> Edge[V]:
+        """Picks a random edge position, then finds its source row by binary search."""
+        if not self._targets:
+            raise IndexError("Graph has no edges.")
+        k = random.randrange(len(self._targets))
+        i = bisect.bisect_right(self._offsets, k) - 1
+        return Edge(self._nodes[i], self._nodes[self._targets[k]], self._weights[k])
+
+    @override
+    def add_node(self, v: V) -> Never:
+        raise TypeError("CSRGraph is read-only; build a Graph instead.")
+
+    @override
+    def add_nodes_from(self, nodes: Iterable[V]) -> Never:
+        raise TypeError("CSRGraph is read-only; build a Graph instead.")
+
+    @override
+    def add_edge(self, start: V, end: V, weight: float = 1, **kwargs: Any) -> Never:
+        raise TypeError("CSRGraph is read-only; build a Graph instead.")
+
+    @override
+    def add_edges_from(
+        self,
+        edges: Iterable[Edge[V] | tuple[V, V] | tuple[V, V, float]],
+        *,
+        validate: bool = True,
+    ) -> Never:
+        raise TypeError("CSRGraph is read-only; build a Graph instead.")
+
+    @override
+    def _add_edges(
+        self,
+        edges: Iterable[tuple[V, V, float, Mapping[str, Any]]],
+        *,
+        validate: bool,
+    ) -> Never:
+        raise TypeError("CSRGraph is read-only; build a Graph instead.")
+
+    @override
+    def remove_node(self, v: V) -> Never:
+        raise TypeError("CSRGraph is read-only; build a Graph instead.")
+
+    @override
+    def remove_edge(self, start: V, end: V) -> Never:
+        raise TypeError("CSRGraph is read-only; build a Graph instead.")
+
+    @overload
+    def is_bipartite(self, *, witness: Literal[False] = False) -> bool: ...
+
+    @overload
+    def is_bipartite(
+        self, *, witness: Literal[True]
+    ) -> tuple[set[V], set[V]] | list[V]: ...
+
+    @override
+    def is_bipartite(
+        self, *, witness: bool = False
+    ) -> bool | tuple[set[V], set[V]] | list[V]:
+        """
+        Runs the same BFS as Graph.is_bipartite over the node ids, reading neighbors
+        straight from the CSR arrays and, for a directed graph, the reverse CSR.
+        """
+        nodes, offsets, targets = self._nodes, self._offsets, self._targets
+        reverse = self._reverse() if self.is_directed else None
+        n = len(nodes)
+        # 0 for uncolored, 1 for the first side, 2 for the second.
+        color = bytearray(n)
+        parents = array("q", bytes(8 * n))
+        queue: list[int] = []
+        for root in range(n):
+            if color[root]:
+                continue
+            color[root] = 1 if offsets[root] < offsets[root + 1] else 2
+            queue.append(root)
+            for u in queue:
+                neighbors: Iterable[int] = targets[offsets[u] : offsets[u + 1]]
+                if reverse is not None:
+                    reverse_offsets, sources = reverse
+                    neighbors = chain(
+                        neighbors, sources[reverse_offsets[u] : reverse_offsets[u + 1]]
+                    )
+                for v in neighbors:
+                    if not color[v]:
+                        color[v] = 3 - color[u]
+                        parents[v] = u
+                        queue.append(v)
+                    elif color[v] == color[u]:
+                        if not witness:
+                            return False
+                        u_path, v_path = [u], [v]
+                        while u_path[-1] != v_path[-1]:
+                            u_path.append(parents[u_path[-1]])
+                            v_path.append(parents[v_path[-1]])
+                        u_path.reverse()
+                        return [nodes[i] for i in u_path + v_path[:-1]]
+            queue.clear()
+        if not witness:
+            return True
+        sides: tuple[set[V], set[V]] = (set(), set())
+        for i, node in enumerate(nodes):
+            sides[color[i] - 1].add(node)
+        return sides
+
+    def _edge_range(self, i: int) -> range:
+        return range(self._offsets[i], self._offsets[i + 1])
+
+    def _reverse(self) -> tuple[Sequence[int], Sequence[int]]:
+        """
+        Returns the offsets and sources of the transposed graph, where the edges into
+        node i come from sources[offsets[i]:offsets[i + 1]] in increasing source order.
+        They are built with a counting sort on the targets the first time they are
+        needed, which takes O(|V| + |E|), and then kept. An undirected graph is its own
+        transpose.
+        """
+        if not self.is_directed:
+            return self._offsets, self._targets
+        if self._reverse_csr is None:
+            n, targets = len(self._nodes), self._targets
+            offsets = array("q", bytes(8 * (n + 1)))
+            for j in targets:
+                offsets[j + 1] += 1
+            for i in range(n):
+                offsets[i + 1] += offsets[i]
+            sources = array("q", bytes(8 * len(targets)))
+            position = offsets[:-1]
+            for i in range(n):
+                for k in self._edge_range(i):
+                    j = targets[k]
+                    sources[position[j]] = i
+                    position[j] += 1
+            self._reverse_csr = offsets, sources
+        return self._reverse_csr
+
+
+class _CSRRow[V: Comparable](Mapping[V, Edge[V]]):
+    """
+    The out-edges of one node of a CSRGraph, read from the slice of the targets and
+    weights arrays given by edge_range. Lookups scan the row, which takes O(deg(v)).
+    """
+
+    __slots__ = ("_edge_range", "_index", "_nodes", "_start", "_targets", "_weights")
+
+    def __init__(
+        self,
+        start: V,
+        nodes: Sequence[V],
+        index: Mapping[V, int],
+        targets: Sequence[int],
+        weights: Sequence[float],
+        edge_range: range,
+    ) -> None:
+        self._start = start
+        self._nodes = nodes
+        self._index = index
+        self._targets = targets
+        self._weights = weights
+        self._edge_range = edge_range
+
+    @override
+    def __repr__(self) -> str:
+        return repr(dict(self.items()))
+
+    @override
+    def __len__(self) -> int:
+        return len(self._edge_range)
+
+    @override
+    def __iter__(self) -> Iterator[V]:
+        nodes, targets = self._nodes, self._targets
+        for k in self._edge_range:
+            yield nodes[targets[k]]
+
+    @override
+    def __contains__(self, v: object) -> bool:
+        return self._find(cast("V", v)) is not None
+
+    @override
+    def __getitem__(self, v: V) -> Edge[V]:
+        k = self._find(v)
+        if k is None:
+            raise KeyError(v)
+        return Edge(self._start, v, self._weights[k])
+
+    @override
+    def items(self) -> ItemsView[V, Edge[V]]:
+        return _CSRRowItems(self)
+
+    @override
+    def values(self) -> ValuesView[Edge[V]]:
+        return _CSRRowValues(self)
+
+    def edges(self) -> Iterator[Edge[V]]:
+        """Builds the Edge objects of the row in order."""
+        start, nodes, targets, weights = (
+            self._start,
+            self._nodes,
+            self._targets,
+            self._weights,
+        )
+        for k in self._edge_range:
+            yield Edge(start, nodes[targets[k]], weights[k])
+
+    def edge_items(self) -> Iterator[tuple[V, Edge[V]]]:
+        """Same as edges(), but pairs each Edge with its end node."""
+        start, nodes, targets, weights = (
+            self._start,
+            self._nodes,
+            self._targets,
+            self._weights,
+        )
+        for k in self._edge_range:
+            v = nodes[targets[k]]
+            yield v, Edge(start, v, weights[k])
+
+    def _find(self, v: V) -> int | None:
+        """Returns the position of the edge to v in the arrays, if there is one."""
+        j = self._index.get(v)
+        if j is None:
+            return None
+        targets = self._targets
+        for k in self._edge_range:
+            if targets[k] == j:
+                return k
+        return None
+
+
+class _CSRRowItems[V: Comparable](ItemsView[V, Edge[V]]):
+    _mapping: _CSRRow[V]
+
+    @override
+    def __iter__(self) -> Iterator[tuple[V, Edge[V]]]:
+        return self._mapping.edge_items()
+
+
+class _CSRRowValues[V: Comparable](ValuesView[Edge[V]]):
+    _mapping: _CSRRow[V]
+
+    @override
+    def __iter__(self) -> Iterator[Edge[V]]:
+        return self._mapping.edges()
+
+
+class _NodeIndex[V: Comparable](Mapping[V, int]):
+    """
+    Maps the nodes of a mapped snapshot to their ids. A range of integer nodes is
+    inverted arithmetically, and any other node table is inverted into a dict the
+    first time it is used, so that opening a snapshot stays O(1).
+    """
+
+    __slots__ = ("_index", "_nodes")
+
+    def __init__(self, nodes: Sequence[V]) -> None:
+        self._nodes = nodes
+        self._index: dict[V, int] | None = None
+
+    @override
+    def __getitem__(self, v: V) -> int:
+        if isinstance(self._nodes, range):
+            if isinstance(v, int) and v in self._nodes:
+                return self._nodes.index(v)
+            raise KeyError(v)
+        if self._index is None:
+            self._index = {u: i for i, u in enumerate(self._nodes)}
+        return self._index[v]
+
+    @override
+    def __iter__(self) -> Iterator[V]:
+        return iter(self._nodes)
+
+    @override
+    def __len__(self) -> int:
+        return len(self._nodes)
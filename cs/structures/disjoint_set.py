@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections.abc import Hashable, Iterator
+from collections.abc import Hashable, Iterable, Iterator
 from dataclasses import dataclass
 from enum import Enum, auto, unique
 from typing import override
@@ -84,18 +84,26 @@ class DisjointSet[T]:
             self.data_to_index[elem] = new_node_index
             self.num_roots += 1
 
+    def make_sets(self, elems: Iterable[T]) -> None:
+        """
+        Makes a set of each element, like calling make_set on each of them, without
+        the per-call overhead. Elements that are already in a set are skipped.
+        """
+        node_data, data_to_index = self.node_data, self.data_to_index
+        num_nodes = len(node_data)
+        for elem in elems:
+            if elem not in data_to_index:
+                data_to_index[elem] = len(node_data)
+                node_data.append(DisjointSetNode(elem, len(node_data)))
+        self.num_roots += len(node_data) - num_nodes
+
     def find_set(self, elem: T) -> T:
         """
         Returns the root parent of x using path splitting, which was proven by
         Patwary, Mostofa Ali et al. to be the most efficient variant.
         https://algocoding.wordpress.com/2015/05/13/simple-union-find-techniques/
         """
-        if elem not in self.data_to_index:
-            raise KeyError(f"Disjoint set does not contain element: {elem}")
-        x = self[elem]
-        while x != x.parent:
-            x, x.parent = x.parent, x.parent.parent
-        return x.data
+        return self._find_root(elem).data
 
     def union(self, a: T, b: T) -> None:
         """
@@ -103,10 +111,9 @@ class DisjointSet[T]:
         disjoint set tree will be more flat.
         Returns True if two sets were merges, False otherwise.
         """
-        a, b = self.find_set(a), self.find_set(b)
-        if a == b:
+        x, y = self._find_root(a), self._find_root(b)
+        if x is y:
             return
-        x, y = self[a], self[b]
 
         if self.mode is UnionMode.SIZE:
             if x.size < y.size:
@@ -122,13 +129,22 @@ class DisjointSet[T]:
                 x.rank += 1
 
         elif self.mode is UnionMode.INDEX:
-            if self.data_to_index[a] < self.data_to_index[b]:
+            if x.index < y.index:
                 x.parent = y.parent
             else:
                 y.parent = x.parent
 
         self.num_roots -= 1
 
+    def _find_root(self, elem: T) -> DisjointSetNode[T]:
+        """Returns the root node of the set of elem, splitting the path to it."""
+        if (i := self.data_to_index.get(elem)) is None:
+            raise KeyError(f"Disjoint set does not contain element: {elem}")
+        x = self.node_data[i]
+        while x is not x.parent:
+            x, x.parent = x.parent, x.parent.parent
+        return x
+
     def is_connected(self, x: T, y: T) -> bool:
         """
         :param x: first element
@@ -144,29 +160,27 @@ class DisjointSet[T]:
         The roots dict shares the set references with entries in the same set.
         """
         roots: dict[T, set[T]] = {}
-        seen_nodes: dict[DisjointSetNode[T], T] = {}
+        # Roots of the nodes already visited, by node index.
+        seen_nodes: dict[int, T] = {}
         for node in self.node_data:
             curr = node
 
-            unseen_nodes = set()
-            cached = False
-            while curr != curr.parent:
-                if curr in seen_nodes:
-                    root = seen_nodes[curr]
-                    roots[root].add(node.data)
-                    cached = True
+            unseen_nodes = []
+            while curr is not curr.parent:
+                if curr.index in seen_nodes:
+                    root = seen_nodes[curr.index]
                     break
-                unseen_nodes.add(curr)
+                unseen_nodes.append(curr.index)
                 curr = curr.parent
+            else:
+                root = curr.data
 
-            root = curr.data
-            for new_node in unseen_nodes:
-                seen_nodes[new_node] = root
+            for i in unseen_nodes:
+                seen_nodes[i] = root
 
-            if not cached:
-                if root not in roots:
-                    roots[root] = set()
-                roots[root].add(node.data)
+            if root not in roots:
+                roots[root] = set()
+            roots[root].add(node.data)
         return list(roots.values())
 
     def naive_itersets(self) -> list[set[T]]:
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+from itertools import chain
+from typing import TYPE_CHECKING, Any, override
+
+from cs.structures.graph import Edge, Graph
+from cs.util import Comparable
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+
+class DynamicDAG[V: Comparable](Graph[V]):
+    """
+    A directed acyclic Graph that keeps a topological order of its nodes up to date
+    as edges are added, using the Pearce-Kelly algorithm. Any edge that would create
+    a cycle is rejected with a ValueError, and the graph is left unchanged.
+
+    Every node has a rank, its index in the order. The order follows the same
+    convention as topological_sort: an edge u -> v means u depends on v, so every
+    edge has rank(v) < rank(u). Adding an edge u -> v that already agrees with the
+    order costs O(1). Otherwise, only the nodes ranked between u and v can need to
+    move: a backward search from u finds the nodes in that range that can reach u,
+    which fails if it reaches v, and a forward search from v finds the nodes in that
+    range that v can reach. The two sets then swap places, reusing the same ranks,
+    with the nodes that v reaches first. Nodes outside the affected region never
+    move, so edges added to a large graph usually only touch a handful of nodes.
+
+    Runtime: O(1) order, rank and add_node, O(|V| + |E|) construction, and add_edge is
+    proportional to the edges of the affected region, with O(d log d) to sort its d
+    nodes
+    """
+
+    def __init__(
+        self, graph: dict[V, Any] | None = None, *, weight: float = 1, **kwargs: Any
+    ) -> None:
+        """
+        Accepts any adjacency list Graph accepts. Raises a ValueError if it contains
+        a cycle.
+        """
+        self._order: list[V] = []
+        self._rank: dict[V, int] = {}
+        super().__init__(graph, weight=weight, index_predecessors=True, **kwargs)
+        self._reorder()
+
+    @property
+    def order(self) -> Sequence[V]:
+        """
+        A live view of the nodes in topological order, where each node comes after
+        every node it has an edge to, like topological_sort. Do not modify it.
+        """
+        return self._order
+
+    def rank(self, v: V) -> int:
+        """Returns the index of v in the topological order."""
+        self.verify_nodes_exist(v)
+        return self._rank[v]
+
+    @override
+    def add_node(self, v: V) -> None:
+        """New nodes have no edges, so they can go at the end of the order."""
+        super().add_node(v)
+        self._rank[v] = len(self._order)
+        self._order.append(v)
+
+    @override
+    def add_nodes_from(self, nodes: Iterable[V]) -> None:
+        for v in nodes:
+            if v not in self:
+                self.add_node(v)
+
+    @override
+    def add_edges_from(
+        self,
+        edges: Iterable[Edge[V] | tuple[V, V] | tuple[V, V, float]],
+        *,
+        validate: bool = True,
+    ) -> None:
+        """
+        Adds the edges one at a time with add_edge, so each edge that would create a
+        cycle raises a ValueError, leaving the edges before it in the graph.
+        """
+        for edge in edges:
+            if isinstance(edge, Edge):
+                start, end, weight = edge.start, edge.end, edge.weight
+                kwargs = dict(edge.kwargs)
+            else:
+                start, end, weight = edge[0], edge[1], edge[2] if len(edge) == 3 else 1
+                kwargs = {}
+            if not validate:
+                self.add_nodes_from((start, end))
+            self.add_edge(start, end, weight, **kwargs)
+
+    @override
+    def add_edge(self, start: V, end: V, weight: float = 1, **kwargs: Any) -> None:
+        """
+        Connects the edge start -> end, moving nodes as needed so that end stays
+        before start. Raises a ValueError if end can already reach start.
+        """
+        self.verify_nodes_exist(start, end)
+        if not self.has_edge(start, end):
+            self._make_room(start, end)
+        super().add_edge(start, end, weight, **kwargs)
+
+    @override
+    def remove_node(self, v: V) -> None:
+        """The nodes after v in the order move up by one, which takes O(|V|)."""
+        super().remove_node(v)
+        i = self._rank.pop(v)
+        del self._order[i]
+        for j in range(i, len(self._order)):
+            self._rank[self._order[j]] = j
+
+    def _make_room(self, start: V, end: V) -> None:
+        """Reorders the affected region so that end comes before start."""
+        rank, order = self._rank, self._order
+        lower, upper = rank[start], rank[end]
+        if lower > upper:
+            return
+        if lower == upper:
+            raise ValueError(f"Edge {start} -> {end} would create a cycle.")
+        # Nodes ranked between start and end that can reach start.
+        backward = [start]
+        seen = {start}
+        for u in backward:
+            for v in self.predecessors(u):
+                if v == end:
+                    raise ValueError(f"Edge {start} -> {end} would create a cycle.")
+                if v not in seen and rank[v] < upper:
+                    seen.add(v)
+                    backward.append(v)
+        # Nodes ranked between start and end that end can reach.
+        forward = [end]
+        seen = {end}
+        for u in forward:
+            for v in self._graph[u]:
+                if v not in seen and rank[v] > lower:
+                    seen.add(v)
+                    forward.append(v)
+        forward.sort(key=rank.__getitem__)
+        backward.sort(key=rank.__getitem__)
+        ranks = sorted(rank[v] for v in chain(forward, backward))
+        for v, i in zip(chain(forward, backward), ranks, strict=True):
+            rank[v] = i
+            order[i] = v
+
+    def _reorder(self) -> None:
+        """
+        Recomputes the whole order with Kahn's algorithm, starting from the nodes
+        without outgoing edges, or raises a ValueError if the graph has a cycle.
+        """
+        out_degrees = {v: len(self._graph[v]) for v in self}
+        order = [v for v, degree in out_degrees.items() if degree == 0]
+        for u in order:
+            for v in self.predecessors(u):
+                out_degrees[v] -= 1
+                if out_degrees[v] == 0:
+                    order.append(v)
+        if len(order) < len(self):
+            raise ValueError("Graph contains a cycle.")
+        self._order = order
+        self._rank = {v: i for i, v in enumerate(order)}
@@ -1,10 +1,29 @@
 from __future__ import annotations
 
-from collections.abc import Callable, Iterable, Iterator, KeysView, Mapping, Sequence
+import random
+from collections.abc import (
+    Callable,
+    ItemsView,
+    Iterable,
+    Iterator,
+    KeysView,
+    Mapping,
+    Sequence,
+    ValuesView,
+)
+from collections.abc import Set as AbstractSet
 from dataclasses import dataclass
-from typing import Any, override
+from itertools import chain
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Literal, cast, overload, override
 
-from cs.util import Comparable, formatter
+from cs.util import Comparable, dfield, formatter
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+
+_NO_KWARGS: Mapping[str, Any] = MappingProxyType({})
 
 
 @dataclass(init=False)
@@ -19,7 +38,8 @@ class Graph[V: Comparable]:
 
     INFINITY = float("inf")
     INT_INFINITY = 1 << 20
-    _graph: dict[V, dict[V, Edge[V]]]
+    # Neighbor dicts hold Edge objects, or bare weights if weights_only is set.
+    _graph: dict[V, dict[V, Edge[V] | float]]
     is_directed: bool
 
     def __init__(
@@ -28,34 +48,42 @@ class Graph[V: Comparable]:
         *,
         is_directed: bool = True,
         weight: float = 1,
+        index_predecessors: bool = False,
+        shared_edges: bool = False,
+        weights_only: bool = False,
         **kwargs: Any,
     ) -> None:
-        """Default constructor assumes an adjacency list representation."""
+        """
+        Default constructor assumes an adjacency list representation.
+
+        If index_predecessors is set on a directed graph, a reverse adjacency index is
+        kept in sync with every add/remove call, which makes predecessors(), in_degree()
+        and remove_node() proportional to the node's degree instead of |V| + |E|.
+
+        If shared_edges is set on an undirected graph, both directions of an edge share
+        a single Edge object, which halves the number of edges stored. In that case,
+        graph[v][u] may be the Edge(u, v) that was added, rather than Edge(v, u).
+
+        If weights_only is set, each edge is stored as its bare weight, and graph[v]
+        is a read-only view that builds Edge objects as they are accessed. Edges cannot
+        have extra attributes, so adding one with kwargs raises a TypeError.
+        """
         self.is_directed = is_directed
+        self.shared_edges = shared_edges
+        self.weights_only = weights_only
         self._graph = {}
+        self._num_edges = 0
+        # Index of edge keys for random_edge(), built the first time it is called.
+        self._edge_keys: list[tuple[V, V]] | None = None
+        self._edge_positions: dict[tuple[V, V], int] = {}
+        self._predecessors: dict[V, dict[V, None]] | None = (
+            {} if index_predecessors and is_directed else None
+        )
         if graph is not None:
-            for u in graph:
-                self.add_node(u)
-            for u in graph:
-                for v in graph[u]:
-                    if v not in self._graph:
-                        self.add_node(v)
-                    if isinstance(graph[u], dict):
-                        edge = graph[u][v]
-                        if isinstance(edge, Edge):
-                            self.add_edge(**edge)
-                        elif isinstance(edge, dict):
-                            self.add_edge(u, v, **edge)
-                        elif isinstance(edge, int | float):
-                            self.add_edge(u, v, weight=edge, **kwargs)
-                        else:
-                            raise TypeError(f"{edge} is not a supported Edge type.")
-                    elif isinstance(graph[u], list | tuple | set | frozenset):
-                        # Values are some other collection; only contains node names.
-                        # Use default weight parameter.
-                        self.add_edge(u, v, weight)
-                    else:
-                        raise TypeError(f"{graph[u]} is not a supported Edge mapping.")
+            self.add_nodes_from(graph)
+            self._add_edges(
+                self._parse_adjacency_list(graph, weight, kwargs), validate=False
+            )
 
     @override
     def __str__(self) -> str:
@@ -70,9 +98,11 @@ class Graph[V: Comparable]:
     def __contains__(self, v: V) -> bool:
         return v in self._graph
 
-    def __getitem__(self, v: V) -> dict[V, Edge[V]]:
+    def __getitem__(self, v: V) -> Mapping[V, Edge[V]]:
         self.verify_nodes_exist(v)
-        return self._graph[v]
+        if self.weights_only:
+            return _WeightsView(v, cast("dict[V, float]", self._graph[v]))
+        return cast("dict[V, Edge[V]]", self._graph[v])
 
     def __iter__(self) -> Iterator[V]:
         yield from self._graph
@@ -82,8 +112,14 @@ class Graph[V: Comparable]:
         return self._graph.keys()
 
     @property
-    def edges(self) -> tuple[Edge[V], ...]:
-        return tuple(self._graph[u][v] for u in self._graph for v in self._graph[u])
+    def edges(self) -> EdgesView[V]:
+        """A live view of all edges, which does not copy them."""
+        return EdgesView(self)
+
+    @property
+    def num_edges(self) -> int:
+        """Number of stored edges. Undirected edges are stored once per direction."""
+        return self._num_edges
 
     @classmethod
     def from_graph(
@@ -101,33 +137,50 @@ class Graph[V: Comparable]:
         same references to neighbor dicts.
         """
         new_graph = Graph[Any](is_directed=is_directed)
-        for u in graph:
-            new_graph.add_node(node_fn(u))
-        for u in graph:
-            for v in graph[u]:
-                new_u, new_v = node_fn(u), node_fn(v)
-                edge = edge_fn(graph[u][v])
-                new_graph.add_edge(new_u, new_v, edge.weight, **edge.kwargs)
+        new_graph.add_nodes_from(node_fn(u) for u in graph)
+        new_graph._add_edges(
+            (
+                (node_fn(u), node_fn(v), edge.weight, edge.kwargs)
+                for u in graph
+                for v, orig_edge in graph[u].items()
+                for edge in (edge_fn(orig_edge),)
+            ),
+            validate=True,
+        )
         return new_graph
 
     @classmethod
     def from_edgelist(
-        cls, edge_list: Iterable[Edge[V]], *, is_directed: bool = True
+        cls,
+        edge_list: Iterable[Edge[V]],
+        *,
+        is_directed: bool = True,
+        nodes: Iterable[V] = (),
     ) -> Graph[V]:
+        """
+        Trusted fast path: nodes are created as they are first seen, so edges are added
+        without any per-edge existence checks. Any nodes given in nodes are added first,
+        which is how nodes without edges can be included.
+        """
         graph = Graph[V](is_directed=is_directed)
-        for edge in edge_list:
-            if edge.start not in graph:
-                graph.add_node(edge.start)
-            if edge.end not in graph:
-                graph.add_node(edge.end)
-            graph.add_edge(**edge)
+        graph.add_nodes_from(nodes)
+        graph.add_edges_from(edge_list, validate=False)
         return graph
 
     @classmethod
     def from_matrix(
-        cls, matrix: Sequence[Sequence[float]], *, zero_is_no_edge: bool = True
+        cls,
+        matrix: Sequence[Sequence[float]] | NDArray[Any] | CSRMatrix | COOMatrix,
+        *,
+        zero_is_no_edge: bool = True,
     ) -> Graph[int]:
-        """By default, treat edges with weight 0 as non-existent edges."""
+        """
+        By default, treat edges with weight 0 as non-existent edges.
+        NumPy arrays and sparse matrices are converted with vectorized operations, and
+        sparse matrices only visit their stored entries.
+        """
+        if not isinstance(matrix, Sequence):
+            return cls._from_numpy_matrix(matrix, zero_is_no_edge=zero_is_no_edge)
         is_directed = False
         n = len(matrix)
         graph: dict[int, dict[int, float]] = {i: {} for i in range(n)}
@@ -168,18 +221,128 @@ class Graph[V: Comparable]:
             dot.edge(str(edge.start), str(edge.end))
         dot.render()
 
+    @staticmethod
+    def _from_numpy_matrix(
+        matrix: NDArray[Any] | CSRMatrix | COOMatrix, *, zero_is_no_edge: bool
+    ) -> Graph[int]:
+        import numpy as np
+
+        def is_edge(values: NDArray[Any]) -> NDArray[np.bool]:
+            # Only add edges with nonzero edges.
+            keep: NDArray[np.bool] = values != Graph.INFINITY
+            if zero_is_no_edge:
+                keep &= values != 0
+            return keep
+
+        is_directed: bool | None = None
+        if isinstance(matrix, CSRMatrix):
+            n = matrix.shape[0]
+            row = np.repeat(np.arange(n), np.diff(matrix.indptr))
+            col, data = np.asarray(matrix.indices), np.asarray(matrix.data)
+        elif isinstance(matrix, COOMatrix):
+            n = matrix.shape[0]
+            row, col = np.asarray(matrix.row), np.asarray(matrix.col)
+            data = np.asarray(matrix.data)
+        else:
+            dense = np.asarray(matrix)
+            n = len(dense)
+            # If matrix is not symmetric, graph is directed
+            is_directed = not np.array_equal(dense, dense.T)
+            row, col = np.nonzero(is_edge(dense))
+            data = dense[row, col]
+        if is_directed is None:
+            keep = is_edge(data)
+            row, col, data = row[keep], col[keep], data[keep]
+            # The stored entries are symmetric if sorting them by (row, col) and by
+            # (col, row) gives the same sequence with rows and columns swapped.
+            forward = np.lexsort((data, col, row))
+            backward = np.lexsort((data, row, col))
+            is_directed = not (
+                np.array_equal(row[forward], col[backward])
+                and np.array_equal(col[forward], row[backward])
+                and np.array_equal(data[forward], data[backward])
+            )
+        if not is_directed:
+            # add_edges_from() adds the reverse of each edge itself.
+            upper = row <= col
+            row, col, data = row[upper], col[upper], data[upper]
+
+        graph = Graph[int](is_directed=is_directed)
+        graph.add_nodes_from(range(n))
+        graph.add_edges_from(
+            zip(row.tolist(), col.tolist(), data.tolist(), strict=True), validate=False
+        )
+        return graph
+
     def to_matrix(self, *, zero_is_no_edge: bool = True) -> list[list[float]]:
-        """By default, outputs non-existent edges as having weight 0."""
-        nodes = sorted(self._graph)
-        graph = [
-            [0 if zero_is_no_edge else Graph.INFINITY for _ in nodes] for _ in nodes
-        ]
+        """
+        By default, outputs non-existent edges as having weight 0.
+        Rows and columns follow the sorted order of the nodes.
+
+        Runtime: O(|V|^2 + |E|)
+        """
+        nodes = sorted(self)
+        index = {v: i for i, v in enumerate(nodes)}
+        graph = [[0 if zero_is_no_edge else Graph.INFINITY] * len(nodes) for _ in nodes]
         for i, u in enumerate(nodes):
-            for j, v in enumerate(nodes):
-                if v in self._graph[u]:
-                    graph[i][j] = self._graph[u][v].weight
+            row = graph[i]
+            for v, edge in self[u].items():
+                row[index[v]] = edge.weight
         return graph
 
+    def to_array(self, *, zero_is_no_edge: bool = True) -> NDArray[np.float64]:
+        """
+        Same as to_matrix(), but returns a NumPy array, filled in a single vectorized
+        assignment from to_coo(). Use zero_is_no_edge=False to get the distance matrix
+        expected by matrix-based shortest path algorithms.
+
+        Runtime: O(|V|^2 + |E|)
+        """
+        import numpy as np
+
+        coo = self.to_coo()
+        matrix = np.full(coo.shape, 0.0 if zero_is_no_edge else Graph.INFINITY)
+        matrix[coo.row, coo.col] = coo.data
+        return matrix
+
+    def to_csr(self) -> CSRMatrix:
+        """
+        Returns the adjacency matrix in compressed sparse row form, with rows and
+        columns in the sorted order of the nodes. Only edges are stored.
+
+        Runtime: O(|V| log |V| + |E|)
+        """
+        import numpy as np
+
+        nodes = sorted(self)
+        index = {v: i for i, v in enumerate(nodes)}
+        rows = [self[u] for u in nodes]
+        indptr = np.zeros(len(nodes) + 1, dtype=np.intp)
+        np.cumsum([len(row) for row in rows], out=indptr[1:])
+        m = int(indptr[-1])
+        indices = np.fromiter(
+            (index[v] for row in rows for v in row), dtype=np.intp, count=m
+        )
+        data = np.fromiter(
+            (edge.weight for row in rows for edge in row.values()),
+            dtype=np.float64,
+            count=m,
+        )
+        return CSRMatrix(data, indices, indptr, (len(nodes), len(nodes)))
+
+    def to_coo(self) -> COOMatrix:
+        """
+        Returns the adjacency matrix as parallel (row, col, data) arrays, with rows and
+        columns in the sorted order of the nodes.
+
+        Runtime: O(|V| log |V| + |E|)
+        """
+        import numpy as np
+
+        csr = self.to_csr()
+        row = np.repeat(np.arange(csr.shape[0], dtype=np.intp), np.diff(csr.indptr))
+        return COOMatrix(csr.data, row, csr.indices, csr.shape)
+
     def verify_nodes_exist(self, *v_ids: V) -> None:
         """Checks existence of provided nodes."""
         for v in v_ids:
@@ -208,17 +371,77 @@ class Graph[V: Comparable]:
         return len(self._graph[v])
 
     def in_degree(self, v: V) -> int:
-        """Iterate over neighbors to see whether any reference the current node."""
+        """
+        Uses the predecessor index if it exists. Otherwise, iterate over neighbors to
+        see whether any reference the current node.
+        """
         if not self.is_directed:
             raise NotImplementedError("Graph is undirected; use degree() instead.")
         self.verify_nodes_exist(v)
+        if self._predecessors is not None:
+            return len(self._predecessors[v]) - (v in self._predecessors[v])
         return sum(v in self._graph[node] and v != node for node in self._graph)
 
+    @property
+    def has_predecessor_index(self) -> bool:
+        """
+        Whether predecessors() only touches the edges into a node, which is always the
+        case for undirected graphs, and for directed graphs with index_predecessors.
+        """
+        return not self.is_directed or self._predecessors is not None
+
+    def predecessors(self, v: V) -> KeysView[V]:
+        """
+        Returns the nodes with an edge into v, including v itself if it has a self-loop.
+        For undirected graphs, this is the same as adj(v).
+        """
+        self.verify_nodes_exist(v)
+        if not self.is_directed:
+            return self._graph[v].keys()
+        if self._predecessors is not None:
+            return self._predecessors[v].keys()
+        return dict.fromkeys(u for u in self._graph if v in self._graph[u]).keys()
+
     def add_node(self, v: V) -> None:
         """You cannot add the same node twice."""
         if v in self._graph:
             raise KeyError(f"Node already exists: {v}")
         self._graph[v] = {}
+        if self._predecessors is not None:
+            self._predecessors[v] = {}
+
+    def add_nodes_from(self, nodes: Iterable[V]) -> None:
+        """Adds every node in nodes, skipping nodes that already exist."""
+        graph, predecessors = self._graph, self._predecessors
+        for v in nodes:
+            if v not in graph:
+                graph[v] = {}
+                if predecessors is not None:
+                    predecessors[v] = {}
+
+    def add_edges_from(
+        self,
+        edges: Iterable[Edge[V] | tuple[V, V] | tuple[V, V, float]],
+        *,
+        validate: bool = True,
+    ) -> None:
+        """
+        Adds many edges with the same semantics as add_edge, but in a single loop that
+        avoids add_edge's per-edge method calls. Tuples are read as (start, end) or
+        (start, end, weight), and Edge objects are copied along with their kwargs.
+
+        If validate is True, every endpoint must already exist, as in add_edge.
+        If validate is False, the input is trusted and missing endpoints are created.
+        """
+        self._add_edges(
+            (
+                (edge.start, edge.end, edge.weight, edge.kwargs)
+                if isinstance(edge, Edge)
+                else (edge[0], edge[1], edge[2] if len(edge) == 3 else 1, _NO_KWARGS)
+                for edge in edges
+            ),
+            validate=validate,
+        )
 
     def add_edge(self, start: V, end: V, weight: float = 1, **kwargs: Any) -> None:
         """
@@ -229,89 +452,408 @@ class Graph[V: Comparable]:
         Note that the function variable names must match the Edge class constructor.
         """
         self.verify_nodes_exist(start, end)
-        self._graph[start][end] = Edge(start, end, weight, **kwargs)
+        if self.weights_only:
+            self._check_no_kwargs(kwargs)
+            edge: Edge[V] | float = weight
+        else:
+            edge = Edge(start, end, weight, **kwargs)
+        self._insert_edge(start, end, edge)
+        if self._predecessors is not None:
+            self._predecessors[end][start] = None
         if not self.is_directed:
-            self._graph[end][start] = Edge(end, start, weight, **kwargs)
+            if not self.shared_edges and not self.weights_only:
+                edge = Edge(end, start, weight, **kwargs)
+            self._insert_edge(end, start, edge)
 
     def has_edge(self, start: V, end: V) -> bool:
         return start in self._graph and end in self._graph[start]
 
+    def has_integer_weights(self, max_weight: float = INFINITY) -> bool:
+        """
+        Returns whether every edge weight is a whole number from 0 to max_weight.
+        Floats with integral values, such as 3.0, count as whole numbers.
+
+        Runtime: O(|E|)
+        """
+        weights = (
+            edge if isinstance(edge, int | float) else edge.weight
+            for neighbors in self._graph.values()
+            for edge in neighbors.values()
+        )
+        return all(0 <= w <= max_weight and float(w).is_integer() for w in weights)
+
+    def random_edge(self) -> Edge[V]:
+        """
+        Returns a uniformly random edge in O(1). The first call builds an index of edge
+        keys in O(|E|), which is then kept in sync with every add/remove call.
+        """
+        if self._edge_keys is None:
+            self._edge_keys = [(u, v) for u in self._graph for v in self._graph[u]]
+            self._edge_positions = {key: i for i, key in enumerate(self._edge_keys)}
+        if not self._edge_keys:
+            raise IndexError("Graph has no edges.")
+        u, v = random.choice(self._edge_keys)
+        return self[u][v]
+
     def remove_node(self, v: V) -> None:
         """
         Removes all of the edges associated with the node v too.
         """
         self.verify_nodes_exist(v)
-        if self.is_directed:
+        if self._predecessors is not None:
+            for node in self._predecessors.pop(v):
+                self._delete_edge(node, v)
+            for neighbor in self._graph[v]:
+                del self._predecessors[neighbor][v]
+        elif self.is_directed:
             for node in self._graph:
-                # Make a list copy to avoid removing-while-iterating errors.
-                for neighbor in list(self._graph[node]):
-                    if v in (node, neighbor):
-                        del self._graph[node][neighbor]
-            del self._graph[v]
+                if v in self._graph[node]:
+                    self._delete_edge(node, v)
         else:
-            removed_node_dict = self._graph.pop(v)
-            for neighbor in removed_node_dict:
-                if v in self._graph[neighbor]:
-                    del self._graph[neighbor][v]
+            for neighbor in self._graph[v]:
+                if neighbor != v and v in self._graph[neighbor]:
+                    self._delete_edge(neighbor, v)
+        # Make a list copy to avoid removing-while-iterating errors.
+        for neighbor in list(self._graph[v]):
+            self._delete_edge(v, neighbor)
+        del self._graph[v]
 
     def remove_edge(self, start: V, end: V) -> None:
         self.verify_nodes_exist(start, end)
         if end in self._graph[start]:
-            del self._graph[start][end]
+            self._delete_edge(start, end)
+            if self._predecessors is not None:
+                del self._predecessors[end][start]
+            if not self.is_directed and start != end:
+                self._delete_edge(end, start)
+
+    @staticmethod
+    def _parse_adjacency_list(
+        graph: dict[V, Any], weight: float, kwargs: dict[str, Any]
+    ) -> Iterator[tuple[V, V, float, Mapping[str, Any]]]:
+        """Converts adjacency list entries into (start, end, weight, kwargs) tuples."""
+        for u, neighbors in graph.items():
+            if isinstance(neighbors, dict):
+                for v, edge in neighbors.items():
+                    if isinstance(edge, Edge):
+                        yield edge.start, edge.end, edge.weight, edge.kwargs
+                    elif isinstance(edge, dict):
+                        edge_kwargs = dict(edge)
+                        yield u, v, edge_kwargs.pop("weight", 1), edge_kwargs
+                    elif isinstance(edge, int | float):
+                        yield u, v, edge, kwargs
+                    else:
+                        raise TypeError(f"{edge} is not a supported Edge type.")
+            elif isinstance(neighbors, list | tuple | set | frozenset):
+                # Values are some other collection; only contains node names.
+                # Use default weight parameter.
+                for v in neighbors:
+                    yield u, v, weight, _NO_KWARGS
+            else:
+                raise TypeError(f"{neighbors} is not a supported Edge mapping.")
+
+    def _add_edges(
+        self,
+        edges: Iterable[tuple[V, V, float, Mapping[str, Any]]],
+        *,
+        validate: bool,
+    ) -> None:
+        """
+        Shared loop of the bulk construction methods. Edge keys are only tracked
+        through _insert_edge when the random_edge() index exists.
+        """
+        graph, predecessors = self._graph, self._predecessors
+        track_keys = self._edge_keys is not None
+        weights_only = self.weights_only
+        for start, end, weight, kwargs in edges:
+            if start not in graph or end not in graph:
+                if validate:
+                    self.verify_nodes_exist(start, end)
+                self.add_nodes_from((start, end))
+            edge: Edge[V] | float
+            if weights_only:
+                self._check_no_kwargs(kwargs)
+                edge = weight
+            # Unpacking even an empty kwargs mapping doubles the cost of an Edge.
+            elif kwargs:
+                edge = Edge(start, end, weight, **kwargs)
+            else:
+                edge = Edge(start, end, weight)
+            if track_keys:
+                self._insert_edge(start, end, edge)
+            else:
+                self._num_edges += end not in graph[start]
+                graph[start][end] = edge
+            if predecessors is not None:
+                predecessors[end][start] = None
             if not self.is_directed:
-                del self._graph[end][start]
+                if not self.shared_edges and not weights_only:
+                    edge = Edge(end, start, weight, **kwargs)
+                if track_keys:
+                    self._insert_edge(end, start, edge)
+                else:
+                    self._num_edges += start not in graph[end]
+                    graph[end][start] = edge
 
-    def is_bipartite(self) -> bool:
+    @staticmethod
+    def _check_no_kwargs(kwargs: Mapping[str, Any]) -> None:
+        if kwargs:
+            raise TypeError(
+                f"Graph stores weights only; edges cannot have attributes {kwargs}."
+            )
+
+    def _insert_edge(self, start: V, end: V, edge: Edge[V] | float) -> None:
+        """Stores the edge and updates the edge count and random_edge() index."""
+        if end not in self._graph[start]:
+            self._num_edges += 1
+            if self._edge_keys is not None:
+                self._edge_positions[start, end] = len(self._edge_keys)
+                self._edge_keys.append((start, end))
+        self._graph[start][end] = edge
+
+    def _delete_edge(self, start: V, end: V) -> None:
+        """
+        Deletes the edge and updates the edge count and random_edge() index. The index
+        removes keys by swapping them with the last key, so deletion is also O(1).
         """
-        Check whether Graph is bipartite using DFS.
-        Should not be a property because the calculation changes and
+        del self._graph[start][end]
+        self._num_edges -= 1
+        if self._edge_keys is not None:
+            i = self._edge_positions.pop((start, end))
+            last = self._edge_keys.pop()
+            if i < len(self._edge_keys):
+                self._edge_keys[i] = last
+                self._edge_positions[last] = i
+
+    @overload
+    def is_bipartite(self, *, witness: Literal[False] = False) -> bool: ...
+
+    @overload
+    def is_bipartite(
+        self, *, witness: Literal[True]
+    ) -> tuple[set[V], set[V]] | list[V]: ...
+
+    def is_bipartite(
+        self, *, witness: bool = False
+    ) -> bool | tuple[set[V], set[V]] | list[V]:
+        """
+        Check whether Graph is bipartite using BFS, treating directed edges as
+        undirected. Should not be a property because the calculation changes and
         this should not be thought of as an easily accessible attribute.
 
-        The algorithm works by exploring nodes in a DFS fashion and marking the parity
-        of each node. As an optimization, we combine this into the depth-first search
-        code. If we ever explore an arc where both nodes are known to have the same
-        parity, we have detected an odd cycle and return False. Since the DFS considers
-        each arc in the graph twice (once in each direction), we're guaranteed that we
-        will locate such an edge if it exists.
+        The BFS colors each node with the opposite parity of the node it was reached
+        from. Every edge is checked as soon as it is explored, so the search returns
+        False at the first edge whose endpoints have the same parity, which closes an
+        odd cycle. The queue replaces recursion, so long paths are fine.
+
+        If witness is True, the result is the two sides instead of True, or the nodes
+        of an odd cycle instead of False, in order, where consecutive nodes (and the
+        last and first) are joined by an edge in some direction. The first node to be
+        colored in each component goes to the first side if it has outgoing edges, so
+        when every edge goes from one side to the other, the sides can be passed
+        straight to bipartite_matching or hopcroft_karp_matching as left and right.
 
         Runtime: O(|V| + |E|)
         """
-        visited = set()
+        graph = self._graph
+        reverse = self._predecessors
+        if self.is_directed and reverse is None:
+            reverse = {v: {} for v in graph}
+            for u in graph:
+                for v in graph[u]:
+                    reverse[v][u] = None
+        # True for the first side, False for the second.
         color: dict[V, bool] = {}
+        parents: dict[V, V] = {}
+        for root in graph:
+            if root in color:
+                continue
+            color[root] = bool(graph[root])
+            queue = [root]
+            for u in queue:
+                neighbors = graph[u] if reverse is None else chain(graph[u], reverse[u])
+                for v in neighbors:
+                    if v not in color:
+                        color[v] = not color[u]
+                        parents[v] = u
+                        queue.append(v)
+                    elif color[v] == color[u]:
+                        return self._odd_cycle(parents, u, v) if witness else False
+        if not witness:
+            return True
+        sides: tuple[set[V], set[V]] = (set(), set())
+        for v, is_first in color.items():
+            sides[not is_first].add(v)
+        return sides
+
+    @staticmethod
+    def _odd_cycle(parents: dict[V, V], u: V, v: V) -> list[V]:
+        """
+        Returns the cycle closed by the edge between u and v, which have the same BFS
+        depth, by following both of their parents up to their lowest common ancestor.
+        """
+        u_path, v_path = [u], [v]
+        while u_path[-1] != v_path[-1]:
+            u_path.append(parents[u_path[-1]])
+            v_path.append(parents[v_path[-1]])
+        u_path.reverse()
+        return u_path + v_path[:-1]
+
+
+class _WeightsView[V: Comparable](Mapping[V, "Edge[V]"]):
+    """
+    The out-edges of one node of a weights_only Graph, built from its dict of bare
+    weights as they are read.
+    """
+
+    __slots__ = ("_start", "_weights")
+
+    def __init__(self, start: V, weights: dict[V, float]) -> None:
+        self._start = start
+        self._weights = weights
+
+    @override
+    def __repr__(self) -> str:
+        return repr(dict(self.items()))
+
+    @override
+    def __len__(self) -> int:
+        return len(self._weights)
+
+    @override
+    def __iter__(self) -> Iterator[V]:
+        return iter(self._weights)
+
+    @override
+    def __contains__(self, v: object) -> bool:
+        return v in self._weights
+
+    @override
+    def __getitem__(self, v: V) -> Edge[V]:
+        return Edge(self._start, v, self._weights[v])
+
+    @override
+    def keys(self) -> KeysView[V]:
+        return self._weights.keys()
+
+    @override
+    def items(self) -> ItemsView[V, Edge[V]]:
+        return _WeightsItems(self)
+
+    @override
+    def values(self) -> ValuesView[Edge[V]]:
+        return _WeightsValues(self)
+
+    def edge_items(self) -> Iterator[tuple[V, Edge[V]]]:
+        """Builds the Edge objects in order, paired with their end nodes."""
+        start = self._start
+        for v, weight in self._weights.items():
+            yield v, Edge(start, v, weight)
 
-        def dfs(v: V, curr_color: bool) -> None:
-            visited.add(v)
-            color[v] = curr_color
-            for u in self._graph[v]:
-                if u not in visited:
-                    dfs(u, not curr_color)
-
-        for node in self._graph:
-            if node not in visited:
-                dfs(node, True)
-        for i in self._graph:
-            for j in self._graph[i]:
-                if color[i] == color[j]:
-                    return False
-        return True
 
+class _WeightsItems[V: Comparable](ItemsView[V, "Edge[V]"]):
+    _mapping: _WeightsView[V]
 
-@dataclass(init=False, repr=False, order=True)
+    @override
+    def __iter__(self) -> Iterator[tuple[V, Edge[V]]]:
+        return self._mapping.edge_items()
+
+
+class _WeightsValues[V: Comparable](ValuesView["Edge[V]"]):
+    _mapping: _WeightsView[V]
+
+    @override
+    def __iter__(self) -> Iterator[Edge[V]]:
+        for _, edge in self._mapping.edge_items():
+            yield edge
+
+
+class EdgesView[V: Comparable](AbstractSet["Edge[V]"]):
+    """
+    A live, set-like view of the edges of a Graph, similar to dict.keys(). The view
+    reflects later changes to the graph, and its length is the cached edge count, so
+    accessing graph.edges never copies every edge.
+    """
+
+    __slots__ = ("_graph",)
+
+    def __init__(self, graph: Graph[V]) -> None:
+        self._graph = graph
+
+    @override
+    def __len__(self) -> int:
+        return self._graph.num_edges
+
+    @override
+    def __iter__(self) -> Iterator[Edge[V]]:
+        for u in self._graph:
+            yield from self._graph[u].values()
+
+    @override
+    def __contains__(self, edge: object) -> bool:
+        return (
+            isinstance(edge, Edge)
+            and self._graph.has_edge(edge.start, edge.end)
+            and self._graph[edge.start][edge.end] == edge
+        )
+
+    @override
+    def __repr__(self) -> str:
+        return f"EdgesView({tuple(self)})"
+
+
+@dataclass(frozen=True, eq=False)
+class CSRMatrix:
+    """
+    A sparse adjacency matrix in the layout of scipy.sparse.csr_matrix. Row i stores
+    the values data[indptr[i]:indptr[i + 1]] in the matching columns of indices, so
+    csr_matrix((m.data, m.indices, m.indptr), shape=m.shape) needs no copy.
+    """
+
+    data: NDArray[np.float64]
+    indices: NDArray[np.intp]
+    indptr: NDArray[np.intp]
+    shape: tuple[int, int]
+
+
+@dataclass(frozen=True, eq=False)
+class COOMatrix:
+    """
+    A sparse adjacency matrix in the layout of scipy.sparse.coo_matrix, where entry k
+    is data[k] at (row[k], col[k]).
+    """
+
+    data: NDArray[np.float64]
+    row: NDArray[np.intp]
+    col: NDArray[np.intp]
+    shape: tuple[int, int]
+
+
+@dataclass(init=False, repr=False, order=True, slots=True)
 class Edge[V: Comparable](Mapping[str, Any]):
     """
     The edge class that stores edge data.
     Edges are given sort order using start, end, and weight.
+
+    Edges are slotted, and the dict of extra attributes is only allocated once an
+    attribute other than start, end or weight is actually set.
     """
 
     start: V
     end: V
     weight: float
+    _kwargs: dict[str, Any] | None = dfield(None)
 
     def __init__(self, start: V, end: V, weight: float = 1, **kwargs: Any) -> None:
         self.start = start
         self.end = end
         self.weight = weight
-        self.kwargs = kwargs
+        self._kwargs = kwargs or None
+
+    @property
+    def kwargs(self) -> Mapping[str, Any]:
+        """Read-only view of the extra attributes. Use edge[key] = value to set one."""
+        return _NO_KWARGS if self._kwargs is None else self._kwargs
 
     @override
     def __len__(self) -> int:
@@ -335,11 +877,14 @@ class Edge[V: Comparable](Mapping[str, Any]):
     def __setitem__(self, attr: str, value: Any) -> None:
         if attr == "start":
             self.start = value
-        if attr == "end":
+        elif attr == "end":
             self.end = value
-        if attr == "weight":
+        elif attr == "weight":
             self.weight = value
-        self.kwargs[attr] = value
+        elif self._kwargs is None:
+            self._kwargs = {attr: value}
+        else:
+            self._kwargs[attr] = value
 
     @override
     def __repr__(self) -> str:
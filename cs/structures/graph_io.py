@@ -0,0 +1,198 @@
+"""
+Streaming readers and writers for common on-disk graph formats.
+
+Readers are generators that parse one line at a time, so the file contents are never
+held in memory, and load_graph() can feed them straight into a CSRGraph without
+building a dict-of-dicts first.
+
+Supported formats:
+- EDGELIST: one "start end [weight]" edge per line, with "#" comments.
+- DIMACS: the 9th DIMACS Implementation Challenge shortest path format (.gr), with
+    a "p sp <n> <m>" header and one "a <start> <end> <weight>" line per arc.
+    Nodes are numbered from 1.
+- METIS: the undirected METIS/Chaco format, with a "<n> <m> [fmt [ncon]]" header and
+    one line per node listing its neighbors. Nodes are numbered from 1.
+- SNAPSHOT: the binary CSRGraph snapshot format, which is memory-mapped on load
+    instead of being parsed. See CSRGraph.save_snapshot().
+"""
+
+from __future__ import annotations
+
+from enum import Enum, auto, unique
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from cs.structures.csr_graph import CSRGraph
+from cs.structures.graph import Edge, Graph
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+    from typing import TextIO
+
+
+@unique
+class GraphFormat(Enum):
+    EDGELIST = auto()
+    DIMACS = auto()
+    METIS = auto()
+    SNAPSHOT = auto()
+
+
+def load_graph(
+    path: str | Path,
+    fmt: GraphFormat = GraphFormat.EDGELIST,
+    *,
+    is_directed: bool = True,
+    compact: bool = False,
+    node_fn: Callable[[str], Any] = int,
+) -> Graph[Any]:
+    """
+    Loads a graph from disk. If compact is True, the edges are streamed directly into
+    a CSRGraph. METIS graphs are always undirected, and node_fn is only used to parse
+    the node names of edge lists. Snapshots are always opened as a mapped CSRGraph.
+    """
+    nodes: range | tuple[()] = ()
+    match fmt:
+        case GraphFormat.EDGELIST:
+            edges = read_edgelist(path, node_fn=node_fn)
+        case GraphFormat.DIMACS:
+            nodes = range(1, _read_header(path, "c")[0] + 1)
+            edges = read_dimacs(path)
+        case GraphFormat.METIS:
+            is_directed = False
+            nodes = range(1, _read_header(path, "%")[0] + 1)
+            edges = read_metis(path)
+        case GraphFormat.SNAPSHOT:
+            return CSRGraph.open_snapshot(path)
+    graph_cls = CSRGraph if compact else Graph
+    return graph_cls.from_edgelist(edges, is_directed=is_directed, nodes=nodes)
+
+
+def save_graph(
+    graph: Graph[Any], path: str | Path, fmt: GraphFormat = GraphFormat.EDGELIST
+) -> None:
+    """
+    Writes a graph to disk one line at a time. DIMACS and METIS renumber the nodes from
+    1 in iteration order, and METIS requires an undirected graph. Snapshots are
+    written in one pass from a CSRGraph, compressing the graph first if needed.
+    """
+    if fmt is GraphFormat.SNAPSHOT:
+        csr = graph if isinstance(graph, CSRGraph) else CSRGraph(graph)
+        csr.save_snapshot(path)
+        return
+    with Path(path).open("w", encoding="utf-8") as f:
+        match fmt:
+            case GraphFormat.EDGELIST:
+                write_edgelist(graph, f)
+            case GraphFormat.DIMACS:
+                write_dimacs(graph, f)
+            case GraphFormat.METIS:
+                write_metis(graph, f)
+
+
+def read_edgelist(
+    path: str | Path, *, node_fn: Callable[[str], Any] = int
+) -> Iterator[Edge[Any]]:
+    """
+    Yields each "start end [weight]" line as an Edge, skipping comment lines, which
+    start with "#" as in SNAP files or "%" as in KONECT files. Any columns after the
+    weight, such as timestamps, are ignored. Raises a ValueError naming the line if it
+    has only one column.
+    """
+    with Path(path).open(encoding="utf-8") as f:
+        for line_number, line in enumerate(f, 1):
+            fields = line.split()
+            if fields and not fields[0].startswith(("#", "%")):
+                if len(fields) < 2:
+                    raise ValueError(f"Line {line_number} of {path} has no end node.")
+                yield Edge(
+                    node_fn(fields[0]),
+                    node_fn(fields[1]),
+                    *map(_parse_weight, fields[2:3]),
+                )
+
+
+def read_dimacs(path: str | Path) -> Iterator[Edge[int]]:
+    """Yields each "a <start> <end> <weight>" arc as an Edge."""
+    with Path(path).open(encoding="utf-8") as f:
+        for line in f:
+            if line.startswith("a"):
+                _, start, end, weight = line.split()
+                yield Edge(int(start), int(end), _parse_weight(weight))
+
+
+def read_metis(path: str | Path) -> Iterator[Edge[int]]:
+    """
+    Yields each undirected edge once, from its lower-numbered endpoint. The last digit
+    of the fmt header field says whether edges are weighted, and the first two digits
+    say whether each line begins with a vertex size and ncon vertex weights to skip.
+    """
+    with Path(path).open(encoding="utf-8") as f:
+        lines = (line for line in f if not line.startswith("%"))
+        header = next(lines).split()
+        fmt = header[2].zfill(3) if len(header) > 2 else "000"
+        ncon = int(header[3]) if len(header) > 3 else 1
+        skip = (fmt[0] == "1") + (fmt[1] == "1") * ncon
+        has_weights = fmt[2] == "1"
+        for u, line in enumerate(lines, start=1):
+            fields = line.split()[skip:]
+            step = 2 if has_weights else 1
+            for i in range(0, len(fields), step):
+                v = int(fields[i])
+                if u < v:
+                    yield Edge(u, v, _parse_weight(fields[i + 1]) if has_weights else 1)
+
+
+def write_edgelist(graph: Graph[Any], f: TextIO) -> None:
+    f.writelines(
+        f"{edge.start} {edge.end} {_format_weight(edge.weight)}\n"
+        for edge in graph.edges
+    )
+
+
+def write_dimacs(graph: Graph[Any], f: TextIO) -> None:
+    ids = {v: i for i, v in enumerate(graph, start=1)}
+    f.write(f"p sp {len(graph)} {graph.num_edges}\n")
+    f.writelines(
+        f"a {ids[edge.start]} {ids[edge.end]} {_format_weight(edge.weight)}\n"
+        for edge in graph.edges
+    )
+
+
+def write_metis(graph: Graph[Any], f: TextIO) -> None:
+    if graph.is_directed:
+        raise ValueError("METIS only supports undirected graphs.")
+    ids = {v: i for i, v in enumerate(graph, start=1)}
+    has_weights = any(edge.weight != 1 for edge in graph.edges)
+    num_edges = sum(u != v for u in graph for v in graph[u]) // 2
+    f.write(f"{len(graph)} {num_edges}{' 001' if has_weights else ''}\n")
+    f.writelines(
+        " ".join(
+            f"{ids[v]} {_format_weight(edge.weight)}" if has_weights else str(ids[v])
+            for v, edge in graph[u].items()
+            if v != u
+        )
+        + "\n"
+        for u in graph
+    )
+
+
+def _read_header(path: str | Path, *comments: str) -> list[int]:
+    """Returns the integers on the first line that is not a comment."""
+    with Path(path).open(encoding="utf-8") as f:
+        for line in f:
+            if not line.startswith(comments):
+                return [int(field) for field in line.split() if field.isdigit()]
+    raise ValueError(f"{path} does not contain a header.")
+
+
+def _parse_weight(weight: str) -> float:
+    """Keeps integer weights exact."""
+    try:
+        return int(weight)
+    except ValueError:
+        return float(weight)
+
+
+def _format_weight(weight: float) -> str:
+    return str(int(weight)) if float(weight).is_integer() else repr(weight)
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Self, override
+from uuid import UUID
+
+from cs.structures.heap.heap import Heap
+from cs.util import Comparable
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+@dataclass(slots=True)
+class Entry[T: Comparable]:
+    """Hold an entry in the heap, along with the index of the bucket it is in."""
+
+    priority: float
+    value: T
+    bucket: int = field(default=0, repr=False)
+
+
+@dataclass(init=False)
+class RadixHeap[T: Comparable](Heap[T]):
+    """
+    A monotone priority queue for non-negative integer priorities, as used by
+    Dijkstra's algorithm on graphs with integer edge weights.
+
+    The heap remembers the last priority it dequeued, and every priority enqueued
+    after that must be at least as large. Entries are kept in buckets by the highest
+    bit in which their priority differs from the last dequeued priority, so bucket 0
+    holds the entries tied with it, and bucket i holds priorities that differ from it
+    first in bit i - 1. When bucket 0 runs out, the first non-empty bucket is emptied
+    and its entries are redistributed around its minimum, which can only move each
+    entry into a lower bucket. Each entry therefore moves at most once per bit.
+
+    Priorities are never compared with each other except to find a bucket minimum,
+    and there are no links to maintain, so for keys below C every operation is a few
+    dict operations plus O(log C) amortized redistribution work.
+
+    Runtime: O(1) enqueue and decrease_key, O(log C) amortized dequeue
+    """
+
+    buckets: list[dict[T, Entry[T]]]
+    last: float
+
+    def __init__(self) -> None:
+        self.buckets = [{}]
+        self.elem_to_entry: dict[T, Entry[T]] = {}
+        # The last dequeued priority, which is a lower bound on every entry.
+        self.last = 0
+
+    @override
+    def __bool__(self) -> bool:
+        return bool(self.elem_to_entry)
+
+    @override
+    def __len__(self) -> int:
+        return len(self.elem_to_entry)
+
+    @override
+    def __contains__(self, item: T) -> bool:
+        return item in self.elem_to_entry
+
+    def __iter__(self) -> Iterator[T]:
+        yield from self.elem_to_entry
+
+    @override
+    def __getitem__(self, value: T | UUID) -> Entry[T]:
+        if isinstance(value, UUID):
+            raise TypeError("RadixHeap does not use UUIDs.")
+        if value not in self.elem_to_entry:
+            raise KeyError(f"Invalid key: {value}")
+        return self.elem_to_entry[value]
+
+    @override
+    def __ior__(self, other: object) -> Self:
+        if isinstance(other, RadixHeap):
+            self.merge(other)
+            return self
+        raise NotImplementedError
+
+    @override
+    def enqueue(self, value: T, priority: float = 0) -> T:
+        """
+        Insert a value with the given priority, which must be an integer no smaller
+        than the last dequeued priority. Raise a KeyError if the value is present.
+        """
+        self._check_priority(priority)
+        if value in self.elem_to_entry:
+            raise KeyError(f"Duplicate key detected: {value}.")
+        entry = Entry(priority, value)
+        self.elem_to_entry[value] = entry
+        self._insert(entry)
+        return value
+
+    @override
+    def peek(self) -> tuple[T, float]:
+        """Return a minimum (value, priority), or raise an IndexError if empty."""
+        entry = next(iter(self._first_bucket().values()))
+        return entry.value, entry.priority
+
+    @override
+    def dequeue(self) -> tuple[T, float]:
+        """Remove and return a minimum (value, priority), or raise an IndexError."""
+        value, entry = self._first_bucket().popitem()
+        del self.elem_to_entry[value]
+        return value, entry.priority
+
+    def decrease_key(self, value: T, new_priority: float) -> None:
+        """
+        Decrease the priority of the value. Raise a ValueError if the new priority
+        exceeds the old one, or is smaller than the last dequeued priority.
+        """
+        entry = self[value]
+        self._check_priority(new_priority)
+        if new_priority > entry.priority:
+            raise ValueError("New priority exceeds old.")
+        del self.buckets[entry.bucket][value]
+        entry.priority = new_priority
+        self._insert(entry)
+
+    def remove(self, value: T) -> None:
+        entry = self[value]
+        del self.buckets[entry.bucket][value]
+        del self.elem_to_entry[value]
+
+    @override
+    def merge(self, other: Heap[T]) -> None:
+        """
+        Move every entry of other into this heap. Every priority in other must be no
+        smaller than the last priority dequeued from this heap.
+        """
+        if not isinstance(other, RadixHeap):
+            raise TypeError("Heap types must match when merging.")
+        if set(self.elem_to_entry) & set(other.elem_to_entry):
+            raise RuntimeError("You must pass in two unoverlapping heaps.")
+        for entry in other.elem_to_entry.values():
+            self._check_priority(entry.priority)
+        for value, entry in other.elem_to_entry.items():
+            self.enqueue(value, entry.priority)
+
+    def _check_priority(self, priority: float) -> None:
+        if not float(priority).is_integer():
+            raise ValueError(f"Priority {priority} is not an integer.")
+        if priority < self.last:
+            raise ValueError(
+                f"Priority {priority} is less than the last dequeued priority "
+                f"{self.last}."
+            )
+
+    def _insert(self, entry: Entry[T]) -> None:
+        """Place the entry by the highest bit in which it differs from last."""
+        bucket = (int(entry.priority) ^ int(self.last)).bit_length()
+        while bucket >= len(self.buckets):
+            self.buckets.append({})
+        entry.bucket = bucket
+        self.buckets[bucket][entry.value] = entry
+
+    def _first_bucket(self) -> dict[T, Entry[T]]:
+        """
+        Return bucket 0 after refilling it if needed. The minimum of the first
+        non-empty bucket becomes the new last priority, and the rest of that bucket is
+        redistributed around it.
+        """
+        if not self.buckets[0]:
+            if not self.elem_to_entry:
+                raise IndexError("Heap is empty.")
+            i = next(i for i, bucket in enumerate(self.buckets) if bucket)
+            bucket, self.buckets[i] = self.buckets[i], {}
+            self.last = min(entry.priority for entry in bucket.values())
+            for entry in bucket.values():
+                self._insert(entry)
+        return self.buckets[0]
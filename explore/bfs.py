@@ -0,0 +1,64 @@
+"""
+Measures BFS throughput in traversed edges per second (TEPS), as in the Graph500
+benchmark, on a random low-diameter graph. Each search counts the edges out of every
+vertex it reaches. Run with `python -m explore.bfs`.
+"""
+
+import random
+import time
+from array import array
+from collections.abc import Callable
+
+from cs.algorithms import bfs_level_array, breadth_first_order
+from cs.algorithms.graph.bfs import adjacency_arrays
+from cs.structures import Graph
+
+NUM_NODES = 1 << 16
+EDGE_FACTOR = 16
+NUM_ROOTS = 8
+
+
+def benchmark(name: str, search_fn: Callable[[int], int], roots: list[int]) -> None:
+    """search_fn returns the number of edges in the component it searched."""
+    edges = 0
+    start = time.perf_counter()
+    for root in roots:
+        edges += search_fn(root)
+    elapsed = time.perf_counter() - start
+    print(f"{name:>22}: {edges / elapsed / 1e6:.2f} MTEPS")
+
+
+def main() -> None:
+    random.seed(0)
+    edges = [
+        (random.randrange(NUM_NODES), random.randrange(NUM_NODES))
+        for _ in range(NUM_NODES * EDGE_FACTOR // 2)
+    ]
+    edges += [(v, u) for u, v in edges]
+    offsets, targets = adjacency_arrays(NUM_NODES, edges)
+    graph = Graph[int]({v: {} for v in range(NUM_NODES)})
+    for u, v in edges:
+        if not graph.has_edge(u, v):
+            graph.add_edge(u, v)
+    print(f"{NUM_NODES} nodes, {len(edges)} directed edges")
+    roots = random.sample(range(NUM_NODES), NUM_ROOTS)
+
+    def component_edges(levels: array[int]) -> int:
+        return sum(
+            offsets[v + 1] - offsets[v] for v, level in enumerate(levels) if level >= 0
+        )
+
+    def array_search(root: int, alpha: float) -> int:
+        levels = bfs_level_array(offsets, targets, offsets, targets, root, alpha=alpha)
+        return component_edges(levels)
+
+    def graph_search(root: int) -> int:
+        return sum(len(graph[v]) for v in breadth_first_order(graph, root))
+
+    benchmark("Graph top-down", graph_search, roots)
+    benchmark("Array top-down", lambda root: array_search(root, 0), roots)
+    benchmark("Direction-optimizing", lambda root: array_search(root, 15), roots)
+
+
+if __name__ == "__main__":
+    main()
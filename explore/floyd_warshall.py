@@ -0,0 +1,55 @@
+"""
+Compares the Floyd-Warshall engines on random sparse graphs.
+Run with `python -m explore.floyd_warshall`.
+"""
+
+import random
+import time
+from collections.abc import Callable
+from typing import Any
+
+from cs.algorithms import floyd_warshall_matrix, floyd_warshall_shortest_paths
+from cs.structures import Graph
+
+EDGES_PER_NODE = 8
+
+
+def random_graph(num_nodes: int) -> Graph[int]:
+    graph = Graph[int]()
+    graph.add_nodes_from(range(num_nodes))
+    graph.add_edges_from(
+        (
+            random.randrange(num_nodes),
+            random.randrange(num_nodes),
+            random.randint(1, 99),
+        )
+        for _ in range(EDGES_PER_NODE * num_nodes)
+    )
+    return graph
+
+
+def timed(name: str, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+    start = time.perf_counter()
+    fn(*args, **kwargs)
+    print(f"{name:<32} {time.perf_counter() - start:8.2f}s")
+
+
+def main() -> None:
+    random.seed(0)
+    for num_nodes in (200, 1000, 2000):
+        graph = random_graph(num_nodes)
+        print(f"|V| = {num_nodes}")
+        if num_nodes <= 200:
+            timed("dicts", floyd_warshall_shortest_paths, graph, vectorized=False)
+        timed("numpy, unblocked", floyd_warshall_matrix, graph, block_size=num_nodes)
+        for block_size in (32, 64, 128):
+            timed(
+                f"numpy, block_size={block_size}",
+                floyd_warshall_matrix,
+                graph,
+                block_size=block_size,
+            )
+
+
+if __name__ == "__main__":
+    main()
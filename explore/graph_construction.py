@@ -0,0 +1,66 @@
+"""
+Compares how many edges per second each graph construction route can load.
+Run with `python -m explore.graph_construction`.
+"""
+
+import random
+import time
+from collections.abc import Callable
+from typing import Any
+
+from cs.structures import CSRGraph, Edge, Graph
+
+NUM_NODES = 100_000
+NUM_EDGES = 1_000_000
+
+
+def add_edge_loop(edges: list[Edge[int]]) -> Graph[int]:
+    graph = Graph[int]()
+    for i in range(NUM_NODES):
+        graph.add_node(i)
+    for edge in edges:
+        graph.add_edge(edge.start, edge.end, edge.weight)
+    return graph
+
+
+def add_edges_from(edges: list[Edge[int]], *, validate: bool) -> Graph[int]:
+    graph = Graph[int]()
+    graph.add_nodes_from(range(NUM_NODES))
+    graph.add_edges_from(((e.start, e.end, e.weight) for e in edges), validate=validate)
+    return graph
+
+
+def adjacency_list(edges: list[Edge[int]]) -> Graph[int]:
+    adj: dict[int, dict[int, float]] = {i: {} for i in range(NUM_NODES)}
+    for edge in edges:
+        adj[edge.start][edge.end] = edge.weight
+    return Graph(adj)
+
+
+def edges_per_second(name: str, build_fn: Callable[[], Any]) -> None:
+    start = time.perf_counter()
+    build_fn()
+    elapsed = time.perf_counter() - start
+    print(f"{name:<32} {NUM_EDGES / elapsed:12,.0f} edges/s ({elapsed:.2f}s)")
+
+
+def main() -> None:
+    random.seed(0)
+    edges = [
+        Edge(random.randrange(NUM_NODES), random.randrange(NUM_NODES), random.random())
+        for _ in range(NUM_EDGES)
+    ]
+    edges_per_second("add_edge loop", lambda: add_edge_loop(edges))
+    edges_per_second("Graph(adjacency list)", lambda: adjacency_list(edges))
+    edges_per_second(
+        "add_edges_from(validate=True)", lambda: add_edges_from(edges, validate=True)
+    )
+    edges_per_second(
+        "add_edges_from(validate=False)", lambda: add_edges_from(edges, validate=False)
+    )
+    edges_per_second("Graph.from_edgelist", lambda: Graph.from_edgelist(edges))
+    edges_per_second("CSRGraph.from_edgelist", lambda: CSRGraph.from_edgelist(edges))
+
+
+if __name__ == "__main__":
+    main()
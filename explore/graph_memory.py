@@ -0,0 +1,62 @@
+"""
+Measures the memory used per edge by each graph representation using tracemalloc.
+Run with `python -m explore.graph_memory`.
+"""
+
+import random
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from cs.structures import CSRGraph, Graph
+
+NUM_NODES = 10_000
+NUM_EDGES = 200_000
+
+
+def build_graph(**kwargs: Any) -> Graph[int]:
+    graph = Graph[int](**kwargs)
+    for i in range(NUM_NODES):
+        graph.add_node(i)
+    for _ in range(NUM_EDGES):
+        graph.add_edge(
+            random.randrange(NUM_NODES), random.randrange(NUM_NODES), random.random()
+        )
+    return graph
+
+
+def bytes_per_edge(name: str, build_fn: Callable[[], Graph[int]]) -> None:
+    random.seed(0)
+    tracemalloc.start()
+    graph = build_fn()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"{name:<28} {current / graph.num_edges:8.1f} bytes/edge "
+        f"(peak {peak / graph.num_edges:8.1f}) over {graph.num_edges} edges"
+    )
+
+
+def main() -> None:
+    bytes_per_edge("Graph (directed)", build_graph)
+    bytes_per_edge("Graph (undirected)", lambda: build_graph(is_directed=False))
+    bytes_per_edge(
+        "Graph (undirected, shared)",
+        lambda: build_graph(is_directed=False, shared_edges=True),
+    )
+    bytes_per_edge("Graph (directed, weights)", lambda: build_graph(weights_only=True))
+    bytes_per_edge(
+        "Graph (undirected, weights)",
+        lambda: build_graph(is_directed=False, weights_only=True),
+    )
+    # Measures the steady state of the compact graph, after the source is freed.
+    graph = build_graph()
+    tracemalloc.start()
+    csr = CSRGraph(graph)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{'CSRGraph (directed)':<28} {current / csr.num_edges:8.1f} bytes/edge")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Compares the priority queues available to Dijkstra's algorithm on a grid graph with
+small integer weights. Run with `python -m explore.heaps`.
+"""
+
+import heapq
+import random
+import time
+from collections.abc import Callable
+
+from cs.structures import BinaryHeap, FibonacciHeap, Graph, RadixHeap
+
+GRID_SIZE = 200
+
+
+def grid_graph(size: int) -> Graph[int]:
+    graph = Graph[int](is_directed=False)
+    graph.add_nodes_from(range(size * size))
+    for v in range(size * size):
+        if v % size + 1 < size:
+            graph.add_edge(v, v + 1, random.randint(1, 100))
+        if v + size < size * size:
+            graph.add_edge(v, v + size, random.randint(1, 100))
+    return graph
+
+
+def dijkstra_decrease_key(
+    graph: Graph[int], heap: FibonacciHeap[int] | RadixHeap[int]
+) -> dict[int, float]:
+    heap.enqueue(0, 0)
+    distances = {}
+    while heap:
+        u, cost = heap.dequeue()
+        distances[u] = cost
+        for v, e in graph[u].items():
+            if v not in distances:
+                path_cost = cost + e.weight
+                if v not in heap:
+                    heap.enqueue(v, path_cost)
+                elif path_cost < heap[v].priority:
+                    heap.decrease_key(v, path_cost)
+    return distances
+
+
+def dijkstra_binary_heap(graph: Graph[int]) -> dict[int, float]:
+    heap = BinaryHeap[tuple[float, int]](key=lambda x: (-x[0], -x[1]))
+    queued = {0: 0.0}
+    heap.enqueue((0, 0))
+    distances = {}
+    # BinaryHeap keeps its list allocated after pops, so it is truthy when empty.
+    while len(heap):
+        cost, u = heap.pop()
+        del queued[u]
+        distances[u] = cost
+        for v, e in graph[u].items():
+            if v not in distances:
+                path_cost = cost + e.weight
+                if v not in queued:
+                    heap.enqueue((path_cost, v))
+                    queued[v] = path_cost
+                elif path_cost < queued[v]:
+                    heap.update((queued[v], v), (path_cost, v))
+                    queued[v] = path_cost
+    return distances
+
+
+def dijkstra_heapq(graph: Graph[int]) -> dict[int, float]:
+    heap: list[tuple[float, int]] = [(0, 0)]
+    distances: dict[int, float] = {}
+    while heap:
+        cost, u = heapq.heappop(heap)
+        if u in distances:
+            continue
+        distances[u] = cost
+        for v, e in graph[u].items():
+            if v not in distances:
+                heapq.heappush(heap, (cost + e.weight, v))
+    return distances
+
+
+def benchmark(
+    name: str, search_fn: Callable[[Graph[int]], dict[int, float]], graph: Graph[int]
+) -> dict[int, float]:
+    start = time.perf_counter()
+    result = search_fn(graph)
+    print(f"{name:>14}: {time.perf_counter() - start:.3f}s")
+    return result
+
+
+def main() -> None:
+    random.seed(0)
+    graph = grid_graph(GRID_SIZE)
+    print(f"{len(graph)} nodes, {graph.num_edges} edges")
+    expected = benchmark(
+        "FibonacciHeap",
+        lambda g: dijkstra_decrease_key(g, FibonacciHeap[int]()),
+        graph,
+    )
+    for name, search_fn in (
+        ("RadixHeap", lambda g: dijkstra_decrease_key(g, RadixHeap[int]())),
+        ("BinaryHeap", dijkstra_binary_heap),
+        ("heapq", dijkstra_heapq),
+    ):
+        assert benchmark(name, search_fn, graph) == expected
+
+
+if __name__ == "__main__":
+    main()
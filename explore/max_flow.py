@@ -0,0 +1,99 @@
+"""
+Compares the max flow algorithms on the networks from
+tests/algorithms/graph/problems/max_flow.py, scaled up 1000x: once by multiplying
+every capacity by 1000, and once by joining 1000 copies of each network between a
+shared source and sink. Run with `python -m explore.max_flow`.
+"""
+
+import functools
+import time
+from collections.abc import Callable
+from typing import Any
+
+from cs.algorithms import dinic_max_flow, edmonds_karp_max_flow, ford_max_flow
+from cs.structures import Graph
+
+SCALE = 1000
+MATRIX = [
+    [0, 16, 13, 0, 0, 0],
+    [0, 0, 10, 12, 0, 0],
+    [0, 4, 0, 0, 14, 0],
+    [0, 0, 9, 0, 0, 20],
+    [0, 0, 0, 7, 0, 4],
+    [0, 0, 0, 0, 0, 0],
+]
+BRILLIANT = {
+    "s": {"a": 4, "c": 3},
+    "a": {"b": 4},
+    "b": {"t": 2, "c": 3},
+    "c": {"d": 6},
+    "d": {"t": 6},
+    "t": {},
+}
+MAX_FLOW = 23 + 7
+
+MaxFlowFunction = Callable[[Graph[Any], Any, Any], float]
+
+
+def scaled_capacities() -> Graph[str]:
+    graph = Graph[str]()
+    graph.add_nodes_from(("source", "sink", *BRILLIANT))
+    graph.add_nodes_from(f"m{u}" for u in range(len(MATRIX)))
+    for u, row in enumerate(MATRIX):
+        for v, capacity in enumerate(row):
+            if capacity:
+                graph.add_edge(f"m{u}", f"m{v}", capacity * SCALE)
+    for u, neighbors in BRILLIANT.items():
+        for v, capacity in neighbors.items():
+            graph.add_edge(u, v, capacity * SCALE)
+    graph.add_edge("source", "m0", Graph.INFINITY)
+    graph.add_edge("source", "s", Graph.INFINITY)
+    graph.add_edge("m5", "sink", Graph.INFINITY)
+    graph.add_edge("t", "sink", Graph.INFINITY)
+    return graph
+
+
+def copies() -> Graph[str]:
+    graph = Graph[str]()
+    graph.add_nodes_from(("source", "sink"))
+    for i in range(SCALE):
+        graph.add_nodes_from(f"{i}{u}" for u in BRILLIANT)
+        graph.add_nodes_from(f"{i}m{u}" for u in range(len(MATRIX)))
+        for u, row in enumerate(MATRIX):
+            for v, capacity in enumerate(row):
+                if capacity:
+                    graph.add_edge(f"{i}m{u}", f"{i}m{v}", capacity)
+        for u, neighbors in BRILLIANT.items():
+            for v, capacity in neighbors.items():
+                graph.add_edge(f"{i}{u}", f"{i}{v}", capacity)
+        for u in ("m0", "s"):
+            graph.add_edge("source", f"{i}{u}", Graph.INFINITY)
+        for u in ("m5", "t"):
+            graph.add_edge(f"{i}{u}", "sink", Graph.INFINITY)
+    return graph
+
+
+def benchmark(name: str, max_flow_fn: MaxFlowFunction, graph: Graph[str]) -> None:
+    start = time.perf_counter()
+    flow = max_flow_fn(graph, "source", "sink")
+    assert flow == MAX_FLOW * SCALE
+    print(f"{name:>16}: {time.perf_counter() - start:.3f}s")
+
+
+def main() -> None:
+    algorithms: list[tuple[str, MaxFlowFunction]] = [
+        ("Ford-Fulkerson", functools.partial(ford_max_flow, dinic=False)),
+        ("Edmonds-Karp", edmonds_karp_max_flow),
+        ("Dinic", dinic_max_flow),
+    ]
+    for description, graph in (
+        (f"Capacities x{SCALE}", scaled_capacities()),
+        (f"{SCALE} copies", copies()),
+    ):
+        print(f"{description}: {len(graph)} nodes, {graph.num_edges} edges")
+        for name, max_flow_fn in algorithms:
+            benchmark(name, max_flow_fn, graph)
+
+
+if __name__ == "__main__":
+    main()
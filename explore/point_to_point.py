@@ -0,0 +1,80 @@
+"""
+Compares point-to-point shortest path searches on a weighted grid graph, which is a
+simple stand-in for a road network. Run with `python -m explore.point_to_point`.
+"""
+
+import random
+import time
+from collections.abc import Callable
+
+from cs.algorithms import (
+    a_star_search,
+    bidirectional_dijkstra_search,
+    dijkstra_search,
+    euclidean_heuristic,
+)
+from cs.algorithms.graph.dijkstras import dijkstra_search_heapq
+from cs.structures import Graph
+
+GRID_SIZE = 150
+NUM_QUERIES = 20
+
+
+def grid_graph(size: int) -> tuple[Graph[int], dict[int, tuple[int, int]]]:
+    """Every edge weighs at least 1, so straight-line distance is admissible."""
+    positions = {r * size + c: (r, c) for r in range(size) for c in range(size)}
+    graph = Graph[int](is_directed=False)
+    graph.add_nodes_from(positions)
+    for v, (r, c) in positions.items():
+        if c + 1 < size:
+            graph.add_edge(v, v + 1, random.randint(1, 10))
+        if r + 1 < size:
+            graph.add_edge(v, v + size, random.randint(1, 10))
+    return graph, positions
+
+
+def benchmark(
+    name: str,
+    search_fn: Callable[[int, int], float | None],
+    queries: list[tuple[int, int]],
+) -> list[float | None]:
+    start = time.perf_counter()
+    results = [search_fn(u, v) for u, v in queries]
+    elapsed = (time.perf_counter() - start) / len(queries)
+    print(f"{name:<32} {1000 * elapsed:10.2f} ms/query")
+    return results
+
+
+def main() -> None:
+    random.seed(0)
+    graph, positions = grid_graph(GRID_SIZE)
+    heuristic = euclidean_heuristic(positions)
+    nodes = list(graph)
+    queries = [(random.choice(nodes), random.choice(nodes)) for _ in range(NUM_QUERIES)]
+    print(f"{GRID_SIZE}x{GRID_SIZE} grid, {len(graph)} nodes, {NUM_QUERIES} queries")
+
+    expected = benchmark(
+        "dijkstra_search", lambda u, v: dijkstra_search(graph, u, v), queries
+    )
+    results = [
+        benchmark(
+            "dijkstra_search_heapq",
+            lambda u, v: dijkstra_search_heapq(graph, u, v),
+            queries,
+        ),
+        benchmark(
+            "bidirectional_dijkstra_search",
+            lambda u, v: bidirectional_dijkstra_search(graph, u, v),
+            queries,
+        ),
+        benchmark(
+            "a_star_search (euclidean)",
+            lambda u, v: a_star_search(graph, u, v, heuristic),
+            queries,
+        ),
+    ]
+    assert all(result == expected for result in results)
+
+
+if __name__ == "__main__":
+    main()
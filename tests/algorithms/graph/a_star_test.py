@@ -0,0 +1,48 @@
+import pytest
+
+from cs.algorithms import a_star_search, dijkstra_shortest_paths, euclidean_heuristic
+from cs.structures import Graph
+
+
+def grid_graph(size: int) -> tuple[Graph[int], dict[int, tuple[int, int]]]:
+    positions = {r * size + c: (r, c) for r in range(size) for c in range(size)}
+    graph = Graph[int](is_directed=False)
+    graph.add_nodes_from(positions)
+    for v, (r, c) in positions.items():
+        if c + 1 < size:
+            graph.add_edge(v, v + 1, 1 + (v * 7) % 5)
+        if r + 1 < size:
+            graph.add_edge(v, v + size, 1 + (v * 3) % 4)
+    return graph, positions
+
+
+class TestAStar:
+    @staticmethod
+    def test_grid() -> None:
+        graph, positions = grid_graph(6)
+        heuristic = euclidean_heuristic(positions)
+        for u in graph:
+            distances = dijkstra_shortest_paths(graph, u)
+            for v in graph:
+                assert a_star_search(graph, u, v, heuristic) == distances[v]
+                assert a_star_search(graph, u, v, lambda *_: 0) == distances[v]
+
+    @staticmethod
+    def test_inconsistent_heuristic() -> None:
+        graph = Graph[str](
+            {"s": {"a": 1, "b": 4}, "a": {"b": 1}, "b": {"t": 5}, "t": {}}
+        )
+        # Admissible, but not consistent, so "b" is reached again via "a".
+        estimates = {"s": 0, "a": 5, "b": 0, "t": 0}
+        assert a_star_search(graph, "s", "t", lambda v, _: estimates[v]) == 7
+
+    @staticmethod
+    def test_unreachable() -> None:
+        graph = Graph[str]({"a": {"b": 1}, "b": {}, "c": {"a": -1}})
+
+        assert a_star_search(graph, "b", "a", lambda *_: 0) == Graph.INFINITY
+        assert a_star_search(graph, "a", "a", lambda *_: 0) == 0
+        with pytest.raises(RuntimeError):
+            _ = a_star_search(graph, "c", "b", lambda *_: 0)
+        with pytest.raises(KeyError):
+            _ = a_star_search(graph, "a", "z", lambda *_: 0)
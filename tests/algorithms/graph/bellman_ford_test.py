@@ -1,10 +1,30 @@
 import pytest
 
-from cs.algorithms import bellman_ford_shortest_paths
+from cs.algorithms import (
+    bellman_ford_shortest_paths,
+    find_negative_cycle,
+    spfa_shortest_paths,
+)
 from cs.structures import Edge, Graph
 from tests.algorithms.graph.problems.apsp import AllPairsShortestPaths
 
 
+def negative_cycle_graph() -> Graph[int]:
+    e01 = Edge(0, 1, -1)
+    e05 = Edge(0, 5, 2)
+    e12 = Edge(1, 2, 2)
+    e15 = Edge(1, 5, -2)
+    e23 = Edge(2, 3, 5)
+    e24 = Edge(2, 4, 1)
+    e43 = Edge(4, 3, -4)
+    e45 = Edge(4, 5, 3)
+    e51 = Edge(5, 1, 2)
+    e52 = Edge(5, 2, 3)
+    return Graph.from_edgelist(
+        [e01, e05, e12, e15, e23, e24, e43, e45, e51, e52], is_directed=False
+    )
+
+
 @pytest.mark.add_function("shortest_paths_fn")
 class TestFloydWarshall(AllPairsShortestPaths):
     shortest_paths_fn = AllPairsShortestPaths.single_source_to_all_pairs(
@@ -13,19 +33,48 @@ class TestFloydWarshall(AllPairsShortestPaths):
 
     @staticmethod
     def test_negative_cycles() -> None:
-        e01 = Edge(0, 1, -1)
-        e05 = Edge(0, 5, 2)
-        e12 = Edge(1, 2, 2)
-        e15 = Edge(1, 5, -2)
-        e23 = Edge(2, 3, 5)
-        e24 = Edge(2, 4, 1)
-        e43 = Edge(4, 3, -4)
-        e45 = Edge(4, 5, 3)
-        e51 = Edge(5, 1, 2)
-        e52 = Edge(5, 2, 3)
-        graph2 = Graph.from_edgelist(
-            [e01, e05, e12, e15, e23, e24, e43, e45, e51, e52], is_directed=False
-        )
+        with pytest.raises(AssertionError):
+            _ = bellman_ford_shortest_paths(negative_cycle_graph(), 0)
+
+
+@pytest.mark.add_function("shortest_paths_fn")
+class TestSPFA(AllPairsShortestPaths):
+    shortest_paths_fn = AllPairsShortestPaths.single_source_to_all_pairs(
+        spfa_shortest_paths
+    )
 
+    @staticmethod
+    def test_negative_cycles() -> None:
         with pytest.raises(AssertionError):
-            _ = bellman_ford_shortest_paths(graph2, 0)
+            _ = spfa_shortest_paths(negative_cycle_graph(), 0)
+
+    @staticmethod
+    def test_find_negative_cycle() -> None:
+        graph = Graph[str](
+            {
+                "s": {"a": 1},
+                "a": {"b": 1},
+                "b": {"c": -2},
+                "c": {"a": 0, "d": 1},
+                "d": {},
+                "e": {"f": -1},
+                "f": {"e": 0},
+            }
+        )
+
+        cycle = find_negative_cycle(graph, "s")
+        assert cycle is not None
+        assert sorted(cycle) == ["a", "b", "c"]
+        edges = zip(cycle, cycle[1:] + cycle[:1], strict=True)
+        assert sum(graph[u][v].weight for u, v in edges) < 0
+
+        assert find_negative_cycle(graph, "d") is None
+        assert find_negative_cycle(graph, "e") in (["e", "f"], ["f", "e"])
+
+        int_graph = negative_cycle_graph()
+        int_cycle = find_negative_cycle(int_graph)
+        assert int_cycle is not None
+        int_edges = zip(int_cycle, int_cycle[1:] + int_cycle[:1], strict=True)
+        assert sum(int_graph[u][v].weight for u, v in int_edges) < 0
+
+        assert find_negative_cycle(Graph[int]({0: {1: 1}, 1: {0: -1}})) is None
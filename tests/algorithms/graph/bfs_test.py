@@ -1,4 +1,12 @@
-from cs.algorithms import breadth_first_search
+import random
+
+from cs.algorithms import (
+    bfs_level_array,
+    bfs_levels,
+    breadth_first_order,
+    breadth_first_search,
+)
+from cs.algorithms.graph.bfs import adjacency_arrays
 from cs.structures import Graph
 
 
@@ -37,3 +45,65 @@ class TestBFS:
         graph = Graph[str]({"a": {}, "b": {}, "c": {}})
 
         assert breadth_first_search(graph, "a", "b") == []
+
+    @staticmethod
+    def test_long_path() -> None:
+        n = 100_000
+        graph = Graph[int]({i: [i + 1] for i in range(n)} | {n: []})
+
+        assert breadth_first_search(graph, 0, n) == list(range(n + 1))
+
+    @staticmethod
+    def test_breadth_first_order() -> None:
+        graph = Graph[int](
+            {0: [1, 2], 1: [0, 3, 4], 2: [0, 3], 3: [1], 4: [2, 3], 5: []}
+        )
+
+        assert list(breadth_first_order(graph, 0)) == [0, 1, 2, 3, 4]
+        assert list(breadth_first_order(graph, 5)) == [5]
+        order = breadth_first_order(graph, 4)
+        assert next(order) == 4
+        assert next(order) == 2
+
+    @staticmethod
+    def test_bfs_levels() -> None:
+        graph = Graph[int](
+            {0: [1, 2], 1: [0, 3, 4], 2: [0, 3], 3: [1], 4: [2, 3], 5: []}
+        )
+
+        assert bfs_levels(graph, 0) == {0: 0, 1: 1, 2: 1, 3: 2, 4: 2}
+        assert bfs_levels(graph, 4) == {4: 0, 2: 1, 3: 1, 0: 2, 1: 2}
+        assert bfs_levels(graph, 5) == {5: 0}
+
+    @staticmethod
+    def test_direction_optimizing() -> None:
+        """Every mix of top-down and bottom-up steps gives the same levels."""
+        n = 500
+        edges = [(random.randrange(n), random.randrange(n)) for _ in range(2000)]
+        offsets, targets = adjacency_arrays(n, edges)
+        reverse_offsets, reverse_targets = adjacency_arrays(
+            n, ((v, u) for u, v in edges)
+        )
+        graph = Graph[int]({v: {} for v in range(n)})
+        for u, v in edges:
+            if not graph.has_edge(u, v):
+                graph.add_edge(u, v)
+
+        for source in range(0, n, 50):
+            expected = [-1] * n
+            expected[source] = 0
+            for v in breadth_first_order(graph, source):
+                for neighbor in graph[v]:
+                    if expected[neighbor] < 0 and neighbor != source:
+                        expected[neighbor] = expected[v] + 1
+            for alpha, beta in ((0, 18), (15, 18), (1e9, 1), (1e9, 1e9)):
+                levels = bfs_level_array(
+                    offsets,
+                    targets,
+                    reverse_offsets,
+                    reverse_targets,
+                    source,
+                    alpha=alpha,
+                    beta=beta,
+                )
+                assert list(levels) == expected
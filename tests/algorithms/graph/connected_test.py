@@ -12,3 +12,23 @@ def test_connected_components() -> None:
         {0: [1, 2, 3], 1: [0, 3], 2: [0], 3: [0, 1], 4: [], 5: []}
     )
     assert connected_components(test_graph_2) == [{0, 1, 3, 2}, {4}, {5}]
+
+
+def test_union_find_components() -> None:
+    graph = Graph[int](
+        {0: [1, 2], 1: [0, 3], 2: [0], 3: [1], 4: [5, 6], 5: [4, 6], 6: [4, 5]},
+        is_directed=False,
+    )
+    assert connected_components(graph, union_find=True) == [{0, 1, 3, 2}, {4, 5, 6}]
+
+    # Directed graphs are split into weakly connected components.
+    directed_graph = Graph[int]({0: [], 1: [0], 2: [3], 3: [], 4: [3], 5: []})
+    assert connected_components(directed_graph, union_find=True) == [
+        {0, 1},
+        {2, 3, 4},
+        {5},
+    ]
+
+    n = 100_000
+    path = Graph[int]({i: [i + 1] for i in range(n)} | {n: []})
+    assert connected_components(path, union_find=True) == [set(range(n + 1))]
@@ -1,4 +1,4 @@
-from cs.algorithms import depth_first_search
+from cs.algorithms import depth_first_order, depth_first_search, dfs_traversal
 from cs.algorithms.graph.dfs import depth_first_search_recursive
 from cs.structures import Graph
 
@@ -30,3 +30,23 @@ class TestDFS:
 
         assert depth_first_search(graph, "a", "b") == []
         assert depth_first_search_recursive(graph, "b", "c") == []
+
+    @staticmethod
+    def test_depth_first_order() -> None:
+        graph = Graph[int](
+            {0: [1, 2], 1: [0, 3, 4], 2: [0, 3], 3: [1], 4: [2, 3], 5: []}
+        )
+
+        assert list(depth_first_order(graph, 0)) == [0, 1, 3, 4, 2]
+        assert list(depth_first_order(graph, 5)) == [5]
+
+    @staticmethod
+    def test_long_path() -> None:
+        n = 100_000
+        graph = Graph[int]({i: [i + 1] for i in range(n)} | {n: []})
+
+        assert depth_first_search(graph, 0, n) == list(range(n + 1))
+        assert list(depth_first_order(graph, 0)) == list(range(n + 1))
+        visited: set[int] = set()
+        assert dfs_traversal(graph, 0, visited) == set(range(n + 1))
+        assert visited == set(range(n + 1))
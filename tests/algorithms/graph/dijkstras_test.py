@@ -1,9 +1,19 @@
-from typing import Any, override
+from typing import Any, Never, override
 
 import pytest
 
-from cs.algorithms import dijkstra_search, dijkstra_shortest_paths
-from cs.structures import Graph
+from cs.algorithms import (
+    batched_dijkstra_shortest_paths,
+    bidirectional_dijkstra_search,
+    dijkstra_search,
+    dijkstra_shortest_path_arrays,
+    dijkstra_shortest_path_tree,
+    dijkstra_shortest_paths,
+    multi_source_shortest_paths,
+)
+from cs.algorithms.graph import dijkstras
+from cs.structures import CSRGraph, FibonacciHeap, Graph, RadixHeap
+from cs.util import Comparable
 from tests.algorithms.graph.problems.apsp import AllPairsShortestPaths, APSPFunction
 
 
@@ -49,6 +59,226 @@ class TestDijkstras(AllPairsShortestPaths):
         assert dijkstra_search(G2, 5, 6) == 3
         assert dijkstra_search(G3, "E", "F") == 3
 
+    @staticmethod
+    def test_cutoffs() -> None:
+        graph = Graph[str](
+            {
+                "a": {"b": 1, "c": 4},
+                "b": {"c": 2, "d": 5},
+                "c": {"d": 1},
+                "d": {},
+                "e": {"a": 1},
+            }
+        )
+
+        assert dijkstra_shortest_paths(graph, "a", max_distance=3) == {
+            "a": 0,
+            "b": 1,
+            "c": 3,
+        }
+        assert dijkstra_shortest_paths(graph, "a", targets=["b"]) == {"a": 0, "b": 1}
+        assert dijkstra_shortest_paths(graph, "a", targets=[]) == {"a": 0}
+        assert dijkstra_shortest_paths(graph, "a", targets=["e"]) == {
+            "a": 0,
+            "b": 1,
+            "c": 3,
+            "d": 4,
+        }
+        assert dijkstra_search(graph, "a", "e") == Graph.INFINITY
+        assert dijkstra_search(graph, "a", "z") is None
+
+    @staticmethod
+    def test_mixed_weights() -> None:
+        """A single non-integer weight makes the search use a FibonacciHeap."""
+        graph = Graph[str](
+            {"a": {"b": 1, "c": 4}, "b": {"c": 0.5, "d": 5}, "c": {"d": 1}, "d": {}}
+        )
+
+        assert dijkstra_shortest_paths(graph, "a") == {
+            "a": 0,
+            "b": 1,
+            "c": 1.5,
+            "d": 2.5,
+        }
+
+    @staticmethod
+    def test_csr_integer_weights(monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        CSRGraph stores weights as floats, but integral ones stay on the RadixHeap,
+        and the first oversized weight the search relaxes moves it to a FibonacciHeap.
+        """
+        heaps: list[RadixHeap[Any] | FibonacciHeap[Any]] = []
+
+        class RecordingRadixHeap[T: Comparable](RadixHeap[T]):
+            def __init__(self) -> None:
+                super().__init__()
+                heaps.append(self)
+
+        class RecordingFibonacciHeap[T: Comparable](FibonacciHeap[T]):
+            def __init__(self) -> None:
+                super().__init__()
+                heaps.append(self)
+
+        monkeypatch.setattr(dijkstras, "RadixHeap", RecordingRadixHeap)
+        monkeypatch.setattr(dijkstras, "FibonacciHeap", RecordingFibonacciHeap)
+        graph = Graph[str](
+            {"a": {"b": 1, "c": 4}, "b": {"c": 2, "d": 5}, "c": {"d": 1}, "d": {}}
+        )
+        csr = CSRGraph(graph)
+
+        assert dijkstra_shortest_paths(csr, "a") == {"a": 0, "b": 1, "c": 3, "d": 4}
+        assert [type(heap) for heap in heaps] == [RecordingRadixHeap]
+
+        heaps.clear()
+        graph.add_edge("a", "d", 2**40)
+        assert dijkstra_shortest_paths(CSRGraph(graph), "a")["d"] == 4
+        assert [type(heap) for heap in heaps] == [
+            RecordingRadixHeap,
+            RecordingFibonacciHeap,
+        ]
+
+        heaps.clear()
+        assert dijkstra_shortest_paths(csr, "a", integer_weights=False)["d"] == 4
+        assert [type(heap) for heap in heaps] == [RecordingFibonacciHeap]
+
+    @staticmethod
+    def test_heap_choice_does_not_scan_graph(monkeypatch: pytest.MonkeyPatch) -> None:
+        """Only the edges the search relaxes are checked for integer weights."""
+
+        def has_integer_weights(max_weight: float) -> Never:
+            raise AssertionError(f"Scanned every edge weight for {max_weight}.")
+
+        graph = Graph[int]()
+        graph.add_edges_from(((i, i + 1, 0.5) for i in range(1000)), validate=False)
+        monkeypatch.setattr(graph, "has_integer_weights", has_integer_weights)
+
+        assert dijkstra_search(graph, 0, 3) == 1.5
+        distances = dijkstra_shortest_paths(
+            graph, 0, targets=(2,), integer_weights=False
+        )
+        assert distances[2] == 1
+
+    @staticmethod
+    def test_shortest_path_tree() -> None:
+        graph = Graph[str](
+            {"a": {"b": 1, "c": 4}, "b": {"c": 2, "d": 5}, "c": {"d": 1}, "d": {}}
+        )
+
+        assert dijkstra_shortest_path_tree(graph, "a") == (
+            {"a": 0, "b": 1, "c": 3, "d": 4},
+            {"b": "a", "c": "b", "d": "c"},
+        )
+        assert dijkstra_shortest_path_tree(graph, "a", max_distance=1) == (
+            {"a": 0, "b": 1},
+            {"b": "a"},
+        )
+
+    @staticmethod
+    def test_batched() -> None:
+        graph = Graph[str](
+            {
+                "a": {"b": 1, "c": 4},
+                "b": {"c": 2, "d": 5},
+                "c": {"d": 1},
+                "d": {"a": 2},
+                "e": {"a": 1},
+            }
+        )
+        expected = {u: dijkstra_shortest_paths(graph, u) for u in graph}
+
+        assert dict(batched_dijkstra_shortest_paths(graph, graph)) == expected
+        assert dict(batched_dijkstra_shortest_paths(graph, "ec", chunk_size=1)) == {
+            "e": expected["e"],
+            "c": expected["c"],
+        }
+        rows = batched_dijkstra_shortest_paths(
+            graph, graph, max_workers=2, chunk_size=2
+        )
+        assert dict(rows) == expected
+
+        int_graph = Graph[int]({0: {1: 1, 2: 4}, 1: {2: 1}, 2: {}})
+        assert [
+            (s, list(costs), list(parents))
+            for s, costs, parents in dijkstra_shortest_path_arrays(
+                int_graph, [0, 2], paths=True
+            )
+        ] == [(0, [0, 1, 2], [-1, 0, 1]), (2, [Graph.INFINITY] * 2 + [0], [-1] * 3)]
+
+        with pytest.raises(ValueError, match="chunk_size"):
+            next(batched_dijkstra_shortest_paths(graph, graph, chunk_size=0))
+        with pytest.raises(RuntimeError):
+            next(batched_dijkstra_shortest_paths(Graph[int]({0: {1: -1}}), [0]))
+
+    @staticmethod
+    def test_multi_source() -> None:
+        graph = Graph[str](
+            {
+                "a": {"b": 1},
+                "b": {"a": 1, "c": 1},
+                "c": {"b": 1, "d": 1},
+                "d": {"c": 1, "e": 4},
+                "e": {"d": 4},
+                "f": {},
+            }
+        )
+
+        distances, nearest = multi_source_shortest_paths(graph, ["a", "e"])
+        assert distances == {
+            "a": 0,
+            "b": 1,
+            "c": 2,
+            "d": 3,
+            "e": 0,
+            "f": Graph.INFINITY,
+        }
+        assert nearest == {"a": "a", "b": "a", "c": "a", "d": "a", "e": "e"}
+        assert multi_source_shortest_paths(graph, ["c"])[0] == (
+            dijkstra_shortest_paths(graph, "c")
+        )
+        with pytest.raises(KeyError):
+            _ = multi_source_shortest_paths(graph, ["z"])
+
+    @staticmethod
+    def test_bidirectional_search(monkeypatch: pytest.MonkeyPatch) -> None:
+        adj_list = {
+            "A": {"B": 2, "C": 5},
+            "B": {"A": 2, "D": 3, "E": 1, "F": 1},
+            "C": {"A": 5, "F": 3},
+            "D": {"B": 3},
+            "E": {"B": 4, "F": 3},
+            "F": {"C": 3, "E": 3},
+            "G": {"A": 1},
+        }
+        for graph in (
+            Graph[str](adj_list),
+            Graph[str](adj_list, index_predecessors=True),
+            Graph[str](adj_list, is_directed=False),
+            CSRGraph[str](adj_list),
+        ):
+            for u in graph:
+                distances = dijkstra_shortest_paths(graph, u)
+                for v in graph:
+                    assert bidirectional_dijkstra_search(graph, u, v) == distances[v]
+
+        # Without a predecessor index, the reversed edges are collected up front
+        # instead of scanning the graph for predecessors on every pop.
+        def scan(v: str) -> Never:
+            raise AssertionError(f"predecessors({v}) scans the whole graph.")
+
+        assert Graph[str](adj_list, index_predecessors=True).has_predecessor_index
+        assert CSRGraph[str](adj_list).has_predecessor_index
+        graph = Graph[str](adj_list)
+        assert not graph.has_predecessor_index
+        monkeypatch.setattr(graph, "predecessors", scan)
+        assert bidirectional_dijkstra_search(graph, "G", "E") == 4
+
+        graph = Graph[str]({"a": {"b": 1}, "b": {}, "c": {"a": -1}})
+        assert bidirectional_dijkstra_search(graph, "b", "a") == Graph.INFINITY
+        with pytest.raises(RuntimeError):
+            _ = bidirectional_dijkstra_search(graph, "c", "b")
+        with pytest.raises(KeyError):
+            _ = bidirectional_dijkstra_search(graph, "a", "z")
+
     @staticmethod
     @override
     def test_adj_list_neg_weights(shortest_paths_fn: APSPFunction[Any]) -> None:
@@ -0,0 +1,47 @@
+import random
+
+import pytest
+
+from cs.algorithms import dinic_max_flow, dinic_max_flow_network, edmonds_karp_max_flow
+from cs.structures import Graph
+from tests.algorithms.graph.problems.max_flow import MaxFlow
+
+
+@pytest.mark.add_function("max_flow_fn")
+class TestDinic(MaxFlow):
+    max_flow_fn = dinic_max_flow
+
+    @staticmethod
+    def test_random_graphs() -> None:
+        for _ in range(20):
+            graph = Graph[int]({v: {} for v in range(30)})
+            for _ in range(120):
+                u, v = random.sample(range(30), 2)
+                graph.add_edge(u, v, random.randint(1, 20))
+
+            assert dinic_max_flow(graph, 0, 29) == edmonds_karp_max_flow(graph, 0, 29)
+
+    @staticmethod
+    def test_flow_network() -> None:
+        graph = Graph[str](
+            {
+                "s": {"a": 4, "c": 3},
+                "a": {"b": 4},
+                "b": {"t": 2, "c": 3},
+                "c": {"d": 6},
+                "d": {"t": 6},
+                "t": {},
+            }
+        )
+
+        network = dinic_max_flow_network(graph, "s", "t")
+
+        assert sum(edge["flow"] for edge in network["s"].values()) == 7
+        for u in network:
+            assert all(0 <= e["flow"] <= e["capacity"] for e in network[u].values())
+            if u not in {"s", "t"}:
+                inflow = sum(network[v][u]["flow"] for v in network.predecessors(u))
+                assert inflow == sum(e["flow"] for e in network[u].values())
+        assert dinic_max_flow(graph, "s", "s") == 0
+        with pytest.raises(KeyError):
+            _ = dinic_max_flow(graph, "s", "z")
@@ -1,9 +1,66 @@
+import functools
+
+import numpy as np
 import pytest
 
-from cs.algorithms import floyd_warshall_shortest_paths
+from cs.algorithms import floyd_warshall_matrix, floyd_warshall_shortest_paths
+from cs.structures import Graph
 from tests.algorithms.graph.problems.apsp import AllPairsShortestPaths
 
+INF = Graph.INFINITY
+
 
 @pytest.mark.add_function("shortest_paths_fn")
 class TestFloydWarshall(AllPairsShortestPaths):
     shortest_paths_fn = floyd_warshall_shortest_paths
+
+
+@pytest.mark.add_function("shortest_paths_fn")
+class TestFloydWarshallBlocked(AllPairsShortestPaths):
+    shortest_paths_fn = functools.partial(floyd_warshall_shortest_paths, block_size=2)
+
+
+@pytest.mark.add_function("shortest_paths_fn")
+class TestFloydWarshallDicts(AllPairsShortestPaths):
+    shortest_paths_fn = functools.partial(
+        floyd_warshall_shortest_paths, vectorized=False
+    )
+
+
+class TestFloydWarshallMatrix:
+    @staticmethod
+    def test_graph() -> None:
+        graph = Graph[str]({"c": {"a": 1}, "a": {"b": 4}, "b": {"c": -2}})
+        dist, nodes = floyd_warshall_matrix(graph)
+
+        assert nodes == ["a", "b", "c"]
+        assert dist.tolist() == [[0, 4, 2], [-1, 0, -2], [1, 5, 0]]
+
+    @staticmethod
+    def test_matrix_inputs() -> None:
+        matrix = np.array(
+            [[0, 5, INF, 10], [INF, 0, 3, INF], [INF, INF, 0, 1], [INF] * 4]
+        )
+        expected = [[0, 5, 8, 9], [INF, 0, 3, 4], [INF, INF, 0, 1], [INF, INF, INF, 0]]
+        graph = Graph.from_matrix(matrix, zero_is_no_edge=False)
+
+        dist, nodes = floyd_warshall_matrix(matrix)
+        assert nodes == [0, 1, 2, 3]
+        assert dist.tolist() == expected
+        assert matrix[3, 3] == INF
+        assert floyd_warshall_matrix(graph.to_csr())[0].tolist() == expected
+        assert floyd_warshall_matrix(graph.to_coo())[0].tolist() == expected
+
+    @staticmethod
+    def test_blocked() -> None:
+        rng = np.random.default_rng(0)
+        matrix = rng.integers(-1, 20, (50, 50)).astype(float)
+        matrix[matrix < 10] = INF
+        expected, _ = floyd_warshall_matrix(matrix, block_size=50)
+
+        for block_size in (1, 7, 16, 64):
+            dist, _ = floyd_warshall_matrix(matrix, block_size=block_size)
+            assert np.array_equal(dist, expected)
+
+        with pytest.raises(ValueError, match="block_size"):
+            floyd_warshall_matrix(matrix, block_size=0)
@@ -1,3 +1,5 @@
+import functools
+
 import pytest
 
 from cs.algorithms import bipartite_matching, ford_max_flow
@@ -10,9 +12,15 @@ class TestFordFulkerson(MaxFlow):
     max_flow_fn = ford_max_flow
 
 
+@pytest.mark.add_function("max_flow_fn")
+class TestFordFulkersonAugmentingPaths(MaxFlow):
+    max_flow_fn = functools.partial(ford_max_flow, dinic=False)
+
+
 class TestBipartiteMatching:
     @staticmethod
-    def test_bipartite_matching() -> None:
+    @pytest.mark.parametrize("dinic", [True, False])
+    def test_bipartite_matching(dinic: bool) -> None:
         """
         Bipartite matching:
         .    / D
@@ -30,7 +38,9 @@ class TestBipartiteMatching:
         graph.add_edge("C", "E")
 
         max_flow_graph, matching_edges = bipartite_matching(
-            graph, ["A", "B", "C"], ["D", "E", "F"]
+            graph, ["A", "B", "C"], ["D", "E", "F"], dinic=dinic
         )
         assert len(max_flow_graph.edges) == 11
+        assert len(graph) == 6
+        assert graph.num_edges == 5
         assert matching_edges == [Edge("A", "E"), Edge("B", "F"), Edge("C", "D")]
@@ -0,0 +1,97 @@
+import random
+from array import array
+
+from cs.algorithms import bipartite_matching, hopcroft_karp_matching
+from cs.algorithms.graph.hopcroft_karp import _Matching
+from cs.structures import Graph
+
+
+class TestHopcroftKarp:
+    @staticmethod
+    def test_matching() -> None:
+        graph = Graph[str]({char: {} for char in "ABCDEF"})
+        graph.add_edge("A", "E")
+        graph.add_edge("B", "E")
+        graph.add_edge("B", "F")
+        graph.add_edge("C", "D")
+        graph.add_edge("C", "E")
+
+        assert hopcroft_karp_matching(graph, "ABC", "DEF") == {
+            "E": "A",
+            "F": "B",
+            "D": "C",
+        }
+        assert len(graph) == 6
+        assert graph.num_edges == 5
+
+    @staticmethod
+    def test_capacities() -> None:
+        graph = Graph[str](
+            {
+                "A": {"C": 1, "D": 1, "E": 1},
+                "B": {"E": 1},
+                "C": {},
+                "D": {},
+                "E": {},
+            }
+        )
+
+        assert hopcroft_karp_matching(graph, {"A": 2, "B": 1}, "CDE") == {
+            "C": "A",
+            "D": "A",
+            "E": "B",
+        }
+        matching = hopcroft_karp_matching(graph, {"A": 3, "B": 0}, "CDE")
+        assert matching == {"C": "A", "D": "A", "E": "A"}
+        assert hopcroft_karp_matching(graph, {"A": 0, "B": 0}, "CDE") == {}
+
+    @staticmethod
+    def test_random_graphs() -> None:
+        for _ in range(20):
+            left = [f"l{i}" for i in range(30)]
+            right = [f"r{i}" for i in range(25)]
+            graph = Graph[str]({v: {} for v in left + right})
+            for _ in range(60):
+                graph.add_edge(random.choice(left), random.choice(right))
+            capacities = {u: random.randint(0, 2) for u in left}
+
+            matching = hopcroft_karp_matching(graph, capacities, right)
+            _, matching_edges = bipartite_matching(graph, capacities, right)
+
+            assert len(matching) == len(matching_edges)
+            assert all(graph.has_edge(u, v) for v, u in matching.items())
+            for u, capacity in capacities.items():
+                assert list(matching.values()).count(u) <= capacity
+
+    @staticmethod
+    def test_sides_from_is_bipartite() -> None:
+        graph = Graph[str](
+            {"A": ["E"], "B": ["E", "F"], "C": ["D", "E"], "D": [], "E": [], "F": []}
+        )
+        sides = graph.is_bipartite(witness=True)
+        assert isinstance(sides, tuple)
+        left, right = sides
+        assert left == set("ABC")
+
+        assert len(hopcroft_karp_matching(graph, left, right)) == 3
+        _, matching_edges = bipartite_matching(graph, left, right)
+        assert len(matching_edges) == 3
+
+    @staticmethod
+    def test_shortest_augmenting_paths() -> None:
+        # Slot 1 is matched with right node 1. From slot 0, the longer augmenting path
+        # 0 - 1 - 1 - 3 is found first, but a phase must only use the shortest, 0 - 2.
+        matching = _Matching([array("i", [1, 2]), array("i", [1, 3])], [1, 1], 4)
+        matching.match_slot[1] = 1
+        matching.match_right[1] = 1
+
+        assert matching._label_levels()  # noqa: SLF001
+        assert matching.limit == 0
+        assert list(matching.levels) == [0, 1]
+        matching.current = array("i", [0, 0])
+        matching._augment(0)  # noqa: SLF001
+        assert list(matching.match_slot) == [2, 1]
+        assert list(matching.match_right) == [-1, 1, 0, -1]
+
+        matching.maximize()
+        assert list(matching.match_slot) == [2, 1]
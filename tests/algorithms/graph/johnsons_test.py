@@ -1,9 +1,45 @@
+import functools
+
 import pytest
 
-from cs.algorithms import johnsons_shortest_paths
+from cs.algorithms import johnsons_shortest_path_rows, johnsons_shortest_paths
+from cs.structures import Graph
 from tests.algorithms.graph.problems.apsp import AllPairsShortestPaths
 
 
 @pytest.mark.add_function("shortest_paths_fn")
 class TestJohnsons(AllPairsShortestPaths):
     shortest_paths_fn = johnsons_shortest_paths
+
+
+@pytest.mark.add_function("shortest_paths_fn")
+class TestJohnsonsParallel(AllPairsShortestPaths):
+    shortest_paths_fn = functools.partial(
+        johnsons_shortest_paths, max_workers=2, chunk_size=2
+    )
+
+
+class TestJohnsonsRows:
+    @staticmethod
+    def test_rows() -> None:
+        graph = Graph[str](
+            {
+                "a": {"b": -1, "c": 4},
+                "b": {"c": 3, "d": 2, "e": 2},
+                "c": {},
+                "d": {"b": 1, "c": 5},
+                "e": {"d": -3},
+            }
+        )
+        expected = johnsons_shortest_paths(graph)
+        rows = johnsons_shortest_path_rows(graph, max_workers=2, chunk_size=1)
+
+        assert dict(rows) == expected
+        assert dict(johnsons_shortest_path_rows(graph)) == expected
+
+        table = johnsons_shortest_paths(graph, paths=True, max_workers=2)
+        assert table.distances == expected
+        assert table.path("a", "d") == ["a", "b", "e", "d"]
+
+        with pytest.raises(ValueError, match="chunk_size"):
+            next(johnsons_shortest_path_rows(graph, chunk_size=0))
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import itertools
+from array import array
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from cs.algorithms import (
+    PathTable,
+    floyd_warshall_shortest_paths,
+    johnsons_shortest_paths,
+)
+from cs.structures import Graph
+from cs.util import Comparable
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+INF = Graph.INFINITY
+
+PATH_FNS: list[Callable[[Graph[Any]], PathTable[Any]]] = [
+    lambda graph: floyd_warshall_shortest_paths(graph, paths=True),
+    lambda graph: floyd_warshall_shortest_paths(graph, paths=True, block_size=2),
+    lambda graph: floyd_warshall_shortest_paths(graph, paths=True, vectorized=False),
+    lambda graph: johnsons_shortest_paths(graph, paths=True),
+]
+
+
+def assert_paths_match_distances[V: Comparable](
+    graph: Graph[V], table: PathTable[V]
+) -> None:
+    for u in graph:
+        for v in graph:
+            path = table.path(u, v)
+            if table.distances[u][v] == INF:
+                assert path == []
+            else:
+                assert path[0] == u
+                assert path[-1] == v
+                cost = sum(graph[a][b].weight for a, b in itertools.pairwise(path))
+                assert cost == table.distances[u][v]
+
+
+class TestPathTable:
+    @staticmethod
+    @pytest.mark.parametrize("paths_fn", PATH_FNS)
+    def test_neg_weights(paths_fn: Callable[[Graph[Any]], PathTable[Any]]) -> None:
+        graph = Graph[str](
+            {
+                "a": {"b": -1, "c": 4},
+                "b": {"c": 3, "d": 2, "e": 2},
+                "c": {},
+                "d": {"b": 1, "c": 5},
+                "e": {"d": -3},
+            }
+        )
+        table = paths_fn(graph)
+
+        assert table.distances == floyd_warshall_shortest_paths(graph)
+        assert table.path("a", "d") == ["a", "b", "e", "d"]
+        assert table.path("a", "c") == ["a", "b", "c"]
+        assert table.path("c", "a") == []
+        assert table.path("d", "d") == ["d"]
+        assert len(table.predecessors) == len(graph) ** 2
+        assert table.predecessors.itemsize == 4
+        assert_paths_match_distances(graph, table)
+
+    @staticmethod
+    @pytest.mark.parametrize("paths_fn", PATH_FNS)
+    def test_adj_list(paths_fn: Callable[[Graph[Any]], PathTable[Any]]) -> None:
+        graph = Graph[int]({2: {3: 1}, 3: {4: 1}, 4: {6: 1}, 5: {2: 1, 6: 3}, 6: {}})
+        table = paths_fn(graph)
+
+        assert table.path(5, 4) == [5, 2, 3, 4]
+        assert table.path(5, 6) == [5, 6]
+        assert table.path(6, 2) == []
+        assert_paths_match_distances(graph, table)
+
+        with pytest.raises(KeyError):
+            table.path(1, 2)
+
+    @staticmethod
+    def test_negative_cycle() -> None:
+        table = PathTable(
+            [0, 1], {0: {0: 0, 1: -1}, 1: {0: -1, 1: 0}}, array("i", [-1, 0, 1, -1])
+        )
+        assert table.path(0, 1) == [0, 1]
+
+        table.predecessors[1] = 1
+        with pytest.raises(ValueError, match="Negative weight cycle"):
+            table.path(0, 1)
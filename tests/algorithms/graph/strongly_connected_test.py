@@ -0,0 +1,44 @@
+from cs.algorithms import (
+    condensation,
+    strongly_connected_components,
+    topological_levels,
+    topological_sort,
+)
+from cs.structures import Graph
+
+
+def test_strongly_connected_components() -> None:
+    graph = Graph[int](
+        {0: [1], 1: [2], 2: [0, 3], 3: [4], 4: [5], 5: [3], 6: [5, 7], 7: [6], 8: []}
+    )
+    assert strongly_connected_components(graph) == [{3, 4, 5}, {0, 1, 2}, {6, 7}, {8}]
+
+    self_loop = Graph[str]({"a": ["a"], "b": []})
+    assert strongly_connected_components(self_loop) == [{"a"}, {"b"}]
+    assert strongly_connected_components(Graph[str]()) == []
+
+    n = 100_000
+    cycle = Graph[int]({i: [(i + 1) % n] for i in range(n)})
+    assert strongly_connected_components(cycle) == [set(range(n))]
+
+    path = Graph[int]({i: [i + 1] for i in range(n)} | {n: []})
+    assert strongly_connected_components(path) == [{i} for i in range(n, -1, -1)]
+
+
+def test_condensation() -> None:
+    graph = Graph[str](
+        {
+            "app": ["lib", "util"],
+            "lib": ["util", "codegen"],
+            "codegen": ["lib"],
+            "util": [],
+        }
+    )
+    dag, component_of = condensation(graph)
+
+    assert component_of == {"util": 0, "lib": 1, "codegen": 1, "app": 2}
+    assert list(dag) == [0, 1, 2]
+    assert dag.num_edges == 3
+    assert all(edge.end < edge.start for edge in dag.edges)
+    assert topological_sort(dag) == [0, 1, 2]
+    assert topological_levels(dag) == [[0], [1], [2]]
@@ -1,6 +1,15 @@
+import asyncio
+import threading
+import time
+
 import pytest
 
-from cs.algorithms import topological_sort
+from cs.algorithms import (
+    run_topological,
+    run_topological_async,
+    topological_levels,
+    topological_sort,
+)
 from cs.structures import Graph
 
 
@@ -25,6 +34,10 @@ def test_topological_sort() -> None:
     graph2 = Graph({1: [3], 3: [5, 6], 5: [4], 4: [7], 7: [], 6: []})
     assert topological_sort(graph2) == [7, 4, 5, 6, 3, 1]
 
+    n = 100_000
+    graph2 = Graph[int]({i: [i + 1] for i in range(n)} | {n: []})
+    assert topological_sort(graph2) == list(range(n, -1, -1))
+
 
 def test_topological_sort_cycle_detection() -> None:
     graph = Graph[str]({"a": ["a"]})
@@ -34,3 +47,79 @@ def test_topological_sort_cycle_detection() -> None:
     graph = Graph({"a": ["b"], "b": ["c"], "c": ["a"]})
     with pytest.raises(ValueError, match="Cycle detected in node c"):
         _ = topological_sort(graph)
+
+
+def test_topological_levels() -> None:
+    graph = Graph[str]({"a": ["c", "b"], "b": ["d", "e"], "c": [], "d": [], "e": []})
+    assert topological_levels(graph) == [["c", "d", "e"], ["b"], ["a"]]
+    assert topological_levels(Graph[str]()) == []
+
+    graph = Graph({"a": ["b"], "b": ["c"], "c": ["b"], "d": ["a"]})
+    with pytest.raises(ValueError, match="Cycle detected in node b"):
+        _ = topological_levels(graph)
+
+
+def test_run_topological() -> None:
+    graph = Graph[str]({"a": ["c", "b"], "b": ["d", "e"], "c": [], "d": [], "e": []})
+    finished: list[str] = []
+    lock = threading.Lock()
+
+    def build(v: str) -> str:
+        time.sleep(0.05 if v == "d" else 0.001)
+        with lock:
+            assert all(u in finished for u in graph[v])
+            finished.append(v)
+        return v.upper()
+
+    schedule = run_topological(graph, build, max_workers=3)
+    assert schedule.results == {v: v.upper() for v in graph}
+    assert schedule.parallelism == [3, 1, 1]
+    assert schedule.critical_path == ["d", "b", "a"]
+    assert schedule.critical_path_length >= 0.05
+    # "b" starts as soon as "d" and "e" finish, without waiting for "c".
+    assert finished.index("c") < finished.index("b")
+
+    schedule = run_topological(graph, str.upper, max_workers=2, processes=True)
+    assert schedule.results == {v: v.upper() for v in graph}
+
+
+def test_run_topological_errors() -> None:
+    graph = Graph[int]({1: [2], 2: [3], 3: []})
+    calls = []
+
+    def fail(v: int) -> None:
+        calls.append(v)
+        if v == 2:
+            raise RuntimeError("Task failed.")
+
+    with pytest.raises(RuntimeError, match="Task failed"):
+        _ = run_topological(graph, fail)
+    assert calls == [3, 2]
+
+    async def fail_async(v: int) -> None:
+        fail(v)
+
+    calls.clear()
+    with pytest.raises(RuntimeError, match="Task failed"):
+        _ = asyncio.run(run_topological_async(graph, fail_async))
+    assert calls == [3, 2]
+
+
+def test_run_topological_async() -> None:
+    graph = Graph[int]({i: list(range(i)) for i in range(4)} | {4: [], 5: [4]})
+    running = 0
+    max_running = 0
+
+    async def fetch(v: int) -> int:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return v * v
+
+    schedule = asyncio.run(run_topological_async(graph, fetch, max_concurrency=1))
+    assert schedule.results == {v: v * v for v in graph}
+    assert max_running == 1
+    assert schedule.parallelism == [2, 2, 1, 1]
+    assert schedule.critical_path == [0, 1, 2, 3]
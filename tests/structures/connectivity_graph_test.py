@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from cs.algorithms import connected_components
+from cs.structures import ConnectivityGraph, Edge
+
+
+class TestConnectivityGraph:
+    @staticmethod
+    def test_init() -> None:
+        graph = ConnectivityGraph[int]({0: [1], 1: [2], 3: [4], 5: []})
+
+        assert not graph.is_directed
+        assert graph.num_components == 3
+        assert graph.is_connected(0, 2)
+        assert not graph.is_connected(2, 3)
+        assert graph.component(0) == graph.component(2)
+        assert sorted(map(sorted, graph.components())) == [[0, 1, 2], [3, 4], [5]]
+        with pytest.raises(KeyError):
+            graph.is_connected(0, 6)
+
+    @staticmethod
+    def test_add() -> None:
+        graph = ConnectivityGraph[str](is_directed=True)
+        graph.add_nodes_from("abcd")
+        assert graph.num_components == 4
+
+        graph.add_edge("b", "a")
+        graph.add_edges_from([("c", "b"), Edge("d", "e")], validate=False)
+        assert graph.is_connected("a", "c")
+        assert graph.is_connected("e", "d")
+        assert not graph.is_connected("a", "e")
+        assert graph.num_components == 2
+
+    @staticmethod
+    def test_remove() -> None:
+        graph = ConnectivityGraph[int]({0: [1], 1: [2], 2: [3]})
+        graph.remove_edge(1, 2)
+        assert not graph.is_connected(0, 3)
+        assert graph.num_components == 2
+
+        graph.add_edge(3, 0)
+        graph.remove_node(0)
+        assert graph.components() == [{1}, {2, 3}]
+
+    @staticmethod
+    def test_random_edges() -> None:
+        rng = random.Random(0)
+        graph = ConnectivityGraph[int]()
+        graph.add_nodes_from(range(100))
+        for _ in range(80):
+            graph.add_edge(rng.randrange(100), rng.randrange(100))
+        expected = connected_components(graph)
+        assert graph.num_components == len(expected)
+        for component in expected:
+            assert all(graph.is_connected(min(component), v) for v in component)
@@ -0,0 +1,297 @@
+from __future__ import annotations
+
+import pickle
+from typing import TYPE_CHECKING, Any, Never
+
+import pytest
+
+from cs.algorithms import (
+    bellman_ford_shortest_paths,
+    breadth_first_search,
+    connected_components,
+    depth_first_search,
+    dijkstra_shortest_paths,
+    kruskals_mst,
+    prims_mst,
+    topological_sort,
+)
+from cs.structures import CSRGraph, Edge, Graph, csr_graph
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class TestCSRGraph:
+    @staticmethod
+    def test_from_graph() -> None:
+        graph = Graph[str]({"a": {"b": 2, "c": 5}, "b": {"c": 1}, "c": {}, "d": {}})
+        csr = CSRGraph(graph)
+
+        assert len(csr) == 4
+        assert list(csr) == ["a", "b", "c", "d"]
+        assert list(csr.nodes) == list(graph.nodes)
+        assert csr.num_edges == 3
+        assert csr.edges == graph.edges
+        assert csr["a"] == graph["a"]
+        assert list(csr.adj("a")) == ["b", "c"]
+        assert csr.has_edge("a", "c")
+        assert not csr.has_edge("c", "a")
+        assert not csr.has_edge("a", "z")
+        assert csr.out_degree("a") == 2
+        assert csr.in_degree("c") == 2
+        assert list(csr.predecessors("c")) == ["a", "b"]
+        assert csr.degree("b") == 2
+        assert csr.to_matrix() == graph.to_matrix()
+        assert Graph.from_graph(csr) == graph
+        assert CSRGraph(Graph.from_graph(csr)) == csr
+
+        with pytest.raises(KeyError):
+            _ = csr["z"]
+
+    @staticmethod
+    def test_neighbor_view(monkeypatch: pytest.MonkeyPatch) -> None:
+        graph = Graph[str]({"a": {"b": 2, "c": 5}, "b": {"c": 1}, "c": {}, "d": {}})
+        csr = CSRGraph(graph)
+        row = csr["a"]
+
+        assert len(row) == 2
+        assert "c" in row
+        assert "d" not in row
+        assert "z" not in row
+        assert row["c"] == Edge("a", "c", 5)
+        assert dict(row.items()) == graph["a"]
+        assert list(row.values()) == [Edge("a", "b", 2), Edge("a", "c", 5)]
+        assert repr(row) == repr(dict(row.items()))
+        with pytest.raises(KeyError):
+            _ = row["d"]
+
+        # Iterating over the neighbors reads the arrays without building any Edges.
+        def edge(*args: Any) -> Never:
+            raise AssertionError(f"Built Edge{args}.")
+
+        monkeypatch.setattr(csr_graph, "Edge", edge)
+        assert list(row) == ["b", "c"]
+        assert [v for u in csr for v in csr[u]] == ["b", "c", "c"]
+
+    @staticmethod
+    def test_undirected() -> None:
+        graph = Graph[int]({0: [1, 3], 1: [2], 2: [3], 3: []}, is_directed=False)
+        csr = CSRGraph(graph)
+
+        assert not csr.is_directed
+        assert csr.num_edges == 8
+        assert csr.degree(3) == 2
+        assert list(csr.predecessors(3)) == [0, 2]
+        assert csr.is_bipartite()
+        assert csr.has_integer_weights()
+        assert not csr.has_integer_weights(0)
+        assert Graph.from_graph(csr) == Graph.from_graph(
+            CSRGraph.from_edgelist(
+                [Edge(0, 1), Edge(0, 3), Edge(1, 2), Edge(2, 3)], is_directed=False
+            )
+        )
+
+    @staticmethod
+    def test_reverse_csr(tmp_path: Path) -> None:
+        graph = Graph[int](
+            {0: [1, 2], 1: [1, 2], 2: [0], 3: [2, 0], 4: []}, index_predecessors=True
+        )
+        csr = CSRGraph(graph)
+        csr.save_snapshot(tmp_path / "graph.csr")
+
+        for g in (csr, CSRGraph.open_snapshot(tmp_path / "graph.csr")):
+            assert g.has_predecessor_index
+            for v in graph:
+                assert set(g.predecessors(v)) == set(graph.predecessors(v))
+                assert g.in_degree(v) == graph.in_degree(v)
+        assert list(csr.predecessors(2)) == [0, 1, 3]
+        assert csr._reverse() is csr._reverse()  # noqa: SLF001
+
+    @staticmethod
+    def test_bipartite(monkeypatch: pytest.MonkeyPatch) -> None:
+        graphs: list[Graph[Any]] = [
+            Graph[int]({0: [1, 3], 1: [0, 2], 2: [1, 3], 3: [0, 2], 4: []}),
+            Graph[str]({"a": ["x"], "b": ["x", "y"], "c": ["y"], "x": [], "y": []}),
+            Graph[str](
+                {"a": ["x"], "b": ["x", "y"], "c": ["y", "a"], "x": [], "y": []}
+            ),
+            Graph[int]({0: [1], 1: [2], 2: [3], 3: [4], 4: [0], 5: [5]}),
+            Graph[int]({0: [1], 1: [2], 2: [0]}, is_directed=False),
+            Graph[int]({5: [5]}),
+        ]
+        expected = [
+            (graph.is_bipartite(), graph.is_bipartite(witness=True)) for graph in graphs
+        ]
+        csrs = [CSRGraph(graph) for graph in graphs]
+
+        def is_bipartite(graph: Graph[Any], *, witness: bool = False) -> Never:
+            raise AssertionError(f"Converted {graph!r} (witness={witness}).")
+
+        monkeypatch.setattr(Graph, "is_bipartite", is_bipartite)
+        for csr, (result, witness) in zip(csrs, expected, strict=True):
+            assert csr.is_bipartite() == result
+            assert csr.is_bipartite(witness=True) == witness
+
+    @staticmethod
+    def test_from_edgelist() -> None:
+        csr = CSRGraph.from_edgelist(
+            [Edge(2, 1, 4), Edge(0, 2, 1), Edge(2, 1, 3), Edge(1, 1), Edge(2, 0, 7)]
+        )
+
+        assert list(csr) == [2, 1, 0]
+        assert tuple(csr.edges) == (
+            Edge(2, 1, 3),
+            Edge(2, 0, 7),
+            Edge(1, 1),
+            Edge(0, 2, 1),
+        )
+        assert csr.in_degree(1) == 1
+        assert csr.degree(1) == 2
+        assert csr == CSRGraph(
+            Graph.from_edgelist(
+                [Edge(2, 1, 4), Edge(0, 2, 1), Edge(2, 1, 3), Edge(1, 1), Edge(2, 0, 7)]
+            )
+        )
+
+    @staticmethod
+    def test_from_file(tmp_path: Path) -> None:
+        path = tmp_path / "graph.txt"
+        path.write_text("# start end weight\n0 1 2.5\n1 2 1\n\n2 0\n")
+        csr = CSRGraph.from_file(path)
+
+        assert tuple(csr.edges) == (Edge(0, 1, 2.5), Edge(1, 2, 1), Edge(2, 0, 1))
+        assert CSRGraph.from_file(path, node_fn=str).nodes == {"0", "1", "2"}
+
+    @staticmethod
+    def test_snapshot(tmp_path: Path) -> None:
+        path = tmp_path / "graph.csr"
+        graphs: tuple[Graph[Any], ...] = (
+            Graph[int]({0: {1: 2.5, 2: 1}, 1: {2: 3}, 2: {0: 1}, 3: {}}),
+            Graph[int]({7: {3: 2}, 3: {7: 1, 9: 4}, 9: {}}),
+            Graph[str]({"a": ["b"], "b": ["c", "é"], "c": [], "é": []}),
+            Graph[int]({1: [2, 3], 2: [3], 3: []}, is_directed=False),
+            Graph[int](),
+        )
+        for graph in graphs:
+            csr = CSRGraph(graph)
+            csr.save_snapshot(path)
+            mapped = CSRGraph.open_snapshot(path)
+
+            assert mapped == csr
+            assert mapped.is_directed == graph.is_directed
+            assert mapped.nodes == graph.nodes
+            assert list(mapped) == list(graph)
+            assert mapped.edges == graph.edges
+            for u in graph:
+                assert mapped[u] == graph[u]
+                assert mapped.adj(u) == graph.adj(u)
+                for v in graph:
+                    assert mapped.has_edge(u, v) == graph.has_edge(u, v)
+            assert Graph.from_graph(mapped, is_directed=graph.is_directed) == graph
+            assert pickle.loads(pickle.dumps(mapped)) == mapped  # noqa: S301
+
+        mapped = CSRGraph.open_snapshot(path)
+        assert 0 not in mapped
+        assert "0" not in mapped
+        with pytest.raises(KeyError):
+            _ = mapped[0]
+
+    @staticmethod
+    def test_snapshot_errors(tmp_path: Path) -> None:
+        path = tmp_path / "graph.csr"
+        with pytest.raises(TypeError):
+            CSRGraph[Any]({0: ["a"], "a": []}).save_snapshot(path)
+
+        path.write_bytes(b"not a snapshot")
+        with pytest.raises(ValueError, match="not a graph snapshot"):
+            CSRGraph.open_snapshot(path)
+
+        CSRGraph[int]({0: [1], 1: []}).save_snapshot(path)
+        path.write_bytes(path.read_bytes()[:-8])
+        with pytest.raises(ValueError, match="truncated"):
+            CSRGraph.open_snapshot(path)
+
+    @staticmethod
+    def test_random_edge() -> None:
+        csr = CSRGraph[int]({0: [1, 2], 1: [], 2: [0, 1, 2]})
+        assert {csr.random_edge() for _ in range(200)} == set(csr.edges)
+
+        with pytest.raises(IndexError):
+            _ = CSRGraph[int]({0: []}).random_edge()
+
+    @staticmethod
+    def test_read_only() -> None:
+        csr = CSRGraph[int]({0: [1], 1: []})
+        with pytest.raises(TypeError):
+            csr.add_node(2)
+        with pytest.raises(TypeError):
+            csr.add_nodes_from([2, 3])
+        with pytest.raises(TypeError):
+            csr.add_edge(1, 0)
+        with pytest.raises(TypeError):
+            csr.add_edges_from([(1, 0)])
+        with pytest.raises(TypeError):
+            csr.add_edges_from([Edge(2, 3)], validate=False)
+        with pytest.raises(TypeError):
+            csr.remove_node(0)
+        with pytest.raises(TypeError):
+            csr.remove_edge(0, 1)
+
+        csr[0][1].weight = 5
+        assert csr[0][1].weight == 1
+
+    @staticmethod
+    def test_repr() -> None:
+        csr = CSRGraph[int]({0: {1: 2}, 1: {}})
+        assert repr(csr) == "CSRGraph(num_nodes=2, num_edges=1, is_directed=True)"
+        assert str(csr) == "{0: {1: Edge(start=0, end=1, weight=2.0)}, 1: {}}"
+
+
+class TestCSRGraphAlgorithms:
+    @staticmethod
+    def test_search() -> None:
+        graph = Graph[str](
+            {
+                "A": {"B": 2, "C": 5},
+                "B": {"A": 2, "D": 3, "E": 1, "F": 1},
+                "C": {"A": 5, "F": 3},
+                "D": {"B": 3},
+                "E": {"B": 4, "F": 3},
+                "F": {"C": 3, "E": 3},
+            }
+        )
+        csr = CSRGraph(graph)
+
+        assert breadth_first_search(csr, "A", "F") == ["A", "B", "F"]
+        assert depth_first_search(csr, "A", "F") == depth_first_search(graph, "A", "F")
+        for u in graph:
+            assert dijkstra_shortest_paths(csr, u) == dijkstra_shortest_paths(graph, u)
+            assert bellman_ford_shortest_paths(csr, u) == bellman_ford_shortest_paths(
+                graph, u
+            )
+
+    @staticmethod
+    def test_mst() -> None:
+        graph = Graph.from_matrix(
+            [
+                [0, 2, 0, 6, 0],
+                [2, 0, 3, 8, 5],
+                [0, 3, 0, 0, 7],
+                [6, 8, 0, 0, 9],
+                [0, 5, 7, 9, 0],
+            ]
+        )
+        csr = CSRGraph(graph)
+
+        assert prims_mst(csr) == prims_mst(graph)
+        assert sorted(kruskals_mst(csr).edges) == sorted(kruskals_mst(graph).edges)
+
+    @staticmethod
+    def test_structure() -> None:
+        graph = Graph[str](
+            {"a": ["c", "b"], "b": ["d", "e"], "c": [], "d": [], "e": [], "f": []}
+        )
+        csr = CSRGraph(graph)
+
+        assert topological_sort(csr) == topological_sort(graph)
+        assert connected_components(csr) == connected_components(graph)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from cs.structures import DisjointSet
+from cs.structures.disjoint_set import UnionMode
 from tests.conftest import assert_a_faster_than_b
 
 
@@ -17,6 +18,16 @@ class TestDisjointSet:
         assert 1 in dset
         dset.make_set(1)
 
+    @staticmethod
+    def test_make_sets() -> None:
+        dset = DisjointSet[int]()
+        dset.make_set(3)
+        dset.make_sets([1, 2, 3, 4, 2])
+
+        assert list(dset) == [3, 1, 2, 4]
+        assert len(dset) == 4
+        assert dset.find_set(4) == 4
+
     @staticmethod
     def test_find_set() -> None:
         dset = DisjointSet[int]()
@@ -47,6 +58,17 @@ class TestDisjointSet:
 
         assert_a_faster_than_b(dset.itersets, dset.naive_itersets)
 
+    @staticmethod
+    def test_itersets_deep_trees() -> None:
+        """Nodes whose path passes a visited node are grouped under its root."""
+        dset = DisjointSet[int](mode=UnionMode.SIZE)
+        dset.make_sets(range(8))
+        for a, b in ((0, 1), (2, 3), (0, 2), (4, 5), (6, 7), (4, 6), (0, 4)):
+            dset.union(a, b)
+        dset.make_set(8)
+
+        assert dset.itersets() == dset.naive_itersets() == [set(range(8)), {8}]
+
     @staticmethod
     def test_print_disjoint_set() -> None:
         dset = DisjointSet[int]()
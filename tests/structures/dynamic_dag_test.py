@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from cs.algorithms import topological_sort
+from cs.structures import DynamicDAG, Edge, Graph
+
+
+def assert_topological(dag: DynamicDAG[int]) -> None:
+    assert sorted(dag.order) == sorted(dag)
+    for i, v in enumerate(dag.order):
+        assert dag.rank(v) == i
+    for edge in dag.edges:
+        assert dag.rank(edge.end) < dag.rank(edge.start)
+
+
+class TestDynamicDAG:
+    @staticmethod
+    def test_init() -> None:
+        dag = DynamicDAG[str]({"a": ["b", "c"], "b": ["d"], "c": ["d"], "d": []})
+
+        assert dag.order[0] == "d"
+        assert dag.order[-1] == "a"
+        assert dag.rank("d") == 0
+        assert dag.num_edges == 4
+
+        with pytest.raises(ValueError, match="Graph contains a cycle"):
+            DynamicDAG[str]({"a": ["b"], "b": ["c"], "c": ["a"]})
+        with pytest.raises(KeyError):
+            dag.rank("e")
+
+    @staticmethod
+    def test_add_edge() -> None:
+        dag = DynamicDAG[int]()
+        dag.add_nodes_from(range(6))
+        assert list(dag.order) == [0, 1, 2, 3, 4, 5]
+
+        dag.add_edge(1, 4)
+        dag.add_edge(0, 1)
+        dag.add_edge(4, 5)
+        assert dag.rank(5) < dag.rank(4) < dag.rank(1) < dag.rank(0)
+        # Nodes outside of the affected region keep their ranks.
+        assert dag.rank(2) == 2
+        assert dag.rank(3) == 3
+
+        dag.add_edge(4, 5, weight=3)
+        assert dag[4][5].weight == 3
+
+    @staticmethod
+    def test_rejects_cycles() -> None:
+        dag = DynamicDAG[int]({0: [1], 1: [2], 2: [3], 3: []})
+        order = list(dag.order)
+
+        with pytest.raises(ValueError, match="Edge 3 -> 0 would create a cycle"):
+            dag.add_edge(3, 0)
+        with pytest.raises(ValueError, match="would create a cycle"):
+            dag.add_edge(2, 2)
+        assert not dag.has_edge(3, 0)
+        assert list(dag.order) == order
+
+        with pytest.raises(ValueError, match="would create a cycle"):
+            dag.add_edges_from([(3, 4), Edge(4, 1)], validate=False)
+        assert dag.has_edge(3, 4)
+        assert not dag.has_edge(4, 1)
+        assert_topological(dag)
+
+    @staticmethod
+    def test_remove() -> None:
+        dag = DynamicDAG[int]({0: [1], 1: [2], 2: [], 3: [0]})
+        dag.remove_node(1)
+        assert 1 not in dag.order
+        assert_topological(dag)
+
+        dag.remove_edge(3, 0)
+        dag.add_edge(0, 3)
+        assert_topological(dag)
+
+    @staticmethod
+    def test_random_insertions() -> None:
+        rng = random.Random(0)
+        dag = DynamicDAG[int]()
+        dag.add_nodes_from(range(200))
+        # Edges that agree with a hidden order never create a cycle.
+        hidden = list(range(200))
+        rng.shuffle(hidden)
+        for _ in range(1000):
+            u, v = sorted(rng.sample(range(200), 2))
+            dag.add_edge(hidden[v], hidden[u])
+        assert_topological(dag)
+
+        for _ in range(100):
+            u, v = rng.sample(range(200), 2)
+            try:
+                dag.add_edge(u, v)
+            except ValueError:
+                assert dag.rank(u) < dag.rank(v)
+        assert_topological(dag)
+
+    @staticmethod
+    def test_matches_topological_sort() -> None:
+        # Every node has an edge to the next one, so there is only one valid order.
+        adj_list = {1: [2, 3], 2: [3, 4, 6], 3: [4, 6], 4: [5, 6], 5: [6], 6: []}
+        dag = DynamicDAG[int](adj_list)
+        assert list(dag.order) == topological_sort(Graph[int](adj_list))
+
+        dag = DynamicDAG[int]()
+        dag.add_nodes_from(range(6, 0, -1))
+        for u, neighbors in adj_list.items():
+            for v in neighbors:
+                dag.add_edge(u, v)
+        assert list(dag.order) == topological_sort(Graph[int](adj_list))
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from cs.structures import CSRGraph, Edge, Graph, GraphFormat, load_graph, save_graph
+from cs.structures.graph_io import read_dimacs, read_edgelist, read_metis
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class TestGraphIO:
+    @staticmethod
+    def test_edgelist(tmp_path: Path) -> None:
+        path = tmp_path / "graph.txt"
+        path.write_text("# start end weight\na b 2.5\nb c 3\n\nc a\n")
+
+        assert list(read_edgelist(path, node_fn=str)) == [
+            Edge("a", "b", 2.5),
+            Edge("b", "c", 3),
+            Edge("c", "a"),
+        ]
+        graph = load_graph(path, node_fn=str)
+        assert graph == Graph({"a": {"b": 2.5}, "b": {"c": 3}, "c": {"a": 1}})
+
+        save_graph(graph, tmp_path / "copy.txt")
+        assert (tmp_path / "copy.txt").read_text() == "a b 2.5\nb c 3\nc a 1\n"
+        assert load_graph(tmp_path / "copy.txt", node_fn=str) == graph
+
+        # SNAP and KONECT edge lists can have extra columns, such as timestamps.
+        path.write_text("% sym\n1 2 1 1213056000\n2 3 4 1213056001 extra\n")
+        assert list(read_edgelist(path)) == [Edge(1, 2, 1), Edge(2, 3, 4)]
+
+        path.write_text("1 2\n3\n")
+        with pytest.raises(ValueError, match="Line 2 of"):
+            _ = list(read_edgelist(path))
+
+    @staticmethod
+    def test_dimacs(tmp_path: Path) -> None:
+        path = tmp_path / "graph.gr"
+        path.write_text(
+            "c 9th DIMACS Implementation Challenge\n"
+            "p sp 4 3\n"
+            "c arcs\n"
+            "a 1 2 7\n"
+            "a 2 3 1\n"
+            "a 3 1 2\n"
+        )
+
+        assert list(read_dimacs(path)) == [Edge(1, 2, 7), Edge(2, 3, 1), Edge(3, 1, 2)]
+        graph = load_graph(path, GraphFormat.DIMACS)
+        assert graph == Graph({1: {2: 7}, 2: {3: 1}, 3: {1: 2}, 4: {}})
+        csr = load_graph(path, GraphFormat.DIMACS, compact=True)
+        assert isinstance(csr, CSRGraph)
+        assert Graph.from_graph(csr) == graph
+
+        save_graph(graph, tmp_path / "copy.gr", GraphFormat.DIMACS)
+        assert load_graph(tmp_path / "copy.gr", GraphFormat.DIMACS) == graph
+
+    @staticmethod
+    def test_metis(tmp_path: Path) -> None:
+        path = tmp_path / "graph.metis"
+        path.write_text("% comment\n4 3\n2 3\n1 3\n1 2\n\n")
+
+        assert list(read_metis(path)) == [Edge(1, 2), Edge(1, 3), Edge(2, 3)]
+        graph = load_graph(path, GraphFormat.METIS)
+        assert not graph.is_directed
+        assert graph == Graph({1: [2, 3], 2: [3], 3: [], 4: []}, is_directed=False)
+
+        path.write_text("3 2 011 2\n5 1 2 4\n0 0 1 4 3 1\n9 9 2 1\n")
+        assert list(read_metis(path)) == [Edge(1, 2, 4), Edge(2, 3, 1)]
+
+    @staticmethod
+    def test_save_metis(tmp_path: Path) -> None:
+        path = tmp_path / "graph.metis"
+        graph = Graph[str]({"a": {"b": 2}, "b": {"c": 1}, "c": {}}, is_directed=False)
+        save_graph(graph, path, GraphFormat.METIS)
+
+        assert path.read_text() == "3 2 001\n2 2\n1 2 3 1\n2 1\n"
+        assert load_graph(path, GraphFormat.METIS, compact=True).num_edges == 4
+        with pytest.raises(ValueError, match="undirected"):
+            save_graph(Graph[int]({0: [1]}), path, GraphFormat.METIS)
+
+    @staticmethod
+    def test_snapshot(tmp_path: Path) -> None:
+        path = tmp_path / "graph.csr"
+        graph = Graph[int]({1: {2: 4}, 2: {3: 1.5}, 3: {}})
+        save_graph(graph, path, GraphFormat.SNAPSHOT)
+        mapped = load_graph(path, GraphFormat.SNAPSHOT)
+
+        assert isinstance(mapped, CSRGraph)
+        assert mapped == CSRGraph(graph)
+        assert Graph.from_graph(mapped) == graph
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import numpy as np
 import pytest
 
-from cs.structures import Edge, Graph, Node
+from cs.structures import COOMatrix, CSRMatrix, Edge, Graph, Node
 
 
 class TestGraph:
@@ -100,6 +101,35 @@ class TestGraph:
         assert len(graph) == 2
         assert len(graph.edges) == 3
 
+    @staticmethod
+    def test_predecessor_index() -> None:
+        graph = Graph[int](index_predecessors=True)
+        unindexed = Graph[int]()
+        for g in (graph, unindexed):
+            for i in range(5):
+                g.add_node(i)
+            g.add_edge(0, 1)
+            g.add_edge(2, 2)
+            for i in range(2, 5):
+                for j in range(1, 4):
+                    g.add_edge(i, j)
+            g.remove_edge(4, 1)
+
+        for i in range(5):
+            assert list(graph.predecessors(i)) == list(unindexed.predecessors(i))
+            assert graph.in_degree(i) == unindexed.in_degree(i)
+            assert graph.degree(i) == unindexed.degree(i)
+        assert list(graph.predecessors(1)) == [0, 2, 3]
+        assert graph.in_degree(2) == 2
+
+        for g in (graph, unindexed):
+            g.remove_node(2)
+            g.remove_node(1)
+        assert graph == unindexed
+        assert list(graph.predecessors(3)) == [3, 4]
+        assert graph.in_degree(3) == 1
+        assert graph.degree(4) == 1
+
     @staticmethod
     def test_str_adj_list() -> None:
         vertices = ["hi", "hello", "what up", "bye"]
@@ -115,7 +145,7 @@ class TestGraph:
         assert len(graph) == 4
         assert len(graph.nodes) == 4
         assert len(graph.edges) == 4
-        assert graph.edges == (
+        assert tuple(graph.edges) == (
             Edge("hi", "hello", 3),
             Edge("bye", "hello", 2),
             Edge("bye", "what up", 4),
@@ -127,10 +157,178 @@ class TestGraph:
         for i, node in enumerate(graph):
             assert node == vertices[i]
 
+    @staticmethod
+    def test_bulk_construction() -> None:
+        graph = Graph[int](index_predecessors=True)
+        graph.add_nodes_from([3, 0, 1, 3])
+        graph.add_edges_from([(0, 1), (1, 3, 5), Edge(3, 0, 2, color="red"), (0, 1, 4)])
+        assert list(graph) == [3, 0, 1]
+        assert graph.num_edges == 3
+        assert graph[0][1] == Edge(0, 1, 4)
+        assert graph[3][0].kwargs == {"color": "red"}
+        assert list(graph.predecessors(0)) == [3]
+
+        with pytest.raises(KeyError):
+            graph.add_edges_from([(1, 2)])
+        graph.add_edges_from([(1, 2), (4, 4)], validate=False)
+        assert list(graph) == [3, 0, 1, 2, 4]
+        assert graph.num_edges == 5
+        assert graph.in_degree(2) == 1
+
+        undirected = Graph[int](is_directed=False)
+        undirected.add_edges_from([(0, 1, 2), (1, 1)], validate=False)
+        _ = undirected.random_edge()
+        undirected.add_edges_from([(1, 2)], validate=False)
+        assert undirected.num_edges == 5
+        assert undirected == Graph({0: {1: 2}, 1: {1: 1, 2: 1}}, is_directed=False)
+
+    @staticmethod
+    def test_edges_view() -> None:
+        graph = Graph[int](is_directed=False)
+        for i in range(4):
+            graph.add_node(i)
+        edges = graph.edges
+        assert not edges
+
+        graph.add_edge(0, 1, 5)
+        graph.add_edge(1, 2)
+        graph.add_edge(2, 2)
+        graph.add_edge(0, 1, 3)
+        assert len(edges) == graph.num_edges == 5
+        assert Edge(1, 0, 3) in edges
+        assert Edge(1, 0, 5) not in edges
+        assert Edge(3, 0) not in edges
+        assert set(edges) == {
+            Edge(0, 1, 3),
+            Edge(1, 0, 3),
+            Edge(1, 2),
+            Edge(2, 1),
+            Edge(2, 2),
+        }
+
+        graph.remove_edge(2, 2)
+        graph.remove_node(0)
+        assert len(edges) == 2
+        assert list(edges) == [Edge(1, 2), Edge(2, 1)]
+
+    @staticmethod
+    def test_random_edge() -> None:
+        graph = Graph[int]()
+        for i in range(5):
+            graph.add_node(i)
+        with pytest.raises(IndexError):
+            _ = graph.random_edge()
+
+        for i in range(5):
+            for j in range(5):
+                graph.add_edge(i, j)
+        assert {graph.random_edge() for _ in range(500)} == set(graph.edges)
+
+        graph.remove_node(3)
+        graph.remove_edge(1, 2)
+        graph.add_edge(4, 0, 7)
+        graph.add_edge(4, 4, 2)
+        assert graph.num_edges == 15
+        assert {graph.random_edge() for _ in range(500)} == set(graph.edges)
+
+    @staticmethod
+    def test_edge_kwargs() -> None:
+        edge = Edge(0, 1, 2)
+        assert not hasattr(edge, "__dict__")
+        assert edge.kwargs == {}
+        assert len(edge) == 3
+
+        edge["weight"] = 5
+        edge["flow"] = 1
+        assert edge.weight == 5
+        assert edge.kwargs == {"flow": 1}
+        assert dict(edge) == {"start": 0, "end": 1, "weight": 5, "flow": 1}
+        assert edge == Edge(**edge)
+
+    @staticmethod
+    def test_shared_edges() -> None:
+        graph = Graph[int](is_directed=False, shared_edges=True)
+        for i in range(3):
+            graph.add_node(i)
+        graph.add_edge(0, 1, 4)
+        graph.add_edge(2, 1, 3, color="red")
+
+        assert graph[1][0] is graph[0][1]
+        assert graph[1][2] is graph[2][1]
+        assert graph.num_edges == 4
+        graph[1][0].weight = 7
+        assert graph[0][1].weight == 7
+        assert Graph.from_graph(graph, is_directed=False) == Graph(
+            {0: {1: 7}, 1: {0: 7, 2: {"weight": 3, "color": "red"}}, 2: {}},
+            is_directed=False,
+        )
+
+    @staticmethod
+    def test_weights_only() -> None:
+        adj_list = {0: {1: 4, 2: 0.5}, 1: {2: 3}, 2: {}}
+        graph = Graph[int](adj_list, is_directed=False, weights_only=True)
+        expected = Graph[int](adj_list, is_directed=False)
+
+        assert graph[0][1] == Edge(0, 1, 4)
+        assert graph[1][0] == Edge(1, 0, 4)
+        assert dict(graph[2].items()) == expected[2]
+        assert list(graph[2].values()) == [Edge(2, 0, 0.5), Edge(2, 1, 3)]
+        assert list(graph.adj(0)) == [1, 2]
+        assert set(graph.edges) == set(expected.edges)
+        assert graph.num_edges == 6
+        assert not graph.has_integer_weights()
+        assert graph.random_edge() in expected.edges
+        assert graph.to_matrix() == expected.to_matrix()
+        assert Graph.from_graph(graph, is_directed=False) == expected
+
+        graph.add_edges_from([(0, 3, 2)], validate=False)
+        graph.remove_edge(0, 2)
+        assert graph[3][0] == Edge(3, 0, 2)
+        assert 2 not in graph[0]
+        assert graph.num_edges == 6
+        with pytest.raises(TypeError):
+            graph.add_edge(0, 1, 4, color="red")
+        with pytest.raises(TypeError):
+            graph.add_edges_from([Edge(0, 1, 4, color="red")])
+
     @staticmethod
     def test_bipartite() -> None:
         graph = Graph[int]({0: [1, 3], 1: [0, 2], 2: [1, 3], 3: [0, 2], 4: []})
         assert graph.is_bipartite()
+        assert graph.is_bipartite(witness=True) == ({0, 2}, {1, 3, 4})
+
+        # Directed edges are treated as undirected.
+        directed = Graph[str](
+            {"a": ["x"], "b": ["x", "y"], "c": ["y"], "x": [], "y": []}
+        )
+        assert directed.is_bipartite(witness=True) == ({"a", "b", "c"}, {"x", "y"})
+        directed.add_edge("c", "a")
+        assert not directed.is_bipartite()
+        assert directed.is_bipartite(witness=True) == ["a", "x", "b", "y", "c"]
+
+        graph = Graph[int]({0: [1], 1: [2], 2: [3], 3: [4], 4: [0], 5: [5]})
+        cycle = graph.is_bipartite(witness=True)
+        assert isinstance(cycle, list)
+        assert sorted(cycle) == [0, 1, 2, 3, 4]
+        assert Graph[int]({5: [5]}).is_bipartite(witness=True) == [5]
+
+        n = 100_000
+        path = Graph[int]({i: [i + 1] for i in range(n)} | {n: []})
+        assert path.is_bipartite()
+        path.add_edge(n, 0)
+        assert path.is_bipartite() == (n % 2 == 1)
+
+    @staticmethod
+    def test_has_integer_weights() -> None:
+        graph = Graph[int]({0: {1: 2, 2: 3.0}, 1: {2: 0}, 2: {}})
+        assert graph.has_integer_weights()
+        assert graph.has_integer_weights(3)
+        assert not graph.has_integer_weights(2)
+
+        graph.add_edge(2, 0, -1)
+        assert not graph.has_integer_weights()
+        graph.add_edge(2, 0, 0.5)
+        assert not graph.has_integer_weights()
 
     @staticmethod
     def test_to_matrix() -> None:
@@ -152,6 +350,66 @@ class TestGraph:
 
         assert new_matrix == [[0, 1, 1, 0], [0, 0, 0, 0], [0, 0, 0, 1], [0, 0, 0, 0]]
 
+    @staticmethod
+    def test_numpy_matrix() -> None:
+        matrix = [[0, 1, 5, 0], [0, 0, 2, 0], [0, 0, 0, 8], [0, 0, 0, 1]]
+        graph = Graph.from_matrix(matrix)
+
+        array = graph.to_array()
+        assert array.dtype == np.float64
+        assert array.tolist() == matrix
+        assert Graph.from_matrix(array) == graph
+        assert Graph.from_matrix(np.array(matrix)) == graph
+
+        csr = graph.to_csr()
+        assert csr.shape == (4, 4)
+        assert csr.data.tolist() == [1, 5, 2, 8, 1]
+        assert csr.indices.tolist() == [1, 2, 2, 3, 3]
+        assert csr.indptr.tolist() == [0, 2, 3, 4, 5]
+        assert Graph.from_matrix(csr) == graph
+
+        coo = graph.to_coo()
+        assert coo.row.tolist() == [0, 0, 1, 2, 3]
+        assert coo.col.tolist() == csr.indices.tolist()
+        assert Graph.from_matrix(coo) == graph
+
+        distances = graph.to_array(zero_is_no_edge=False)
+        assert distances[0, 1] == 1
+        assert distances[1, 0] == Graph.INFINITY
+        assert Graph.from_matrix(distances, zero_is_no_edge=False) == graph
+
+    @staticmethod
+    def test_sparse_matrix() -> None:
+        graph = Graph[str]({"a": {"b": 2}, "b": {"c": 3}, "c": {}}, is_directed=False)
+        coo = graph.to_coo()
+        assert coo.shape == (3, 3)
+        assert sorted(zip(coo.row.tolist(), coo.col.tolist(), strict=True)) == [
+            (0, 1),
+            (1, 0),
+            (1, 2),
+            (2, 1),
+        ]
+
+        undirected = Graph.from_matrix(coo)
+        assert not undirected.is_directed
+        assert undirected == Graph[int](
+            {0: {1: 2}, 1: {2: 3}, 2: {}}, is_directed=False
+        )
+
+        indptr = np.array([0, 1, 2, 2])
+        directed = Graph.from_matrix(
+            CSRMatrix(np.array([2.0, 0.0]), np.array([1, 2]), indptr, (3, 3))
+        )
+        assert directed.is_directed
+        assert directed.nodes == {0, 1, 2}
+        assert tuple(directed.edges) == (Edge(0, 1, 2),)
+
+        empty = Graph.from_matrix(
+            COOMatrix(np.array([]), np.array([], dtype=int), np.array([]), (2, 2))
+        )
+        assert empty.nodes == {0, 1}
+        assert not empty.edges
+
     @staticmethod
     def test_from_graph() -> None:
         graph = Graph[Node[int]]()
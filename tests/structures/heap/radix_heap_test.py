@@ -0,0 +1,93 @@
+import random
+
+import pytest
+
+from cs.structures import FibonacciHeap, RadixHeap
+
+
+class TestRadixHeap:
+    @staticmethod
+    def test_dequeue_sort() -> None:
+        for intended_length in (0, 1, 2, 3, 10, 100):
+            heap = RadixHeap[int]()
+            priorities = [random.randrange(1000) for _ in range(intended_length)]
+            for value, priority in enumerate(priorities):
+                heap.enqueue(value, priority)
+
+            assert len(heap) == intended_length
+            actual = [heap.dequeue() for _ in range(intended_length)]
+
+            assert [priority for _, priority in actual] == sorted(priorities)
+            assert all(priorities[value] == priority for value, priority in actual)
+            assert not heap
+            with pytest.raises(IndexError):
+                _ = heap.dequeue()
+
+    @staticmethod
+    def test_monotone() -> None:
+        """Interleave operations the way Dijkstra's does, checked against a dict."""
+        heap = RadixHeap[int]()
+        expected: dict[int, float] = {0: 0}
+        heap.enqueue(0, 0)
+        for new_value in range(1, 500):
+            if not heap:
+                break
+            assert heap.peek()[1] == min(expected.values())
+            value, priority = heap.dequeue()
+            assert expected.pop(value) == priority
+            expected[new_value] = priority + random.randrange(50)
+            heap.enqueue(new_value, expected[new_value])
+            for v, old_priority in expected.items():
+                if random.random() < 0.3:
+                    expected[v] = random.randint(int(priority), int(old_priority))
+                    heap.decrease_key(v, expected[v])
+        while heap:
+            value, priority = heap.dequeue()
+            assert priority == min(expected.values())
+            assert expected.pop(value) == priority
+        assert not expected
+
+    @staticmethod
+    def test_errors() -> None:
+        heap = RadixHeap[str]()
+        heap.enqueue("a", 5)
+        heap.enqueue("b", 8)
+
+        assert "a" in heap
+        assert heap["b"].priority == 8
+        with pytest.raises(KeyError):
+            heap.enqueue("a", 6)
+        with pytest.raises(ValueError, match="not an integer"):
+            heap.enqueue("c", 6.5)
+        with pytest.raises(ValueError, match="exceeds old"):
+            heap.decrease_key("b", 9)
+        with pytest.raises(KeyError):
+            _ = heap["c"]
+
+        assert heap.dequeue() == ("a", 5)
+        with pytest.raises(ValueError, match="last dequeued"):
+            heap.enqueue("c", 4)
+        with pytest.raises(ValueError, match="last dequeued"):
+            heap.decrease_key("b", 4)
+
+    @staticmethod
+    def test_merge() -> None:
+        heap1 = RadixHeap[int]()
+        heap2 = RadixHeap[int]()
+        heap1.enqueue(1, 1)
+        heap1.enqueue(5, 5)
+        heap2.enqueue(3, 3)
+        heap2.enqueue(4, 4)
+
+        heap1 |= heap2
+
+        assert [heap1.dequeue() for _ in range(len(heap1))] == [
+            (1, 1),
+            (3, 3),
+            (4, 4),
+            (5, 5),
+        ]
+        with pytest.raises(ValueError, match="last dequeued"):
+            heap1.merge(heap2)
+        with pytest.raises(TypeError):
+            heap1.merge(FibonacciHeap[int]())